@@ -0,0 +1,62 @@
+"""Compare PDF size and latency of embedded template fonts against built-in Helvetica
+
+Usage:
+    python -m benchmarks.bench_fonts --iterations 20
+
+For every template: the font file it resolved to, the one-off cost of the
+first render (font registration included), then p50 latency and output size
+with the template font embedded versus the Helvetica baseline.
+"""
+
+import argparse
+import io
+import sys
+import time
+
+from resume_generator import RESUME_TEMPLATES, create_template_pdf, parse_resume, pdf_fonts
+
+from .bench_render import SIZES, percentile
+from .samples import sample_resume
+
+def render_pdf(resume, template_name, embed_fonts):
+    """Render one PDF; returns (milliseconds, size in bytes)"""
+    buffer = io.BytesIO()
+    started = time.perf_counter()
+    create_template_pdf(resume, template_name, output=buffer, embed_fonts=embed_fonts)
+    return (time.perf_counter() - started) * 1000, buffer.tell()
+
+def measure(resume, template_name, embed_fonts, iterations):
+    """p50 latency (ms) and output size of repeated renders"""
+    timings = []
+    for _ in range(iterations):
+        milliseconds, size = render_pdf(resume, template_name, embed_fonts)
+        timings.append(milliseconds)
+    timings.sort()
+    return percentile(timings, 0.50), size
+
+def build_parser():
+    """Command line interface of the font report"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", choices=list(SIZES), default="medium", help="Synthetic resume size")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed renders per case")
+    return parser
+
+def main(argv=None):
+    """Print the font size/latency report; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    resume = parse_resume(sample_resume(SIZES[args.size]))
+    print(f"{'template':<22}{'font file':<28}{'first ms':>9}{'p50 ms':>9}{'base p50':>9}"
+          f"{'KiB':>8}{'base KiB':>9}{'extra':>8}")
+    for template_name, config in RESUME_TEMPLATES.items():
+        first_ms, _ = render_pdf(resume, template_name, embed_fonts=True)
+        fonts = pdf_fonts(config["font_style"])
+        font_file = fonts.files[0].rsplit("/", 1)[-1] if fonts.files else "(Helvetica fallback)"
+        embedded_ms, embedded_size = measure(resume, template_name, True, args.iterations)
+        base_ms, base_size = measure(resume, template_name, False, args.iterations)
+        print(f"{template_name:<22}{font_file:<28}{first_ms:>9.1f}{embedded_ms:>9.2f}{base_ms:>9.2f}"
+              f"{embedded_size / 1024:>8.1f}{base_size / 1024:>9.1f}{(embedded_size - base_size) / 1024:>+8.1f}",
+              flush=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
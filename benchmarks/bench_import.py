@@ -0,0 +1,99 @@
+"""Report cold-start import cost of the rendering library
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --runs 10 --importtime 15
+
+Each scenario runs in fresh interpreters: importing the package, then rendering
+the first document of one format. The report shows the median time of each step
+and which rendering backends the process had loaded, so a PDF-only worker can be
+checked to never import python-docx. --importtime also lists the slowest modules
+from python -X importtime for the package import followed by each first render.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Scenario name -> (format, DOCX engine) rendered after the import; None only imports
+SCENARIOS = {
+    "import only": None,
+    "first pdf": ("pdf", "python-docx"),
+    "first docx (python-docx)": ("docx", "python-docx"),
+    "first docx (fast)": ("docx", "fast")
+}
+
+SCENARIO_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import resume_generator
+from resume_generator import loaded_backends, render_document
+imported = time.perf_counter()
+target = json.loads(sys.argv[1])
+if target:
+    from benchmarks.samples import sample_resume
+    render_document(sample_resume(), "Modern Blue", target[0], target[1])
+rendered = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "render_ms": (rendered - imported) * 1000,
+    "backends": loaded_backends()
+}))
+"""
+
+def run_scenario(target, python=sys.executable):
+    """Time one scenario in a fresh interpreter"""
+    completed = subprocess.run(
+        [python, "-c", SCENARIO_SCRIPT, json.dumps(target)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout)
+
+def slowest_imports(target, limit, python=sys.executable):
+    """Slowest modules (cumulative microseconds, module) reported by -X importtime"""
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", SCENARIO_SCRIPT, json.dumps(target)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    timings = []
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        timings.append((int(cumulative), module.strip()))
+    return sorted(timings, reverse=True)[:limit]
+
+def build_parser():
+    """Command line interface of the import report"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario")
+    parser.add_argument("--importtime", type=int, default=0, metavar="N",
+                        help="Also list the N slowest imports of each scenario")
+    return parser
+
+def main(argv=None):
+    """Print the cold-start report; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    print(f"{'scenario':<28}{'import ms':>11}{'render ms':>11}  backends loaded")
+    for name, target in SCENARIOS.items():
+        results = [run_scenario(target) for _ in range(args.runs)]
+        import_ms = statistics.median(result["import_ms"] for result in results)
+        render_ms = statistics.median(result["render_ms"] for result in results)
+        backends = ", ".join(results[-1]["backends"]) or "-"
+        print(f"{name:<28}{import_ms:>11.1f}{render_ms:>11.1f}  {backends}", flush=True)
+    
+    if args.importtime:
+        for name, target in SCENARIOS.items():
+            print(f"\nSlowest imports: {name}")
+            for cumulative, module in slowest_imports(target, args.importtime):
+                print(f"  {cumulative / 1000:>9.1f} ms  {module}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Size/latency tradeoff of the PDF output profiles across all templates
+
+Usage:
+    python -m benchmarks.bench_pdf_profiles --size large --iterations 20
+
+Prints p50 latency and output size of every template under every profile in
+PDF_PROFILES, with the size change relative to the default profile.
+"""
+
+import argparse
+import sys
+
+from resume_generator import DEFAULT_PDF_PROFILE, PDF_PROFILES, RESUME_TEMPLATES, parse_resume
+
+from .bench_render import SIZES, run_case
+from .samples import sample_resume
+
+def run_profiles(resume, template_names, profiles, iterations, warmup):
+    """{(template, profile): run_case metrics} for every combination"""
+    results = {}
+    for template_name in template_names:
+        for profile in profiles:
+            results[template_name, profile] = run_case(
+                resume, template_name, "pdf", iterations, warmup, pdf_profile=profile
+            )
+    return results
+
+def build_parser():
+    """Command line interface of the profile comparison"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", choices=list(SIZES), default="large", help="Synthetic resume size")
+    parser.add_argument("--profiles", nargs="+", choices=list(PDF_PROFILES), default=list(PDF_PROFILES))
+    parser.add_argument("--iterations", type=int, default=20, help="Timed renders per case")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed renders per case")
+    return parser
+
+def main(argv=None):
+    """Print the profile comparison table; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    resume = parse_resume(sample_resume(SIZES[args.size]))
+    results = run_profiles(resume, list(RESUME_TEMPLATES), args.profiles, args.iterations, args.warmup)
+    
+    print(f"{'template':<22}{'profile':<10}{'p50 ms':>9}{'bytes':>10}{'vs default':>12}")
+    for (template_name, profile), metrics in results.items():
+        baseline = results.get((template_name, DEFAULT_PDF_PROFILE))
+        change = f"{metrics['output_bytes'] / baseline['output_bytes'] - 1:+.1%}" if baseline else "-"
+        print(f"{template_name:<22}{profile:<10}{metrics['p50_ms']:>9.2f}{metrics['output_bytes']:>10}{change:>12}")
+    
+    print()
+    for profile in args.profiles:
+        total = sum(metrics["output_bytes"] for (_, name), metrics in results.items() if name == profile)
+        mean_ms = sum(metrics["p50_ms"] for (_, name), metrics in results.items() if name == profile) / len(RESUME_TEMPLATES)
+        print(f"{profile:<10} total {total / 1024:>8.1f} KiB   mean p50 {mean_ms:>7.2f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Benchmark document generation with saved baselines and regression thresholds
+
+Usage:
+    python -m benchmarks.bench_render --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_render --compare benchmarks/baseline.json --threshold 0.15
+
+Every case (resume size x template x format) is rendered repeatedly to measure
+latency percentiles, then once more under tracemalloc for peak allocations. A
+comparison fails (exit code 1) when a case's p50 latency or peak allocation grows
+by more than the threshold relative to the baseline.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from resume_generator import (
+    DEFAULT_DOCX_ENGINE,
+    DEFAULT_PDF_PROFILE,
+    DOCX_ENGINES,
+    FORMATS,
+    METRICS,
+    RESUME_TEMPLATES,
+    enable_metrics,
+    parse_resume,
+    render_document,
+)
+
+from .samples import sample_resume
+
+# Synthetic resume sizes, from a few bullets up to multi-page experience sections
+SIZES = {
+    "small": 1,
+    "medium": 4,
+    "large": 12,
+    "xlarge": 30
+}
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def run_case(resume, template_name, file_format, iterations, warmup, docx_engine=DEFAULT_DOCX_ENGINE,
+             pdf_profile=DEFAULT_PDF_PROFILE):
+    """Latency percentiles (ms), peak allocation and output size of one case"""
+    for _ in range(warmup):
+        render_document(resume, template_name, file_format, docx_engine, pdf_profile)
+    
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        document = render_document(resume, template_name, file_format, docx_engine, pdf_profile)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    
+    tracemalloc.start()
+    render_document(resume, template_name, file_format, docx_engine, pdf_profile)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        "p50_ms": percentile(timings, 0.50),
+        "p90_ms": percentile(timings, 0.90),
+        "p99_ms": percentile(timings, 0.99),
+        "mean_ms": sum(timings) / len(timings),
+        "peak_alloc_bytes": peak,
+        "output_bytes": len(document)
+    }
+
+def run_suite(sizes, template_names, formats, iterations, warmup, docx_engine):
+    """Run every requested case; returns {case id: metrics}"""
+    results = {}
+    for size_name in sizes:
+        resume = parse_resume(sample_resume(SIZES[size_name]))
+        for template_name in template_names:
+            for file_format in formats:
+                case = f"{size_name}/{template_name}/{file_format}"
+                results[case] = run_case(resume, template_name, file_format, iterations, warmup, docx_engine)
+                metrics = results[case]
+                print(
+                    f"{case:<45}{metrics['p50_ms']:>9.2f}{metrics['p90_ms']:>9.2f}{metrics['p99_ms']:>9.2f}"
+                    f"{metrics['peak_alloc_bytes'] / 1024:>12.0f}{metrics['output_bytes'] / 1024:>10.1f}",
+                    flush=True
+                )
+    return results
+
+def compare(results, baseline, threshold):
+    """Cases whose p50 latency or peak allocation regressed beyond threshold"""
+    regressions = []
+    for case, metrics in results.items():
+        reference = baseline.get(case)
+        if reference is None:
+            continue
+        for metric in ("p50_ms", "peak_alloc_bytes"):
+            if reference[metric] and metrics[metric] > reference[metric] * (1 + threshold):
+                change = metrics[metric] / reference[metric] - 1
+                regressions.append(f"{case} {metric}: {reference[metric]:.2f} -> {metrics[metric]:.2f} (+{change:.0%})")
+    return regressions
+
+def build_parser():
+    """Command line interface of the benchmark suite"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--templates", nargs="+", choices=list(RESUME_TEMPLATES), default=list(RESUME_TEMPLATES),
+                        metavar="TEMPLATE")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--docx-engine", choices=list(DOCX_ENGINES), default=DEFAULT_DOCX_ENGINE)
+    parser.add_argument("--iterations", type=int, default=20, help="Timed renders per case")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed renders per case")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write results to a baseline JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="Fail on regressions against a baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed relative regression before failing (default: 0.15 = 15%%)")
+    parser.add_argument("--stages", action="store_true", help="Also report mean time per render stage")
+    return parser
+
+def main(argv=None):
+    """Run the suite, then save and/or check against a baseline; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    enable_metrics(args.stages)
+    print(f"{'case':<45}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'peak KiB':>12}{'out KiB':>10}")
+    results = run_suite(args.sizes, args.templates, args.formats, args.iterations, args.warmup, args.docx_engine)
+    
+    if args.stages:
+        print(f"\n{'template/format/stage':<45}{'count':>9}{'mean ms':>9}")
+        for series in METRICS.snapshot():
+            stage = f"{series['template']}/{series['format']}/{series['stage']}"
+            print(f"{stage:<45}{series['count']:>9}{series['mean_ms']:>9.2f}")
+    
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "docx_engine": args.docx_engine,
+                "results": results
+            }, baseline_file, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.save_baseline}")
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
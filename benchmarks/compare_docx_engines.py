@@ -0,0 +1,102 @@
+"""Verify the fast DOCX engine against python-docx and measure its throughput
+
+Usage:
+    python -m benchmarks.compare_docx_engines [--size 3] [--iterations 50]
+
+Both engines render the same resume in every template. Each pair of documents is
+re-read with python-docx and compared paragraph by paragraph: style, alignment,
+bottom border, run text, bold, underline, size, color, font and hyperlink target,
+plus page margins and the Normal font. Exits non-zero on any mismatch.
+"""
+
+import argparse
+import io
+import sys
+import time
+
+from docx import Document
+from docx.oxml.shared import qn
+from docx.text.run import Run
+
+from resume_generator import RESUME_TEMPLATES, parse_resume, render_document
+
+from .samples import sample_resume
+
+ENGINES = ("python-docx", "fast")
+
+def describe_run(r_element, paragraph, url=None):
+    """Comparable summary of one w:r element"""
+    run = Run(r_element, paragraph)
+    color = run.font.color
+    return (
+        run.text,
+        bool(run.bold),
+        bool(run.underline),
+        run.font.size,
+        str(color.rgb) if color.type is not None else None,
+        run.font.name,
+        url
+    )
+
+def describe_docx(document_bytes):
+    """Comparable summary of a document's layout, styles, paragraphs and runs"""
+    doc = Document(io.BytesIO(document_bytes))
+    section = doc.sections[0]
+    normal_font = doc.styles['Normal'].font
+    summary = [
+        ("margins", section.top_margin, section.bottom_margin, section.left_margin, section.right_margin),
+        ("normal font", normal_font.name, normal_font.size)
+    ]
+    for paragraph in doc.paragraphs:
+        border = paragraph._p.find(f"{qn('w:pPr')}/{qn('w:pBdr')}/{qn('w:bottom')}")
+        runs = []
+        for child in paragraph._p.iterchildren():
+            if child.tag == qn('w:r'):
+                runs.append(describe_run(child, paragraph))
+            elif child.tag == qn('w:hyperlink'):
+                url = doc.part.rels[child.get(qn('r:id'))].target_ref
+                runs.extend(describe_run(r, paragraph, url) for r in child.iterchildren(qn('w:r')))
+        summary.append((
+            paragraph.style.name,
+            paragraph.alignment,
+            border.get(qn('w:color')).lower() if border is not None else None,
+            tuple(runs)
+        ))
+    return summary
+
+def time_engine(resume, template_name, engine, iterations):
+    """Documents per second for one engine and template"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render_document(resume, template_name, "docx", docx_engine=engine)
+    return iterations / (time.perf_counter() - started)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=3, help="Synthetic resume size (jobs/projects)")
+    parser.add_argument("--iterations", type=int, default=50, help="Renders per engine and template")
+    args = parser.parse_args(argv)
+    
+    resume = parse_resume(sample_resume(args.size))
+    mismatches = 0
+    print(f"{'Template':<22}{'python-docx/s':>15}{'fast/s':>10}{'speedup':>10}  parity")
+    for template_name in RESUME_TEMPLATES:
+        reference, candidate = (
+            describe_docx(render_document(resume, template_name, "docx", docx_engine=engine))
+            for engine in ENGINES
+        )
+        parity = "ok"
+        if reference != candidate:
+            mismatches += 1
+            diff = next(
+                (i, ref, cand) for i, (ref, cand) in enumerate(zip(reference, candidate)) if ref != cand
+            ) if len(reference) == len(candidate) else ("length", len(reference), len(candidate))
+            parity = f"MISMATCH at {diff}"
+        
+        rates = [time_engine(resume, template_name, engine, args.iterations) for engine in ENGINES]
+        print(f"{template_name:<22}{rates[0]:>15.1f}{rates[1]:>10.1f}{rates[1] / rates[0]:>9.1f}x  {parity}")
+    
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Load generator for the HTTP render service
+
+Usage:
+    python -m benchmarks.loadgen --spawn --workers 2 --queue-limit 8 --concurrency 32 --requests 500
+    python -m benchmarks.loadgen --url http://127.0.0.1:8080 --concurrency 16 --duration 30
+
+Each virtual client keeps one connection open and sends POST /render requests
+back to back. Resumes vary per request (unless --repeat) so the service cache
+does not hide render cost. --spawn starts a local service in a subprocess
+first, so nothing outside this machine is needed. Prints throughput, latency
+percentiles and the count of each status code, e.g. how many were shed with 429.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from resume_generator import DEFAULT_DOCX_ENGINE, DOCX_ENGINES, FORMATS, RESUME_TEMPLATES
+
+from .bench_render import percentile
+from .samples import sample_resume
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+async def send_request(reader, writer, host, method, path, body=b""):
+    """Send one keep-alive request; returns (status code, response body)"""
+    head = f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+    
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Service closed the connection")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+def request_body(sequence, size, formats, repeat):
+    """JSON body of the n-th request, cycling through templates and formats"""
+    resume = sample_resume(size)
+    if not repeat:
+        resume["name"] = f"{resume['name']} {sequence}"
+    template_names = list(RESUME_TEMPLATES)
+    return json.dumps({
+        "resume": resume,
+        "template": template_names[sequence % len(template_names)],
+        "format": formats[sequence % len(formats)]
+    }).encode()
+
+async def client(host, port, args, counter, deadline, latencies, statuses):
+    """One virtual client sending requests until the budget or deadline runs out"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            sequence = next(counter)
+            if args.requests and sequence >= args.requests:
+                break
+            body = request_body(sequence, args.size, args.formats, args.repeat)
+            started = time.perf_counter()
+            try:
+                status, _ = await send_request(reader, writer, host, "POST", "/render", body)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                statuses["connection error"] += 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[status] += 1
+    finally:
+        writer.close()
+
+async def wait_until_healthy(host, port, timeout=30.0):
+    """Poll /healthz until the service answers"""
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            try:
+                status, _ = await send_request(reader, writer, host, "GET", "/healthz")
+            finally:
+                writer.close()
+            if status == 200:
+                return
+        except OSError:
+            pass
+        if time.perf_counter() > deadline:
+            raise SystemExit(f"Service on {host}:{port} did not become healthy within {timeout:g}s")
+        await asyncio.sleep(0.2)
+
+async def run_load(host, port, args):
+    """Drive the service with --concurrency clients; returns (elapsed seconds, latencies, statuses)"""
+    await wait_until_healthy(host, port)
+    counter = iter(range(sys.maxsize))
+    latencies, statuses = [], Counter()
+    started = time.perf_counter()
+    deadline = started + (args.duration or float("inf"))
+    await asyncio.gather(*(
+        client(host, port, args, counter, deadline, latencies, statuses) for _ in range(args.concurrency)
+    ))
+    return time.perf_counter() - started, latencies, statuses
+
+async def fetch_metrics(host, port):
+    """The service's /metrics text"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, body = await send_request(reader, writer, host, "GET", "/metrics")
+    finally:
+        writer.close()
+    return body.decode()
+
+def build_parser():
+    """Command line interface of the load generator"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="Service base URL")
+    parser.add_argument("--spawn", action="store_true", help="Start a local service on --url's port first")
+    parser.add_argument("--workers", type=int, default=2, help="Workers of the spawned service")
+    parser.add_argument("--queue-limit", type=int, default=8, help="Queue limit of the spawned service")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Request timeout of the spawned service")
+    parser.add_argument("--docx-engine", choices=list(DOCX_ENGINES), default=DEFAULT_DOCX_ENGINE,
+                        help="DOCX writer of the spawned service")
+    parser.add_argument("--concurrency", type=int, default=16, help="Simultaneous clients")
+    parser.add_argument("--requests", type=int, default=200, help="Total requests (0 = until --duration)")
+    parser.add_argument("--duration", type=float, default=0, help="Stop after this many seconds (0 = no limit)")
+    parser.add_argument("--size", type=int, default=2, help="Synthetic resume size")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--repeat", action="store_true", help="Send identical resumes so the cache answers")
+    parser.add_argument("--show-metrics", action="store_true", help="Print the service's /metrics afterwards")
+    return parser
+
+def main(argv=None):
+    """Run the load test and print a summary; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    if not args.requests and not args.duration:
+        raise SystemExit("Give --requests, --duration or both")
+    url = urlsplit(args.url)
+    host, port = url.hostname or "127.0.0.1", url.port or 80
+    
+    service = None
+    if args.spawn:
+        service = subprocess.Popen(
+            [sys.executable, "-m", "resume_generator.service", "--host", host, "--port", str(port),
+             "--workers", str(args.workers), "--queue-limit", str(args.queue_limit), "--timeout", str(args.timeout),
+             "--docx-engine", args.docx_engine],
+            cwd=REPO_ROOT
+        )
+    try:
+        elapsed, latencies, statuses = asyncio.run(run_load(host, port, args))
+        metrics = asyncio.run(fetch_metrics(host, port)) if args.show_metrics else ""
+    finally:
+        if service is not None:
+            service.terminate()
+            service.wait()
+    
+    latencies.sort()
+    completed = sum(statuses.values())
+    print(f"{completed} requests in {elapsed:.2f}s ({completed / elapsed:.1f} req/s) "
+          f"with {args.concurrency} clients")
+    if latencies:
+        print(f"latency ms: p50 {percentile(latencies, 0.50):.1f}  p90 {percentile(latencies, 0.90):.1f}  "
+              f"p99 {percentile(latencies, 0.99):.1f}  max {latencies[-1]:.1f}")
+    for status, count in sorted(statuses.items(), key=str):
+        print(f"  {status}: {count}")
+    if metrics:
+        print(metrics)
+    return 0 if statuses.get(200) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""Synthetic resume_data used by the benchmarks"""
+
+def sample_resume(size=1):
+    """resume_data with every section filled; size scales the number of jobs, projects and bullets"""
+    projects = []
+    experience = []
+    for i in range(size):
+        projects.append(f"Project {i + 1}: Distributed Task Scheduler")
+        projects.extend(
+            f"• Built component {j + 1} handling 10k requests/second with Python and Redis"
+            for j in range(3)
+        )
+        experience.append(f"Senior Engineer {i + 1} - Example Corp (Jan 2020 - Present)")
+        experience.extend(
+            f"- Reduced p99 latency of service {j + 1} by 40% through caching and batching"
+            for j in range(5)
+        )
+    return {
+        'name': 'Jordan Example',
+        'email': 'jordan@example.com',
+        'phone': '+1 (555) 123-4567',
+        'location': 'Austin, TX',
+        'linkedin': 'linkedin.com/in/jordan-example',
+        'github': 'github.com/jordan-example',
+        'education': "State University\nBachelor of Science in Computer Science\nGPA: 3.8/4.0\nGraduation: May 2019",
+        'projects': '\n'.join(projects),
+        'experience': '\n'.join(experience),
+        'achievements': '\n'.join(f"Award {i + 1} - Engineering excellence, 202{i % 10}" for i in range(size * 2)),
+        'skills': "Programming Languages: Python, Java, Go\nFrameworks and Libraries: Django, React\n"
+                  "Databases: PostgreSQL, Redis\nTools and Technologies: Git, Docker, AWS"
+    }
@@ -1,18 +1,51 @@
-import streamlit as st
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.shared import OxmlElement, qn
-from docx.oxml import parse_xml
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+import csv
 import io
-from datetime import datetime
-import re
+import multiprocessing
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import streamlit as st
+
+from resume_generator import (
+    DEFAULT_SUGGESTION_BACKEND,
+    FORMATS,
+    METRICS,
+    MIME_TYPES,
+    RESUME_TEMPLATES,
+    CoverLetterWriter,
+    DraftAutosaver,
+    DraftStore,
+    RenderCache,
+    RenderLimitError,
+    ResumeImportError,
+    SpeculativeRenderer,
+    SuggestionEngine,
+    bullet_lines,
+    check_resume_limits,
+    create_template_html,
+    document_filename,
+    drafts_path_from_env,
+    format_url,
+    import_resume,
+    letter_filename,
+    limits_from_env,
+    loaded_backends,
+    metrics_enabled,
+    new_draft_id,
+    parse_posting,
+    parse_resume,
+    read_postings,
+    render_cover_letters,
+    render_document,
+    resume_cache_key,
+    rgbcolor_to_rgb,
+    store_from_env,
+    suggestion_backend,
+    write_fanout_zip,
+)
 
 # Page configuration
 st.set_page_config(
@@ -24,537 +57,418 @@ st.set_page_config(
 st.title("📄 Multi-Template Resume Generator")
 st.markdown("Choose from 5 professionally designed resume templates with centered contact information!")
 
-# Resume Template Definitions
-RESUME_TEMPLATES = {
-    "Classic Professional": {
-        "description": "Traditional black and white with clean lines - Universally accepted",
-        "color_scheme": {
-            "primary": RGBColor(0, 0, 0),  # Black
-            "secondary": RGBColor(64, 64, 64),  # Dark Gray
-            "accent": RGBColor(128, 128, 128)  # Light Gray
-        },
-        "pdf_colors": {
-            "primary": colors.black,
-            "secondary": colors.Color(0.25, 0.25, 0.25),
-            "accent": colors.Color(0.5, 0.5, 0.5)
-        },
-        "font_style": "Arial",
-        "header_style": "underlined"
-    },
-    "Modern Blue": {
-        "description": "Contemporary design with professional blue accents - Tech-friendly",
-        "color_scheme": {
-            "primary": RGBColor(0, 51, 102),  # Navy Blue
-            "secondary": RGBColor(0, 102, 204),  # Medium Blue
-            "accent": RGBColor(102, 153, 255)  # Light Blue
-        },
-        "pdf_colors": {
-            "primary": colors.Color(0, 0.2, 0.4),
-            "secondary": colors.Color(0, 0.4, 0.8),
-            "accent": colors.Color(0.4, 0.6, 1)
-        },
-        "font_style": "Calibri",
-        "header_style": "colored_background"
-    },
-    "Executive Green": {
-        "description": "Sophisticated green theme for senior positions - Leadership-focused",
-        "color_scheme": {
-            "primary": RGBColor(0, 100, 0),  # Dark Green
-            "secondary": RGBColor(34, 139, 34),  # Forest Green
-            "accent": RGBColor(144, 238, 144)  # Light Green
-        },
-        "pdf_colors": {
-            "primary": colors.Color(0, 0.4, 0),
-            "secondary": colors.Color(0.13, 0.55, 0.13),
-            "accent": colors.Color(0.56, 0.93, 0.56)
-        },
-        "font_style": "Times New Roman",
-        "header_style": "bold_colored"
-    },
-    "Creative Purple": {
-        "description": "Stylish purple design for creative professionals - Artistic appeal",
-        "color_scheme": {
-            "primary": RGBColor(75, 0, 130),  # Indigo
-            "secondary": RGBColor(138, 43, 226),  # Blue Violet
-            "accent": RGBColor(221, 160, 221)  # Plum
-        },
-        "pdf_colors": {
-            "primary": colors.Color(0.29, 0, 0.51),
-            "secondary": colors.Color(0.54, 0.17, 0.89),
-            "accent": colors.Color(0.87, 0.63, 0.87)
-        },
-        "font_style": "Georgia",
-        "header_style": "gradient_effect"
-    },
-    "Warm Orange": {
-        "description": "Energetic orange theme for dynamic professionals - Marketing-friendly",
-        "color_scheme": {
-            "primary": RGBColor(204, 85, 0),  # Dark Orange
-            "secondary": RGBColor(255, 140, 0),  # Dark Orange
-            "accent": RGBColor(255, 218, 185)  # Peach
-        },
-        "pdf_colors": {
-            "primary": colors.Color(0.8, 0.33, 0),
-            "secondary": colors.Color(1, 0.55, 0),
-            "accent": colors.Color(1, 0.85, 0.73)
-        },
-        "font_style": "Verdana",
-        "header_style": "boxed"
-    }
-}
+@st.cache_resource
+def get_render_cache():
+    """Process-wide render cache shared by all sessions, backed by the disk store if configured
+    
+    Point replicas at one RESUME_ARTIFACT_DIR to let each serve documents
+    another already rendered.
+    """
+    return RenderCache(store=store_from_env())
 
-def rgbcolor_to_rgb(rgbcolor):
-    """Convert docx RGBColor to (r,g,b) tuple"""
-    color_hex = str(rgbcolor)  # Gets hex string like "003366"
-    r = int(color_hex[0:2], 16)
-    g = int(color_hex[2:4], 16) 
-    b = int(color_hex[4:6], 16)
-    return (r, g, b)
-
-def format_url(url):
-    """Format URL to ensure it has proper protocol"""
-    if not url or url.strip() == "":
-        return ""
-    
-    url = url.strip()
-    if not url.startswith(('http://', 'https://')):
-        if 'linkedin.com' in url or 'github.com' in url:
-            url = 'https://' + url
-        else:
-            url = 'https://' + url
-    return url
-
-def add_hyperlink_to_paragraph(paragraph, text, url):
-    """Add a hyperlink to a paragraph in Word document"""
-    # Create hyperlink
-    part = paragraph.part
-    r_id = part.relate_to(url, "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink", is_external=True)
-    
-    # Create the w:hyperlink tag and add needed values
-    hyperlink = OxmlElement('w:hyperlink')
-    hyperlink.set(qn('r:id'), r_id)
-    
-    # Create a new run object and add it to the hyperlink
-    new_run = OxmlElement('w:r')
-    
-    # Create run properties for styling
-    rPr = OxmlElement('w:rPr')
-    
-    # Add color (blue) and underline for hyperlink styling
-    color = OxmlElement('w:color')
-    color.set(qn('w:val'), '0066CC')  # Blue color
-    rPr.append(color)
-    
-    u = OxmlElement('w:u')
-    u.set(qn('w:val'), 'single')
-    rPr.append(u)
-    
-    new_run.append(rPr)
-    
-    # Create text element
-    t = OxmlElement('w:t')
-    t.text = text
-    new_run.append(t)
-    
-    hyperlink.append(new_run)
-    paragraph._p.append(hyperlink)
-    
-    return hyperlink
-
-def add_colored_line_after_paragraph(paragraph, color_rgb):
-    """Add a colored horizontal line after a paragraph in Word"""
-    p = paragraph._element
-    pPr = p.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    pPr.insert_element_before(pBdr, 'w:shd', 'w:tabs', 'w:suppressAutoHyphens')
-    bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), '8')
-    bottom.set(qn('w:space'), '1')
-    # Convert RGBColor to hex
-    color_hex = f'{rgbcolor_to_rgb(color_rgb)[0]:02x}{rgbcolor_to_rgb(color_rgb)[1]:02x}{rgbcolor_to_rgb(color_rgb)[2]:02x}'
-    bottom.set(qn('w:color'), color_hex)
-    pBdr.append(bottom)
-
-def create_template_word_doc(data, template_name):
-    """Create a Word document with template-specific styling and CENTERED contact info"""
-    template_config = RESUME_TEMPLATES[template_name]
-    colors = template_config["color_scheme"]
-    font_name = template_config["font_style"]
-    
-    doc = Document()
-    
-    # Set document margins
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(0.5)
-        section.bottom_margin = Inches(0.5)
-        section.left_margin = Inches(0.75)
-        section.right_margin = Inches(0.75)
-    
-    # Set default font
-    style = doc.styles['Normal']
-    font = style.font
-    font.name = font_name
-    font.size = Pt(10)
-    
-    # NAME SECTION - ALWAYS CENTERED
-    name_para = doc.add_paragraph()
-    name_run = name_para.add_run(data['name'].upper())
-    name_run.bold = True
-    name_run.font.size = Pt(18)
-    name_run.font.name = font_name
-    name_run.font.color.rgb = colors["primary"]
-    name_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER  # ALWAYS CENTER
-    name_para.space_after = Pt(6)
-    
-    # CONTACT INFO - ALWAYS CENTERED with clickable links
-    contact_para = doc.add_paragraph()
-    contact_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER  # ALWAYS CENTER
-    
-    # Add email
-    email_run = contact_para.add_run(f"📧 {data['email']}")
-    email_run.font.size = Pt(9)
-    email_run.font.color.rgb = colors["secondary"]
-    
-    # Add phone
-    phone_run = contact_para.add_run(f"    📞 {data['phone']}")
-    phone_run.font.size = Pt(9)
-    phone_run.font.color.rgb = colors["secondary"]
-    
-    # Add location
-    location_run = contact_para.add_run(f"    📍 {data['location']}")
-    location_run.font.size = Pt(9)
-    location_run.font.color.rgb = colors["secondary"]
-    
-    # Add LinkedIn as clickable link
-    if data.get('linkedin') and data['linkedin'].strip():
-        linkedin_text_run = contact_para.add_run("    🔗 ")
-        linkedin_text_run.font.size = Pt(9)
-        linkedin_text_run.font.color.rgb = colors["secondary"]
-        
-        # Add clickable "LinkedIn" text
-        linkedin_url = format_url(data['linkedin'])
-        add_hyperlink_to_paragraph(contact_para, "LinkedIn", linkedin_url)
-    
-    # Add GitHub as clickable link
-    if data.get('github') and data['github'].strip():
-        github_text_run = contact_para.add_run("    💻 ")
-        github_text_run.font.size = Pt(9)
-        github_text_run.font.color.rgb = colors["secondary"]
-        
-        # Add clickable "GitHub" text
-        github_url = format_url(data['github'])
-        add_hyperlink_to_paragraph(contact_para, "GitHub", github_url)
-    
-    contact_para.space_after = Pt(12)
-    
-    # Add styled line after header
-    add_colored_line_after_paragraph(contact_para, colors["primary"])
-    
-    # Helper function to create section headers
-    def create_section_header(title):
-        heading = doc.add_paragraph()
-        heading.space_before = Pt(16)
-        heading_run = heading.add_run(title.upper())
-        heading_run.bold = True
-        heading_run.font.size = Pt(12)
-        heading_run.font.name = font_name
-        heading_run.font.color.rgb = colors["primary"]
-        
-        # Template-specific styling
-        if template_config["header_style"] == "underlined":
-            heading_run.underline = True
-        elif template_config["header_style"] == "colored_background":
-            # Add background shading (simulated with border)
-            add_colored_line_after_paragraph(heading, colors["accent"])
-        
-        heading.space_after = Pt(8)
-        return heading
-    
-    # EDUCATION SECTION
-    create_section_header("Education")
-    edu_lines = data['education'].strip().split('\n')
-    for line in edu_lines:
-        if line.strip():
-            edu_para = doc.add_paragraph()
-            if any(word in line.lower() for word in ['university', 'college', 'school', 'institute']):
-                edu_run = edu_para.add_run(line.strip())
-                edu_run.bold = True
-                edu_run.font.size = Pt(10)
-                edu_run.font.color.rgb = colors["secondary"]
-            else:
-                edu_run = edu_para.add_run(line.strip())
-                edu_run.font.size = Pt(10)
-            edu_para.space_after = Pt(3)
-    
-    # PROJECTS SECTION
-    if data.get('projects') and data['projects'].strip():
-        create_section_header("Projects")
-        proj_lines = data['projects'].strip().split('\n')
-        
-        for line in proj_lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith('•') or line.startswith('-'):
-                bullet_para = doc.add_paragraph()
-                bullet_para.style = 'List Bullet'
-                bullet_run = bullet_para.add_run(line[1:].strip())
-                bullet_run.font.size = Pt(10)
-                bullet_para.space_after = Pt(2)
-            else:
-                proj_para = doc.add_paragraph()
-                proj_run = proj_para.add_run(line)
-                proj_run.bold = True
-                proj_run.font.size = Pt(10)
-                proj_run.font.color.rgb = colors["secondary"]
-                proj_para.space_after = Pt(3)
-    
-    # EXPERIENCE SECTION
-    create_section_header("Professional Experience")
-    if data.get('experience'):
-        exp_lines = data['experience'].strip().split('\n')
-        for line in exp_lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith('•') or line.startswith('-'):
-                bullet_para = doc.add_paragraph()
-                bullet_para.style = 'List Bullet'
-                bullet_run = bullet_para.add_run(line[1:].strip())
-                bullet_run.font.size = Pt(10)
-                bullet_para.space_after = Pt(2)
+@st.cache_resource
+def get_draft_autosaver():
+    """Process-wide autosaver, coalescing every session's draft edits into few SQLite writes"""
+    return DraftAutosaver(DraftStore(drafts_path_from_env()))
+
+def restore_draft():
+    """Resume the draft named in the URL, or start a new one and put its id in the URL"""
+    draft_id = st.query_params.get("draft")
+    fields = get_draft_autosaver().store.load(draft_id) if draft_id else None
+    if fields is None:
+        draft_id = new_draft_id()
+        st.query_params["draft"] = draft_id
+    else:
+        for field, value in fields.items():
+            if field == "template":
+                if value in RESUME_TEMPLATES:
+                    st.session_state.selected_template = value
             else:
-                job_para = doc.add_paragraph()
-                job_run = job_para.add_run(line)
-                job_run.bold = True
-                job_run.font.size = Pt(10)
-                job_run.font.color.rgb = colors["secondary"]
-                job_para.space_after = Pt(3)
-    
-    # ACHIEVEMENTS SECTION
-    if data.get('achievements') and data['achievements'].strip():
-        create_section_header("Achievements")
-        ach_lines = data['achievements'].strip().split('\n')
-        for line in ach_lines:
-            if line.strip():
-                ach_para = doc.add_paragraph()
-                ach_run = ach_para.add_run(f"• {line.strip()}")
-                ach_run.font.size = Pt(10)
-                ach_para.space_after = Pt(3)
-    
-    # TECHNICAL SKILLS SECTION
-    if data.get('skills') and data['skills'].strip():
-        create_section_header("Technical Skills")
-        skills_lines = data['skills'].strip().split('\n')
-        for line in skills_lines:
-            if line.strip():
-                skills_para = doc.add_paragraph()
-                if ':' in line:
-                    parts = line.split(':', 1)
-                    category_run = skills_para.add_run(parts[0].strip() + ': ')
-                    category_run.bold = True
-                    category_run.font.size = Pt(10)
-                    category_run.font.color.rgb = colors["secondary"]
-                    skills_run = skills_para.add_run(parts[1].strip())
-                    skills_run.font.size = Pt(10)
-                else:
-                    skills_run = skills_para.add_run(line.strip())
-                    skills_run.font.size = Pt(10)
-                skills_para.space_after = Pt(3)
-    
-    # Save to BytesIO
-    doc_io = io.BytesIO()
-    doc.save(doc_io)
-    doc_io.seek(0)
-    return doc_io
-
-def create_template_pdf(data, template_name):
-    """Create a PDF with template-specific styling and CENTERED contact info"""
-    template_config = RESUME_TEMPLATES[template_name]
-    pdf_colors = template_config["pdf_colors"]
-    
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer, 
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.5*inch,
-        bottomMargin=0.5*inch
-    )
-    
-    styles = getSampleStyleSheet()
-    story = []
-    
-    # Custom styles with template colors - ALWAYS CENTERED FOR CONTACT INFO
-    name_style = ParagraphStyle(
-        'NameStyle',
-        parent=styles['Normal'],
-        fontSize=18,
-        spaceAfter=6,
-        spaceBefore=0,
-        textColor=pdf_colors["primary"],
-        fontName='Helvetica-Bold',
-        alignment=1  # ALWAYS CENTER (1 = center alignment)
-    )
-    
-    contact_style = ParagraphStyle(
-        'ContactStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        spaceAfter=12,
-        spaceBefore=2,
-        textColor=pdf_colors["secondary"],
-        alignment=1  # ALWAYS CENTER (1 = center alignment)
-    )
-    
-    section_style = ParagraphStyle(
-        'SectionStyle',
-        parent=styles['Normal'],
-        fontSize=12,
-        spaceAfter=8,
-        spaceBefore=16,
-        textColor=pdf_colors["primary"],
-        fontName='Helvetica-Bold'
-    )
-    
-    content_style = ParagraphStyle(
-        'ContentStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=3,
-        spaceBefore=0
-    )
-    
-    job_style = ParagraphStyle(
-        'JobStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=3,
-        spaceBefore=0,
-        textColor=pdf_colors["secondary"],
-        fontName='Helvetica-Bold'
+                st.session_state[f"field_{field}"] = value
+    st.session_state.draft_id = draft_id
+
+def import_uploaded_resume():
+    """Fill the form from an uploaded DOCX or PDF resume, once per upload"""
+    uploaded = st.file_uploader("📥 Import an existing resume (.docx or .pdf)", type=["docx", "pdf"],
+                                key="resume_upload")
+    if uploaded is None or st.session_state.get("imported_file") == uploaded.file_id:
+        return
+    st.session_state.imported_file = uploaded.file_id
+    try:
+        data = import_resume(io.BytesIO(uploaded.getvalue()), uploaded.name)
+    except (ResumeImportError, ImportError) as exc:
+        st.error(f"❌ Could not import {uploaded.name}: {exc}")
+        return
+    # Fields the document did not provide keep what was already typed
+    imported = [field for field, value in data.items() if value.strip()]
+    for field in imported:
+        st.session_state[f"field_{field}"] = data[field]
+    st.success(f"✅ Imported {len(imported)} fields from {uploaded.name} - review them below.")
+
+@st.cache_resource
+def get_render_limits():
+    """Input size, page and time limits of every render in this process (RESUME_MAX_* variables)"""
+    return limits_from_env()
+
+def resume_size_error(data):
+    """Why resume data is too large to render, or None"""
+    try:
+        check_resume_limits(data, get_render_limits())
+    except RenderLimitError as exc:
+        return str(exc)
+    return None
+
+# Background pre-rendering of the templates a user is likely to switch to next
+SPECULATIVE_WORKERS = 4
+SPECULATIVE_RENDERS_PER_SESSION = 2
+
+@st.cache_resource
+def get_speculative_executor():
+    """Process-wide worker pool for speculative renders
+    
+    Threads rather than processes: Streamlit runs this script as __main__, so
+    spawned worker processes would re-execute the whole app on import.
+    """
+    return ThreadPoolExecutor(max_workers=SPECULATIVE_WORKERS, thread_name_prefix="speculative-render")
+
+def get_speculative_renderer():
+    """This session's speculative renderer, sharing the process-wide pool and cache"""
+    if 'speculative_renderer' not in st.session_state:
+        st.session_state.speculative_renderer = SpeculativeRenderer(
+            get_speculative_executor(),
+            get_render_cache(),
+            max_in_flight=SPECULATIVE_RENDERS_PER_SESSION,
+            limits=get_render_limits()
+        )
+    return st.session_state.speculative_renderer
+
+def speculate_other_templates():
+    """Pre-render every template in the requested formats for the committed resume"""
+    if not st.session_state.resume_data or not st.session_state.requested_formats:
+        get_speculative_renderer().cancel()
+        return
+    # Current template first, since it is the next thing the user downloads
+    current = st.session_state.selected_template
+    template_names = [current] + [name for name in RESUME_TEMPLATES if name != current]
+    get_speculative_renderer().schedule(
+        parse_resume(st.session_state.resume_data),
+        template_names,
+        sorted(st.session_state.requested_formats)
     )
-    
-    # NAME - ALWAYS CENTERED
-    story.append(Paragraph(f'<b>{data["name"].upper()}</b>', name_style))
-    
-    # CONTACT INFO - ALWAYS CENTERED with clickable links
-    contact_parts = [f'{data["email"]}', f'{data["phone"]}', f'{data["location"]}']
-    
-    # Add LinkedIn as clickable link
-    if data.get('linkedin') and data['linkedin'].strip():
-        linkedin_url = format_url(data['linkedin'])
-        contact_parts.append(f'<link href="{linkedin_url}" color="blue">LinkedIn</link>')
-    
-    # Add GitHub as clickable link  
-    if data.get('github') and data['github'].strip():
-        github_url = format_url(data['github'])
-        contact_parts.append(f'<link href="{github_url}" color="blue">GitHub</link>')
-    
-    contact_info = ' | '.join(contact_parts)
-    story.append(Paragraph(contact_info, contact_style))
-    
-    # Add separator line
-    story.append(Spacer(1, 6))
-    
-    # Helper function to add colored section headers
-    def add_section_header(title):
-        if template_config["header_style"] == "colored_background":
-            # Create a table for background effect
-            header_table = Table([[title.upper()]], colWidths=[7*inch])
-            header_table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,-1), pdf_colors["accent"]),
-                ('TEXTCOLOR', (0,0), (-1,-1), pdf_colors["primary"]),
-                ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0,0), (-1,-1), 12),
-                ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('LEFTPADDING', (0,0), (-1,-1), 6),
-                ('RIGHTPADDING', (0,0), (-1,-1), 6),
-                ('TOPPADDING', (0,0), (-1,-1), 4),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 4),
-            ]))
-            story.append(header_table)
-            story.append(Spacer(1, 8))
-        else:
-            story.append(Paragraph(f'<b>{title.upper()}</b>', section_style))
-    
-    # EDUCATION
-    add_section_header("Education")
-    edu_lines = data['education'].strip().split('\n')
-    for line in edu_lines:
-        if line.strip():
-            if any(word in line.lower() for word in ['university', 'college', 'school', 'institute']):
-                story.append(Paragraph(f'<b>{line.strip()}</b>', job_style))
-            else:
-                story.append(Paragraph(line.strip(), content_style))
-    
-    # PROJECTS
-    if data.get('projects') and data['projects'].strip():
-        add_section_header("Projects")
-        proj_lines = data['projects'].strip().split('\n')
-        for line in proj_lines:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith('•') or line.startswith('-'):
-                story.append(Paragraph(f'• {line[1:].strip()}', content_style))
-            else:
-                story.append(Paragraph(f'<b>{line}</b>', job_style))
-    
-    # EXPERIENCE
-    add_section_header("Professional Experience")
-    if data.get('experience'):
-        exp_lines = data['experience'].strip().split('\n')
-        for line in exp_lines:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith('•') or line.startswith('-'):
-                story.append(Paragraph(f'• {line[1:].strip()}', content_style))
+
+def render_resume_bytes(resume, template_name, file_format):
+    """Render a parsed resume to bytes, serving unchanged documents from the render cache"""
+    def render():
+        # Wait for a speculative render of the same document instead of duplicating it
+        document = get_speculative_renderer().wait_for(key)
+        if document is None:
+            document = render_document(resume, template_name, file_format, limits=get_render_limits())
+        return document
+    key = resume_cache_key(resume, template_name, file_format)
+    return get_render_cache().get_or_render(key, render)
+
+# "Render all templates": every template in every format, in parallel
+FANOUT_WORKERS = min(len(RESUME_TEMPLATES) * len(FORMATS), os.cpu_count() or 1)
+
+@st.cache_resource
+def get_fanout_executor():
+    """Process-wide pool for rendering all templates at once
+    
+    Workers start from a fork server (spawned where there is none) rather than
+    by forking this multithreaded server: a forked child inherits locks held by
+    the prerender and autosave threads and can deadlock on them. The fork
+    server preloads the renderers, so new workers start with them imported.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["resume_generator.fanout", "resume_generator.pdf_renderer",
+                                        "resume_generator.docx_fast"])
+    else:
+        context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=FANOUT_WORKERS, mp_context=context)
+
+def render_all_templates(resume):
+    """Zip of every template in every format, with per-document timings, kept for this resume"""
+    zip_io = io.BytesIO()
+    try:
+        results, wall_seconds = write_fanout_zip(resume, zip_io, get_fanout_executor(), cache=get_render_cache(),
+                                                 limits=get_render_limits())
+    except RenderLimitError as exc:
+        st.error(f"❌ {exc}")
+        return
+    except BrokenProcessPool:
+        # A worker died (killed or out of memory); drop the cached pool so the next attempt gets a fresh one
+        get_fanout_executor().shutdown(wait=False)
+        get_fanout_executor.clear()
+        st.error("❌ A render worker stopped unexpectedly - please try again.")
+        return
+    except Exception as exc:
+        st.error(f"❌ Could not render all templates: {exc}")
+        return
+    st.session_state.all_templates = {
+        "resume_data": st.session_state.resume_data,
+        "zip": zip_io.getvalue(),
+        "results": results,
+        "wall_seconds": wall_seconds
+    }
+
+PREPARE_LABELS = {"docx": "📄 Prepare Word (.docx)", "pdf": "📑 Prepare PDF"}
+DOWNLOAD_LABELS = {"docx": "📄 Download Word (.docx)", "pdf": "📑 Download PDF"}
+
+def request_format(file_format):
+    """Remember that the user wants this format; it is rendered from now on"""
+    st.session_state.requested_formats.add(file_format)
+    speculate_other_templates()
+
+@st.fragment
+def download_panel():
+    """Download buttons and template switcher, rerun on their own without the rest of the page"""
+    template_name = st.session_state.selected_template
+    st.subheader("📥 Download Your Resume")
+    st.caption(f"Template: **{template_name}**")
+    
+    # Parse once and share the model between both formats
+    parsed_resume = parse_resume(st.session_state.resume_data)
+    
+    # Documents are only rendered for the formats the user asked for
+    format_cols = st.columns(len(FORMATS))
+    for file_format, format_col in zip(FORMATS, format_cols):
+        with format_col:
+            if file_format in st.session_state.requested_formats:
+                try:
+                    document = render_resume_bytes(parsed_resume, template_name, file_format)
+                except RenderLimitError as exc:
+                    st.error(f"❌ {exc}")
+                    continue
+                st.download_button(
+                    label=DOWNLOAD_LABELS[file_format],
+                    data=document,
+                    file_name=document_filename(parsed_resume.name, template_name, file_format),
+                    mime=MIME_TYPES[file_format],
+                    key=f"download_{file_format}",
+                    use_container_width=True
+                )
             else:
-                story.append(Paragraph(f'<b>{line}</b>', job_style))
-    
-    # ACHIEVEMENTS
-    if data.get('achievements') and data['achievements'].strip():
-        add_section_header("Achievements")
-        ach_lines = data['achievements'].strip().split('\n')
-        for line in ach_lines:
-            if line.strip():
-                story.append(Paragraph(f'• {line.strip()}', content_style))
-    
-    # TECHNICAL SKILLS
-    if data.get('skills') and data['skills'].strip():
-        add_section_header("Technical Skills")
-        skills_lines = data['skills'].strip().split('\n')
-        for line in skills_lines:
-            if line.strip():
-                if ':' in line:
-                    parts = line.split(':', 1)
-                    # Create RGB values for PDF colors
-                    sec_rgb = pdf_colors["secondary"]
-                    color_r = int(sec_rgb.red * 255)
-                    color_g = int(sec_rgb.green * 255)
-                    color_b = int(sec_rgb.blue * 255)
-                    skill_para = Paragraph(f'<b><font color="rgb({color_r},{color_g},{color_b})">{parts[0].strip()}:</font></b> {parts[1].strip()}', content_style)
-                    story.append(skill_para)
+                st.button(
+                    PREPARE_LABELS[file_format],
+                    key=f"prepare_{file_format}",
+                    on_click=request_format,
+                    args=(file_format,),
+                    use_container_width=True
+                )
+    
+    # Template comparison - switching reruns the whole app so the sidebar, header
+    # and preview follow the new template
+    st.subheader("🔄 Try Other Templates")
+    st.markdown("**Click to switch templates and see different styles:**")
+    
+    template_cols = st.columns(len(RESUME_TEMPLATES))
+    for i, (other_template, other_info) in enumerate(RESUME_TEMPLATES.items()):
+        with template_cols[i]:
+            if st.button(
+                other_template.split()[0],
+                key=f"switch_{i}",
+                help=other_info["description"],
+                type="primary" if other_template == template_name else "secondary"
+            ) and other_template != template_name:
+                st.session_state.selected_template = other_template
+                st.rerun(scope="app")
+    
+    # Every template and format in one zip, rendered in parallel from one parse
+    st.subheader("📦 All Templates")
+    bundle = st.session_state.all_templates
+    if bundle is None or bundle["resume_data"] != st.session_state.resume_data:
+        if st.button("📦 Render All Templates", key="render_all", use_container_width=True):
+            with st.spinner("Rendering every template in both formats..."):
+                render_all_templates(parsed_resume)
+            bundle = st.session_state.all_templates
+    if bundle is not None and bundle["resume_data"] == st.session_state.resume_data:
+        st.download_button(
+            label="📦 Download All Templates (.zip)",
+            data=bundle["zip"],
+            file_name=f"{parsed_resume.name.replace(' ', '_')}_All_Templates.zip",
+            mime="application/zip",
+            key="download_all",
+            use_container_width=True
+        )
+        render_seconds = sum(result.seconds for result in bundle["results"])
+        st.caption(f"{len(bundle['results'])} documents in {bundle['wall_seconds']:.2f}s "
+                   f"({render_seconds:.2f}s of rendering in parallel)")
+        st.dataframe([
+            {
+                "Template": result.template_name,
+                "Format": result.file_format.upper(),
+                "Render ms": "cached" if result.cached else f"{result.seconds * 1000:.0f}",
+                "Size KB": f"{result.size / 1024:.1f}"
+            }
+            for result in sorted(bundle["results"], key=lambda result: list(RESUME_TEMPLATES).index(result.template_name))
+        ], hide_index=True)
+
+# Bullet suggestions: one process-wide engine, so every session shares its cache
+SUGGESTION_WORKERS = 4
+# Longest one run waits on the backend; bullets still waiting show as pending
+SUGGESTION_WAIT_SECONDS = 0.2
+# How often the panel reruns on its own to pick up pending suggestions
+SUGGESTION_POLL_SECONDS = 1.0
+
+@st.cache_resource
+def get_suggestion_engine():
+    """Process-wide suggestion engine; RESUME_SUGGESTION_BACKEND picks a registered backend"""
+    backend = suggestion_backend(os.environ.get("RESUME_SUGGESTION_BACKEND") or DEFAULT_SUGGESTION_BACKEND)
+    return SuggestionEngine(
+        backend, ThreadPoolExecutor(max_workers=SUGGESTION_WORKERS, thread_name_prefix="suggestions")
+    )
+
+@st.fragment(run_every=SUGGESTION_POLL_SECONDS)
+def suggestion_panel(template_name, *texts):
+    """Show a suggestion under each bullet once it arrives; unchanged bullets come from the cache
+    
+    A fragment polling the engine: a run waits at most SUGGESTION_WAIT_SECONDS,
+    so a slow or hung backend leaves bullets pending instead of holding up the page.
+    """
+    with st.expander("✨ Bullet Suggestions"):
+        bullets = list(dict.fromkeys(bullet for text in texts for bullet in bullet_lines(text)))
+        if not bullets:
+            st.caption("Start Projects or Experience lines with • or - to get suggestions for them.")
+            return
+        if not st.checkbox("Suggest improvements as I edit", key="suggest_live"):
+            st.caption(f"{len(bullets)} bullets ready for suggestions.")
+            return
+        placeholders = {bullet: st.empty() for bullet in bullets}
+        for bullet, placeholder in placeholders.items():
+            placeholder.caption(f"⏳ {bullet} - suggestion pending")
+        try:
+            for bullet, suggestion in get_suggestion_engine().stream(bullets, template_name,
+                                                                     timeout=SUGGESTION_WAIT_SECONDS):
+                if isinstance(suggestion, Exception):
+                    placeholders[bullet].warning(f"No suggestion for “{bullet}”: {suggestion}")
+                elif suggestion == bullet:
+                    placeholders[bullet].markdown(f"✅ {bullet}")
                 else:
-                    story.append(Paragraph(line.strip(), content_style))
-    
-    doc.build(story)
-    buffer.seek(0)
-    return buffer
+                    placeholders[bullet].markdown(f"• {bullet}  \n➡️ **{suggestion}**")
+        except FutureTimeoutError:
+            # The rest stay pending; the engine keeps working on them for the next poll
+            pass
+
+def read_uploaded_postings(uploaded_file):
+    """Job postings from an uploaded .jsonl or .csv file, plus (number, error) of each unreadable posting"""
+    text = uploaded_file.getvalue().decode("utf-8")
+    if uploaded_file.name.lower().endswith(".csv"):
+        records = csv.DictReader(io.StringIO(text))
+    else:
+        records = (line for line in text.splitlines() if line.strip())
+    return read_postings(records)
+
+def request_letter_format(file_format):
+    """Remember that the user wants letters in this format; they are rendered from now on"""
+    st.session_state.letter_formats.add(file_format)
+
+def render_letter_bytes(writer, posting, file_format):
+    """Render a cover letter to bytes, serving unchanged letters from the render cache"""
+    key = resume_cache_key(writer.resume, writer.template_name, file_format, letter=posting._asdict(),
+                           date=writer.date)
+    return get_render_cache().get_or_render(key, lambda: writer.render(posting, file_format))
+
+@st.fragment
+def cover_letter_panel():
+    """Cover letters in the selected template, one at a time or a whole batch of postings"""
+    template_name = st.session_state.selected_template
+    parsed_resume = parse_resume(st.session_state.resume_data)
+    with st.expander("✉️ Cover Letters"):
+        st.caption(f"Letters reuse the **{template_name}** colors, fonts and centered header.")
+        company = st.text_input("Company", key="letter_company")
+        role = st.text_input("Role", key="letter_role")
+        addressee = st.text_input("Addressee", key="letter_addressee", placeholder="Hiring Manager")
+        body = st.text_area("Letter body", key="letter_body", height=150,
+                            help="Leave a blank line between paragraphs.")
+        if company.strip() and role.strip():
+            posting = parse_posting({"company": company, "role": role, "addressee": addressee, "paragraphs": body})
+            writer = CoverLetterWriter(parsed_resume, template_name, limits=get_render_limits())
+            # Letters are only rendered for the formats the user asked for, as in the download panel
+            letter_cols = st.columns(len(FORMATS))
+            for file_format, letter_col in zip(FORMATS, letter_cols):
+                with letter_col:
+                    if file_format in st.session_state.letter_formats:
+                        try:
+                            document = render_letter_bytes(writer, posting, file_format)
+                        except RenderLimitError as exc:
+                            st.error(f"❌ {exc}")
+                            continue
+                        st.download_button(
+                            label=DOWNLOAD_LABELS[file_format].replace("Download", "Download Letter"),
+                            data=document,
+                            file_name=letter_filename(parsed_resume.name, posting, file_format),
+                            mime=MIME_TYPES[file_format],
+                            key=f"download_letter_{file_format}",
+                            use_container_width=True
+                        )
+                    else:
+                        st.button(
+                            PREPARE_LABELS[file_format].replace("Prepare", "Prepare Letter"),
+                            key=f"prepare_letter_{file_format}",
+                            on_click=request_letter_format,
+                            args=(file_format,),
+                            use_container_width=True
+                        )
+        else:
+            st.caption("Enter a company and role to write a letter.")
+        
+        st.markdown("**Batch:** one letter per posting (company, role, addressee, paragraphs)")
+        uploaded = st.file_uploader("Job postings (.jsonl or .csv)", type=["jsonl", "csv"], key="letter_postings")
+        if uploaded is None:
+            return
+        # Kept until the upload, template or resume changes, so edits above don't re-render the batch
+        batch_key = (uploaded.file_id, template_name, parsed_resume)
+        batch = st.session_state.get("letter_batch")
+        if batch is None or batch["key"] != batch_key:
+            try:
+                postings, skipped = read_uploaded_postings(uploaded)
+            except ValueError as exc:
+                st.error(f"❌ Could not read the postings: {exc}")
+                return
+            started = time.perf_counter()
+            zip_io = io.BytesIO()
+            written = failed = 0
+            with zipfile.ZipFile(zip_io, "w") as archive:
+                letters = render_cover_letters(parsed_resume, postings, template_name, limits=get_render_limits())
+                for index, posting, documents, error in letters:
+                    if error:
+                        failed += 1
+                        continue
+                    for file_format, document in documents:
+                        archive.writestr(f"{index:05d}_" + letter_filename(parsed_resume.name, posting, file_format),
+                                         document)
+                    written += 1
+            batch = st.session_state.letter_batch = {
+                "key": batch_key, "zip": zip_io.getvalue(), "written": written, "failed": failed + len(skipped),
+                "skipped": skipped, "seconds": time.perf_counter() - started
+            }
+        for number, error in batch["skipped"]:
+            st.warning(f"Skipped posting {number}: {error}")
+        st.download_button(
+            label=f"📦 Download {batch['written']} Letters (.zip)",
+            data=batch["zip"],
+            file_name=f"{parsed_resume.name.replace(' ', '_')}_Cover_Letters.zip",
+            mime="application/zip",
+            key="download_letters",
+            use_container_width=True
+        )
+        st.caption(f"Wrote letters for {batch['written']} postings in {batch['seconds']:.2f}s"
+                   + (f" ({batch['failed']} failed)" if batch["failed"] else ""))
 
 # Initialize session state
 if 'resume_data' not in st.session_state:
     st.session_state.resume_data = None
 if 'selected_template' not in st.session_state:
     st.session_state.selected_template = "Classic Professional"
+if 'requested_formats' not in st.session_state:
+    st.session_state.requested_formats = set()
+if 'letter_formats' not in st.session_state:
+    st.session_state.letter_formats = set()
+if 'all_templates' not in st.session_state:
+    st.session_state.all_templates = None
+if 'draft_id' not in st.session_state:
+    restore_draft()
 
 # TEMPLATE SELECTION SIDEBAR
 st.sidebar.header("🎨 Choose Your Resume Template")
@@ -578,7 +492,7 @@ st.sidebar.markdown(f"**Style:** {template_info['header_style'].replace('_', ' '
 colors_scheme = template_info["color_scheme"]
 st.sidebar.markdown("**Color Scheme:**")
 
-# Convert RGBColors to RGB tuples
+# Convert hex colors to RGB tuples
 primary_rgb = rgbcolor_to_rgb(colors_scheme["primary"])
 secondary_rgb = rgbcolor_to_rgb(colors_scheme["secondary"])
 accent_rgb = rgbcolor_to_rgb(colors_scheme["accent"])
@@ -594,34 +508,62 @@ with col3:
     st.markdown(f'<div style="background-color:rgb({accent_rgb[0]},{accent_rgb[1]},{accent_rgb[2]}); height:20px; border-radius:3px;"></div>', unsafe_allow_html=True)
     st.caption("Accent")
 
+st.sidebar.caption("💾 Your draft is saved automatically - bookmark this page to pick up where you left off.")
+
 # Highlight the centered alignment feature
 st.sidebar.markdown("---")
 st.sidebar.info("📍 **Contact Info**: Name, email, phone, location, LinkedIn, and GitHub are **always centered** in all templates for professional appearance!")
 
+# Render metrics for debugging; showing the panel is per session, while stage timing
+# is a server-side setting (RESUME_RENDER_METRICS=1) shared by every session
+st.sidebar.markdown("---")
+if st.sidebar.checkbox("🛠️ Show render metrics", key="show_render_metrics"):
+    st.sidebar.caption("Render cache")
+    st.sidebar.json(get_render_cache().stats())
+    st.sidebar.caption(f"Rendering backends loaded: {', '.join(loaded_backends()) or 'none'}")
+    stage_rows = [
+        {key: value for key, value in series.items() if key != "buckets"}
+        for series in METRICS.snapshot()
+    ]
+    if not metrics_enabled():
+        st.sidebar.caption("Render stage timing is off - start the app with RESUME_RENDER_METRICS=1 to collect it.")
+    elif stage_rows:
+        st.sidebar.caption("Render stages")
+        st.sidebar.dataframe(stage_rows, hide_index=True)
+        st.sidebar.download_button("📊 Prometheus metrics", METRICS.to_prometheus(),
+                                   file_name="render_metrics.prom", mime="text/plain")
+        st.sidebar.download_button("📊 JSON metrics", METRICS.to_json(),
+                                   file_name="render_metrics.json", mime="application/json")
+    else:
+        st.sidebar.caption("No renders timed yet - generate a resume and prepare a download.")
+
 # MAIN INTERFACE
 col1, col2 = st.columns([1, 1])
 
 with col1:
     st.header(f"📝 {selected_template} Resume")
+    import_uploaded_resume()
     
     # Personal Information
     st.subheader("👤 Personal Information")
     st.info("📍 All contact information will be **centered** in your resume")
     
-    name = st.text_input("Full Name *", placeholder="Your Full Name")
-    email = st.text_input("Email *", placeholder="your.email@example.com")
-    phone = st.text_input("Phone *", placeholder="+1 (555) 123-4567")
-    location = st.text_input("Location *", placeholder="City, State")
+    name = st.text_input("Full Name *", key="field_name", placeholder="Your Full Name")
+    email = st.text_input("Email *", key="field_email", placeholder="your.email@example.com")
+    phone = st.text_input("Phone *", key="field_phone", placeholder="+1 (555) 123-4567")
+    location = st.text_input("Location *", key="field_location", placeholder="City, State")
     
     # Enhanced LinkedIn and GitHub inputs with better descriptions
     st.markdown("**🔗 Professional Links** (will appear as clickable words)")
     linkedin = st.text_input(
         "LinkedIn Profile", 
+        key="field_linkedin",
         placeholder="linkedin.com/in/yourname or full URL",
         help="Enter your LinkedIn URL (with or without https://). It will appear as 'LinkedIn' in your resume."
     )
     github = st.text_input(
         "GitHub Profile", 
+        key="field_github",
         placeholder="github.com/yourname or full URL",
         help="Enter your GitHub URL (with or without https://). It will appear as 'GitHub' in your resume."
     )
@@ -630,6 +572,7 @@ with col1:
     st.subheader("🎓 Education")
     education = st.text_area(
         "Education Details *", 
+        key="field_education",
         placeholder="""University Name
 Bachelor/Master of [Degree] in [Field]
 GPA: X.XX/4.0 (if above 3.5)
@@ -641,6 +584,7 @@ Graduation: Month Year""",
     st.subheader("🚀 Projects")
     projects = st.text_area(
         "Projects", 
+        key="field_projects",
         placeholder="""Project Name:
 • Brief description of what the project does
 • Technologies used and your role
@@ -656,6 +600,7 @@ Another Project:
     st.subheader("💼 Professional Experience")
     experience = st.text_area(
         "Experience", 
+        key="field_experience",
         placeholder="""Job Title - Company Name (Start Date - End Date)
 • Achieved specific result using particular method/technology
 • Led/developed/improved something with quantifiable impact
@@ -667,6 +612,7 @@ Another Project:
     st.subheader("🏆 Achievements")
     achievements = st.text_area(
         "Achievements", 
+        key="field_achievements",
         placeholder="""Award/Recognition - Description and year
 Publication - Title and publication details
 Competition - Placement and competition name
@@ -678,12 +624,28 @@ Certification - Name and issuing organization""",
     st.subheader("💻 Technical Skills")
     skills = st.text_area(
         "Technical Skills", 
+        key="field_skills",
         placeholder="""Programming Languages: Python, Java, JavaScript
 Frameworks & Libraries: React, Django, TensorFlow
 Databases: MySQL, PostgreSQL, MongoDB
 Tools & Technologies: Git, Docker, AWS""",
         height=100
     )
+    
+    # Filled in at the end of the script, once the preview and downloads are out
+    suggestions_slot = st.container()
+
+form_data = {
+    'name': name, 'email': email, 'phone': phone, 'location': location,
+    'linkedin': linkedin, 'github': github, 'education': education, 'projects': projects,
+    'experience': experience, 'achievements': achievements, 'skills': skills
+}
+# Oversized input is caught here, before it reaches the preview or any renderer
+size_error = resume_size_error(form_data)
+
+# Only changed fields are queued; the write happens once the user pauses typing
+if any(value.strip() for value in form_data.values()):
+    get_draft_autosaver().record(st.session_state.draft_id, {**form_data, 'template': selected_template})
 
 with col2:
     st.header("📄 Resume Preview & Download")
@@ -699,10 +661,30 @@ with col2:
         if github:
             st.markdown(f"- **GitHub** → {format_url(github)}")
     
+    # Live preview of the form as it stands; only edited sections are re-rendered
+    with st.expander("👀 Live Preview", expanded=True):
+        if size_error:
+            st.warning(f"⚠️ {size_error} - the preview is paused until it is shortened.")
+        elif any(value.strip() for value in form_data.values()):
+            preview_started = time.perf_counter()
+            try:
+                preview_html = create_template_html(parse_resume(form_data), selected_template,
+                                                    limits=get_render_limits())
+            except RenderLimitError as exc:
+                st.warning(f"⚠️ {exc} - the preview is paused.")
+            else:
+                preview_ms = (time.perf_counter() - preview_started) * 1000
+                st.markdown(preview_html, unsafe_allow_html=True)
+                st.caption(f"Preview of {selected_template} rendered in {preview_ms:.1f} ms - download for the exact layout")
+        else:
+            st.caption("Start filling in the form to see your resume here.")
+    
     if st.button(f"🚀 Generate {selected_template} Resume", type="primary"):
         # Validation
         required_fields = [name, email, phone, location, education]
-        if all(field.strip() for field in required_fields):
+        if size_error:
+            st.error(f"❌ {size_error} - shorten it to generate your resume")
+        elif all(field.strip() for field in required_fields):
             resume_data = {
                 'name': name,
                 'email': email,
@@ -718,57 +700,22 @@ with col2:
             }
             
             st.success(f"✅ {selected_template} resume generated successfully with centered contact info!")
-            st.session_state.resume_data = resume_data
-            
+            get_draft_autosaver().flush(st.session_state.draft_id)
+            if resume_data != st.session_state.resume_data:
+                st.session_state.resume_data = resume_data
+                # New data supersedes any speculative renders of the old resume
+                speculate_other_templates()
+        
         else:
             st.error("❌ Please fill all required fields (marked with *)")
     
     # Download section
     if st.session_state.resume_data:
-        st.subheader("📥 Download Your Resume")
-        
-        col_word, col_pdf = st.columns(2)
-        
-        with col_word:
-            word_doc = create_template_word_doc(st.session_state.resume_data, selected_template)
-            # Fixed file name generation
-            clean_name = st.session_state.resume_data['name'].replace(' ', '_')
-            clean_template = selected_template.replace(' ', '_')
-            word_filename = f"{clean_name}_{clean_template}_Resume.docx"
-            
-            st.download_button(
-                label="📄 Download Word (.docx)",
-                data=word_doc.getvalue(),
-                file_name=word_filename,
-                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                use_container_width=True
-            )
-        
-        with col_pdf:
-            pdf_doc = create_template_pdf(st.session_state.resume_data, selected_template)
-            # Fixed file name generation
-            clean_name = st.session_state.resume_data['name'].replace(' ', '_')
-            clean_template = selected_template.replace(' ', '_')
-            pdf_filename = f"{clean_name}_{clean_template}_Resume.pdf"
-            
-            st.download_button(
-                label="📑 Download PDF",
-                data=pdf_doc.getvalue(),
-                file_name=pdf_filename,
-                mime="application/pdf",
-                use_container_width=True
-            )
-        
-        # Template comparison
-        st.subheader("🔄 Try Other Templates")
-        st.markdown("**Click to switch templates and see different styles:**")
-        
-        template_cols = st.columns(5)
-        for i, (template_name, template_info) in enumerate(RESUME_TEMPLATES.items()):
-            with template_cols[i]:
-                if st.button(template_name.split()[0], key=f"switch_{i}", help=template_info["description"]):
-                    st.session_state.selected_template = template_name
-                    st.rerun()
+        download_panel()
+        cover_letter_panel()
+
+with suggestions_slot:
+    suggestion_panel(selected_template, projects, experience)
 
 # Template Comparison Table
 st.markdown("---")
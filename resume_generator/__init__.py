@@ -0,0 +1,165 @@
+"""Resume rendering library behind the Streamlit app and the batch CLI
+
+Public names are resolved lazily (PEP 562), so importing the package is cheap:
+python-docx and ReportLab are only imported once a renderer that needs them runs.
+"""
+
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # batch
+    "load_record": "batch",
+    # cache
+    "RENDERER_VERSION": "cache",
+    "RenderCache": "cache",
+    "resume_cache_key": "cache",
+    # cover_letter
+    "CoverLetterWriter": "cover_letter",
+    "JobPosting": "cover_letter",
+    "create_cover_letter_docx": "cover_letter",
+    "create_cover_letter_pdf": "cover_letter",
+    "letter_filename": "cover_letter",
+    "parse_posting": "cover_letter",
+    "read_postings": "cover_letter",
+    "render_cover_letters": "cover_letter",
+    # deterministic
+    "FIXED_DATETIME": "deterministic",
+    "content_hash": "deterministic",
+    "etag": "deterministic",
+    "etag_matches": "deterministic",
+    "normalize_zip": "deterministic",
+    "zip_entry": "deterministic",
+    # docx_fast
+    "create_fast_word_doc": "docx_fast",
+    # docx_renderer
+    "DOCX_STYLES": "docx_renderer",
+    "DocxStyles": "docx_renderer",
+    "add_colored_line_after_paragraph": "docx_renderer",
+    "add_hyperlink_to_paragraph": "docx_renderer",
+    "create_template_word_doc": "docx_renderer",
+    "docx_skeleton": "docx_renderer",
+    "new_template_document": "docx_renderer",
+    # drafts
+    "DraftAutosaver": "drafts",
+    "DraftStore": "drafts",
+    "drafts_path_from_env": "drafts",
+    "new_draft_id": "drafts",
+    # fanout
+    "FanoutResult": "fanout",
+    "render_all": "fanout",
+    "write_fanout_zip": "fanout",
+    # fonts
+    "FONT_FILES": "fonts",
+    "PdfFonts": "fonts",
+    "find_font_files": "fonts",
+    "pdf_fonts": "fonts",
+    # html_renderer
+    "HTML_STYLES": "html_renderer",
+    "HtmlStyles": "html_renderer",
+    "create_template_html": "html_renderer",
+    "html_cache_info": "html_renderer",
+    # importer
+    "IMPORT_FORMATS": "importer",
+    "ImportResult": "importer",
+    "import_files": "importer",
+    "import_resume": "importer",
+    "iter_sources": "importer",
+    "ResumeImportError": "importer",
+    "resume_from_lines": "importer",
+    # limits
+    "DEFAULT_LIMITS": "limits",
+    "RenderBudget": "limits",
+    "RenderCancelled": "limits",
+    "RenderLimitError": "limits",
+    "RenderLimits": "limits",
+    "RenderTimeout": "limits",
+    "check_resume_limits": "limits",
+    "current_budget": "limits",
+    "limits_from_env": "limits",
+    "render_budget": "limits",
+    # matching
+    "Match": "matching",
+    "MatchIndex": "matching",
+    "job_terms": "matching",
+    "resume_terms": "matching",
+    # metrics
+    "METRICS": "metrics",
+    "RenderMetrics": "metrics",
+    "StageTimer": "metrics",
+    "add_stage_observer": "metrics",
+    "enable_metrics": "metrics",
+    "metrics_enabled": "metrics",
+    "remove_stage_observer": "metrics",
+    "stage_timer": "metrics",
+    # model
+    "ENTRY_BULLET": "model",
+    "ENTRY_HEADING": "model",
+    "ENTRY_ITEM": "model",
+    "ENTRY_SKILL": "model",
+    "ENTRY_TEXT": "model",
+    "ParsedResume": "model",
+    "ResumeEntry": "model",
+    "ResumeSection": "model",
+    "as_parsed_resume": "model",
+    "parse_resume": "model",
+    # pdf_renderer
+    "PDF_STYLES": "pdf_renderer",
+    "PdfStyles": "pdf_renderer",
+    "SectionBand": "pdf_renderer",
+    "create_template_pdf": "pdf_renderer",
+    "pdf_styles": "pdf_renderer",
+    # prerender
+    "SpeculativeRenderer": "prerender",
+    # rendering
+    "BACKEND_MODULES": "rendering",
+    "DEFAULT_DOCX_ENGINE": "rendering",
+    "DEFAULT_PDF_PROFILE": "rendering",
+    "DOCX_ENGINES": "rendering",
+    "FORMATS": "rendering",
+    "MIME_TYPES": "rendering",
+    "PDF_PROFILES": "rendering",
+    "PDF_RENDERER": "rendering",
+    "REQUIRED_FIELDS": "rendering",
+    "RESUME_FIELDS": "rendering",
+    "CountingWriter": "rendering",
+    "document_filename": "rendering",
+    "loaded_backends": "rendering",
+    "missing_required_fields": "rendering",
+    "render_document": "rendering",
+    "render_to": "rendering",
+    "render_view": "rendering",
+    # store
+    "ArtifactStore": "store",
+    "DiskArtifactStore": "store",
+    "store_from_env": "store",
+    # suggestions
+    "DEFAULT_SUGGESTION_BACKEND": "suggestions",
+    "LocalSuggestionBackend": "suggestions",
+    "SUGGESTION_BACKENDS": "suggestions",
+    "SuggestionBackend": "suggestions",
+    "SuggestionEngine": "suggestions",
+    "bullet_lines": "suggestions",
+    "register_suggestion_backend": "suggestions",
+    "suggestion_backend": "suggestions",
+    "suggestion_key": "suggestions",
+    # templates
+    "RESUME_TEMPLATES": "templates",
+    "format_url": "templates",
+    "rgbcolor_to_rgb": "templates"
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    """Import the submodule defining a public name on first access"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Public names, including those not imported yet"""
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,245 @@
+"""Headless batch rendering of many resumes across a process pool
+
+Usage:
+    python -m resume_generator records.jsonl -o out/ --templates all --workers 8
+    python -m resume_generator records.csv -o resumes.zip --formats pdf
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import traceback
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import NamedTuple
+
+from .deterministic import zip_entry
+from .limits import limits_from_env
+from .model import parse_resume
+from .rendering import (
+    DEFAULT_DOCX_ENGINE,
+    DEFAULT_PDF_PROFILE,
+    DOCX_ENGINES,
+    FORMATS,
+    PDF_PROFILES,
+    RESUME_FIELDS,
+    document_filename,
+    missing_required_fields,
+    render_document,
+    render_to,
+)
+from .templates import RESUME_TEMPLATES
+
+class RecordResult(NamedTuple):
+    """Outcome of rendering one input record"""
+    index: int
+    record_id: str
+    outputs: tuple  # (arcname, bytes) pairs for zip output, file paths for directory output
+    error: str = ""
+    seconds: float = 0.0
+
+def read_records(path):
+    """Yield raw records from a .jsonl or .csv file ('-' reads JSONL from stdin)
+    
+    CSV rows are dicts; JSONL lines are yielded undecoded, so a malformed line
+    fails only its own record when load_record decodes it.
+    """
+    if path.lower().endswith('.csv'):
+        with open(path, newline='', encoding='utf-8') as csv_file:
+            for row in csv.DictReader(csv_file):
+                yield row
+        return
+    
+    json_file = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    try:
+        for line in json_file:
+            if line.strip():
+                yield line
+    finally:
+        if json_file is not sys.stdin:
+            json_file.close()
+
+def load_record(record):
+    """resume_data dict of a raw record from read_records; ValueError when it is not a JSON object"""
+    if isinstance(record, str):
+        record = json.loads(record)
+    if not isinstance(record, dict):
+        raise ValueError(f"record is a JSON {type(record).__name__}, not an object")
+    return record
+
+def _record_id(index, record):
+    """Identifier used in failure reports: the record's own id, else its position"""
+    return str(record.get('id') or index)
+
+def render_record(index, record, template_names, formats, output_dir=None, docx_engine=DEFAULT_DOCX_ENGINE,
+                  pdf_profile=DEFAULT_PDF_PROFILE, deterministic=False, limits=None):
+    """Render one record to every requested template and format, capturing failures
+    
+    With limits (a RenderLimits) an oversized record fails before rendering, and
+    each document stops once past its time budget or page limit.
+    """
+    started = time.perf_counter()
+    record_id = str(index)
+    outputs = []
+    try:
+        record = load_record(record)
+        record_id = _record_id(index, record)
+        missing = missing_required_fields(record)
+        if missing:
+            raise ValueError(f"missing required fields: {', '.join(missing)}")
+        data = {field: record.get(field) or "" for field in RESUME_FIELDS}
+        resume = parse_resume(data)
+        
+        for template_name in template_names:
+            for file_format in formats:
+                arcname = f"{index:05d}_" + document_filename(data['name'], template_name, file_format)
+                if output_dir is None:
+                    outputs.append((arcname, render_document(
+                        resume, template_name, file_format, docx_engine, pdf_profile, deterministic, limits
+                    )))
+                else:
+                    # Workers stream straight into their own files, so documents never
+                    # cross the process boundary or sit in memory as a second copy
+                    path = os.path.join(output_dir, arcname)
+                    outputs.append(path)
+                    with open(path, 'wb') as output_file:
+                        render_to(resume, template_name, file_format, output_file, docx_engine, pdf_profile,
+                                  deterministic, limits)
+        return RecordResult(index, record_id, tuple(outputs), seconds=time.perf_counter() - started)
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}\n{traceback.format_exc(limit=3)}"
+        if output_dir is not None:
+            # A failed record leaves no partial set of documents behind
+            for path in outputs:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        return RecordResult(index, record_id, (), error=error, seconds=time.perf_counter() - started)
+
+def render_records(records, template_names, formats, output_dir=None, workers=None, max_pending=None,
+                   docx_engine=DEFAULT_DOCX_ENGINE, pdf_profile=DEFAULT_PDF_PROFILE, deterministic=False, limits=None):
+    """Render records across a process pool, yielding RecordResults as they complete
+    
+    At most max_pending records are in flight at once, so memory stays bounded no
+    matter how large the input is. With deterministic=True results are yielded
+    in input order instead, so archives built from them are reproducible too.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for index, record in enumerate(records):
+            yield render_record(
+                index, record, template_names, formats, output_dir, docx_engine, pdf_profile, deterministic, limits
+            )
+        return
+    
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = (
+            executor.submit(
+                render_record, index, record, template_names, formats, output_dir, docx_engine, pdf_profile,
+                deterministic, limits
+            )
+            for index, record in enumerate(records)
+        )
+        if deterministic:
+            ordered = deque()
+            for future in futures:
+                ordered.append(future)
+                if len(ordered) >= max_pending:
+                    yield ordered.popleft().result()
+            while ordered:
+                yield ordered.popleft().result()
+            return
+        
+        pending = set()
+        for future in futures:
+            pending.add(future)
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+def _parse_templates(values):
+    """Resolve --templates to template names, where 'all' means every template"""
+    if not values or values == ["all"]:
+        return list(RESUME_TEMPLATES)
+    unknown = [name for name in values if name not in RESUME_TEMPLATES]
+    if unknown:
+        raise SystemExit(f"Unknown template(s): {', '.join(unknown)}. Choose from: {', '.join(RESUME_TEMPLATES)}")
+    return values
+
+def build_parser():
+    """Command line interface of the batch renderer"""
+    parser = argparse.ArgumentParser(
+        prog="python -m resume_generator",
+        description="Render resumes in bulk from JSONL or CSV records with the same fields as resume_data."
+    )
+    parser.add_argument("input", help="Input .jsonl or .csv file ('-' reads JSONL from stdin)")
+    parser.add_argument("-o", "--output", required=True, help="Output directory, or a path ending in .zip")
+    parser.add_argument("-t", "--templates", nargs="+", default=["all"], metavar="TEMPLATE",
+                        help="Template names to render, or 'all' (default)")
+    parser.add_argument("-f", "--formats", nargs="+", choices=FORMATS, default=list(FORMATS),
+                        help="Document formats to render (default: docx pdf)")
+    parser.add_argument("--docx-engine", choices=list(DOCX_ENGINES), default=DEFAULT_DOCX_ENGINE,
+                        help=f"DOCX writer to use (default: {DEFAULT_DOCX_ENGINE})")
+    parser.add_argument("--pdf-profile", choices=list(PDF_PROFILES), default=DEFAULT_PDF_PROFILE,
+                        help=f"PDF output profile; 'compact' for archiving (default: {DEFAULT_PDF_PROFILE})")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Byte-identical documents and archives for identical input (fixed timestamps, "
+                             "IDs and order)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    return parser
+
+def main(argv=None):
+    """Render every input record and report per-record failures; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    template_names = _parse_templates(args.templates)
+    to_zip = args.output.lower().endswith('.zip')
+    output_dir = None
+    if not to_zip:
+        output_dir = args.output
+        os.makedirs(output_dir, exist_ok=True)
+    
+    started = time.perf_counter()
+    rendered = failed = documents = 0
+    archive = zipfile.ZipFile(args.output, 'w') if to_zip else None
+    try:
+        results = render_records(
+            read_records(args.input), template_names, args.formats, output_dir, args.workers,
+            docx_engine=args.docx_engine, pdf_profile=args.pdf_profile, deterministic=args.deterministic,
+            limits=limits_from_env()
+        )
+        for result in results:
+            if result.error:
+                failed += 1
+                print(f"[FAILED] record {result.record_id}: {result.error}", file=sys.stderr)
+                continue
+            rendered += 1
+            documents += len(result.outputs)
+            if archive is not None:
+                for arcname, document in result.outputs:
+                    # DOCX files are already zip archives, so only PDFs are worth deflating
+                    compression = zipfile.ZIP_DEFLATED if arcname.endswith('.pdf') else zipfile.ZIP_STORED
+                    entry = zip_entry(arcname, compression) if args.deterministic else arcname
+                    archive.writestr(entry, document, compress_type=compression)
+    finally:
+        if archive is not None:
+            archive.close()
+    
+    elapsed = time.perf_counter() - started
+    print(f"Rendered {documents} documents for {rendered} records in {elapsed:.2f}s "
+          f"({failed} failed) -> {args.output}", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
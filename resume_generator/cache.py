@@ -0,0 +1,108 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+# Bump whenever the generated documents change so cached renders are invalidated
+RENDERER_VERSION = "4"
+
+def resume_cache_key(resume, template_name, file_format, **render_options):
+    """Stable content hash of the parsed resume, template, format, render options and renderer version"""
+    payload = json.dumps(
+        {
+            "resume": resume,
+            "template": template_name,
+            "format": file_format,
+            "options": render_options,
+            "renderer_version": RENDERER_VERSION
+        },
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class RenderCache:
+    """Bounded LRU cache of rendered documents with hit/miss counters
+    
+    An optional ArtifactStore (see store.py) is a second tier behind memory:
+    misses are looked up there and puts are written through, so processes
+    sharing the store reuse each other's renders.
+    """
+    
+    def __init__(self, max_entries=64, max_bytes=32 * 1024 * 1024, store=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def __contains__(self, key):
+        """Whether key is cached, without touching recency or counters"""
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.store is not None and key in self.store
+    
+    def get(self, key):
+        """Return cached bytes for key (marking them recently used) or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        if self.store is None:
+            return None
+        value = self.store.get(key)
+        if value is not None:
+            self._remember(key, value)
+        return value
+    
+    def put(self, key, value):
+        """Store rendered bytes, evicting least recently used entries to stay in bounds"""
+        if self.store is not None:
+            self.store.put(key, value)
+        self._remember(key, value)
+    
+    def _remember(self, key, value):
+        """Keep rendered bytes in memory, evicting least recently used entries to stay in bounds"""
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += len(value)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+    
+    def get_or_render(self, key, render):
+        """Return cached bytes for key, calling render() and caching its result on a miss"""
+        value = self.get(key)
+        if value is None:
+            # Render outside the lock so one slow document doesn't block other sessions
+            value = render()
+            self.put(key, value)
+        return value
+    
+    def stats(self):
+        """Snapshot of cache counters, with the store's under "store" when there is one"""
+        with self._lock:
+            stats = {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+        if self.store is not None:
+            stats["store"] = self.store.stats()
+        return stats
@@ -0,0 +1,317 @@
+"""Cover letters in the resume templates' colors, fonts and centered header
+
+Usage:
+    python -m resume_generator.cover_letter resume.json postings.jsonl -o letters.zip --template "Modern Blue"
+
+Every job posting (company, role, addressee, body paragraphs) becomes one
+letter under the resume's name and contact header. CoverLetterWriter parses the
+resume and serializes that header once, so a batch only pays for each letter's
+own paragraphs; in parallel runs every worker process builds its writer once.
+DOCX letters come from the direct WordprocessingML writer and never load
+python-docx; PDF letters load ReportLab on first use.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from itertools import repeat
+from typing import NamedTuple
+
+from .batch import load_record, read_records
+from .docx_fast import FAST_DOCX_STYLES, header_xml, paragraph_xml, run_xml, write_docx_package
+from .limits import check_resume_limits, limits_from_env, render_budget
+from .model import as_parsed_resume
+from .rendering import DEFAULT_PDF_PROFILE, FORMATS, PDF_PROFILES, RESUME_FIELDS, missing_required_fields
+from .templates import RESUME_TEMPLATES
+
+DEFAULT_ADDRESSEE = "Hiring Manager"
+CLOSING = "Sincerely,"
+
+# 8pt after each letter paragraph, so paragraphs read as blocks
+LETTER_PPR_XML = '<w:pPr><w:spacing w:after="160"/></w:pPr>'
+
+# Postings sent to a worker process per task
+POSTINGS_PER_TASK = 32
+
+class JobPosting(NamedTuple):
+    """One letter to write: who it goes to, for which role, and what it says"""
+    company: str
+    role: str
+    addressee: str = DEFAULT_ADDRESSEE
+    paragraphs: tuple = ()
+    date: str = ""  # Letter date; the writer's date (today by default) when empty
+    posting_id: str = ""
+
+def _paragraphs(value):
+    """Body paragraphs from a list, or from text with blank lines between paragraphs"""
+    if isinstance(value, (list, tuple)):
+        return tuple(str(paragraph).strip() for paragraph in value if str(paragraph).strip())
+    blocks = re.split(r'\n\s*\n', (value or "").strip())
+    return tuple(' '.join(line.strip() for line in block.splitlines()) for block in blocks if block.strip())
+
+def parse_posting(record):
+    """JobPosting from a JSONL/CSV record; company and role are required"""
+    company = str(record.get('company') or "").strip()
+    role = str(record.get('role') or "").strip()
+    if not company or not role:
+        raise ValueError("job posting needs both a company and a role")
+    return JobPosting(
+        company=company,
+        role=role,
+        addressee=str(record.get('addressee') or "").strip() or DEFAULT_ADDRESSEE,
+        paragraphs=_paragraphs(record.get('paragraphs')),
+        date=str(record.get('date') or "").strip(),
+        posting_id=str(record.get('id') or "")
+    )
+
+def read_postings(records):
+    """JobPostings of raw records (see batch.read_records), plus (number, error) of each unreadable one
+    
+    Records are numbered from 1. One malformed posting is skipped and reported
+    without failing the others.
+    """
+    postings, skipped = [], []
+    for number, record in enumerate(records, 1):
+        try:
+            postings.append(parse_posting(load_record(record)))
+        except ValueError as exc:
+            skipped.append((number, str(exc)))
+    return postings, skipped
+
+def letter_date(day=None):
+    """Date line such as "March 5, 2025" """
+    day = day or datetime.date.today()
+    return f"{day:%B} {day.day}, {day.year}"
+
+def letter_filename(name, posting, file_format):
+    """Download file name such as Jane_Doe_Acme_Data_Engineer_Cover_Letter.pdf"""
+    parts = [name, posting.company, posting.role]
+    clean = '_'.join(re.sub(r'[^\w.-]+', '_', part).strip('_') for part in parts)
+    return f"{clean}_Cover_Letter.{file_format}"
+
+class CoverLetterWriter:
+    """Writes letters for many postings from one parsed resume and one template
+    
+    With limits (a RenderLimits) an oversized resume or posting is rejected, and
+    each letter stops once past its time budget or page limit.
+    """
+    
+    def __init__(self, data, template_name, date=None, embed_fonts=True, pdf_profile=DEFAULT_PDF_PROFILE,
+                 deterministic=False, limits=None):
+        if pdf_profile not in PDF_PROFILES:
+            raise ValueError(f"Unknown PDF profile: {pdf_profile}")
+        self.resume = as_parsed_resume(data)
+        self.limits = limits
+        if limits is not None:
+            check_resume_limits(self.resume, limits)
+        self.template_name = template_name
+        self.date = date or letter_date()
+        self.embed_fonts = embed_fonts
+        self.pdf_profile = pdf_profile
+        self.deterministic = deterministic
+        # Header paragraphs and styles are serialized once and shared by every DOCX letter
+        self._docx_styles = FAST_DOCX_STYLES[template_name]
+        self._docx_header, self._docx_links = header_xml(self.resume, self._docx_styles)
+        self._pdf_writer = None
+    
+    def letter_lines(self, posting):
+        """(role, text) of each letter block in order; role is "heading" or "body" """
+        return [
+            ("body", posting.date or self.date),
+            ("body", posting.addressee),
+            ("body", posting.company),
+            ("heading", f"Re: {posting.role}"),
+            ("body", f"Dear {posting.addressee},"),
+            *(("body", paragraph) for paragraph in posting.paragraphs),
+            ("body", CLOSING),
+            ("heading", self.resume.name)
+        ]
+    
+    def write_docx(self, posting, output=None):
+        """Write one DOCX letter to output (or a new BytesIO); returns the sink"""
+        styles = self._docx_styles
+        rprs = {"heading": styles.heading_rpr, "body": styles.body_rpr}
+        body = list(self._docx_header)
+        body += [paragraph_xml(LETTER_PPR_XML, run_xml(text, rprs[role])) for role, text in self.letter_lines(posting)]
+        return write_docx_package(body, self._docx_links, styles, output, self.deterministic)
+    
+    def write_pdf(self, posting, output=None):
+        """Write one PDF letter to output (or a new BytesIO); returns the sink"""
+        if self._pdf_writer is None:
+            self._pdf_writer = import_module(".cover_letter_pdf", __package__).PdfLetterWriter(
+                self.resume, self.template_name, self.embed_fonts, self.pdf_profile, self.deterministic
+            )
+        return self._pdf_writer.write(self.letter_lines(posting), output)
+    
+    def write(self, posting, file_format, output=None):
+        """Write one letter in the given format; returns the sink"""
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown document format: {file_format}")
+        if self.limits is not None:
+            check_resume_limits({
+                "company": posting.company,
+                "role": posting.role,
+                "addressee": posting.addressee,
+                "paragraphs": "\n".join(posting.paragraphs)
+            }, self.limits)
+        with render_budget(self.limits):
+            if file_format == "docx":
+                return self.write_docx(posting, output)
+            return self.write_pdf(posting, output)
+    
+    def render(self, posting, file_format):
+        """Bytes of one letter in the given format"""
+        return self.write(posting, file_format).getvalue()
+
+def create_cover_letter_docx(data, posting, template_name, output=None, **options):
+    """Write a single DOCX cover letter; see CoverLetterWriter for batches"""
+    return CoverLetterWriter(data, template_name, **options).write_docx(posting, output)
+
+def create_cover_letter_pdf(data, posting, template_name, output=None, **options):
+    """Write a single PDF cover letter; see CoverLetterWriter for batches"""
+    return CoverLetterWriter(data, template_name, **options).write_pdf(posting, output)
+
+# Each worker process keeps the writer it built in _init_worker
+_worker_writer = None
+
+def _init_worker(data, template_name, writer_options):
+    global _worker_writer
+    _worker_writer = CoverLetterWriter(data, template_name, **writer_options)
+
+def _render_chunk(chunk, formats, writer=None):
+    """Render a chunk of (index, posting) pairs: [(index, posting, ((format, bytes), ...), error)]"""
+    writer = writer or _worker_writer
+    results = []
+    for index, posting in chunk:
+        try:
+            documents = tuple((file_format, writer.render(posting, file_format)) for file_format in formats)
+            results.append((index, posting, documents, ""))
+        except Exception as exc:
+            results.append((index, posting, (), f"{type(exc).__name__}: {exc}"))
+    return results
+
+def _chunks(postings, size):
+    chunk = []
+    for index, posting in enumerate(postings):
+        chunk.append((index, posting))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def render_cover_letters(data, postings, template_name, formats=FORMATS, workers=1, **writer_options):
+    """Render letters for an iterable of JobPostings, yielding (index, posting, documents, error)
+    
+    documents is a tuple of (format, bytes). With workers > 1 postings are sent
+    in chunks to a process pool whose workers each build one CoverLetterWriter.
+    """
+    resume = as_parsed_resume(data)
+    if workers <= 1:
+        writer = CoverLetterWriter(resume, template_name, **writer_options)
+        for chunk in _chunks(postings, POSTINGS_PER_TASK):
+            yield from _render_chunk(chunk, formats, writer)
+        return
+    
+    # The date is fixed up front so letters from every worker agree on it
+    writer_options.setdefault("date", letter_date())
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(resume, template_name, writer_options)) as executor:
+        for results in executor.map(_render_chunk, _chunks(postings, POSTINGS_PER_TASK), repeat(formats)):
+            yield from results
+
+def read_resume(path):
+    """resume_data from a JSON file ('-' reads stdin), checking required fields"""
+    if path == '-':
+        record = json.load(sys.stdin)
+    else:
+        with open(path, encoding='utf-8') as json_file:
+            record = json.load(json_file)
+    missing = missing_required_fields(record)
+    if missing:
+        raise SystemExit(f"Resume is missing required fields: {', '.join(missing)}")
+    return {field: record.get(field) or "" for field in RESUME_FIELDS}
+
+def build_parser():
+    """Command line interface of the cover letter batch"""
+    parser = argparse.ArgumentParser(
+        prog="python -m resume_generator.cover_letter",
+        description="Write one cover letter per job posting, styled like the resume template."
+    )
+    parser.add_argument("resume", help="Resume JSON file with the resume_data fields ('-' reads stdin)")
+    parser.add_argument("postings", help="Job postings as .jsonl or .csv (company, role, addressee, paragraphs)")
+    parser.add_argument("-o", "--output", required=True, help="Output directory, or a path ending in .zip")
+    parser.add_argument("-t", "--template", choices=list(RESUME_TEMPLATES), default=next(iter(RESUME_TEMPLATES)))
+    parser.add_argument("-f", "--formats", nargs="+", choices=FORMATS, default=list(FORMATS),
+                        help="Document formats to write (default: docx pdf)")
+    parser.add_argument("--pdf-profile", choices=list(PDF_PROFILES), default=DEFAULT_PDF_PROFILE,
+                        help=f"PDF output profile (default: {DEFAULT_PDF_PROFILE})")
+    parser.add_argument("--date", help="Date line of every letter (default: today)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Byte-identical letters for identical input (fixed timestamps and IDs)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    return parser
+
+def main(argv=None):
+    """Write every posting's letters and report per-posting failures; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    resume = as_parsed_resume(read_resume(args.resume))
+    to_zip = args.output.lower().endswith('.zip')
+    if not to_zip:
+        os.makedirs(args.output, exist_ok=True)
+    
+    skipped = []
+    
+    def postings():
+        # Malformed postings are reported and skipped without stopping the batch
+        for index, record in enumerate(read_records(args.postings)):
+            try:
+                record = load_record(record)
+                yield parse_posting(record)
+            except ValueError as exc:
+                skipped.append(index)
+                posting_id = record.get('id') if isinstance(record, dict) else None
+                print(f"[FAILED] posting {posting_id or index}: {exc}", file=sys.stderr)
+    
+    started = time.perf_counter()
+    written = failed = 0
+    archive = zipfile.ZipFile(args.output, 'w') if to_zip else None
+    try:
+        results = render_cover_letters(
+            resume, postings(), args.template, args.formats, args.workers,
+            date=args.date, pdf_profile=args.pdf_profile, deterministic=args.deterministic, limits=limits_from_env()
+        )
+        for index, posting, documents, error in results:
+            if error:
+                failed += 1
+                print(f"[FAILED] posting {posting.posting_id or index}: {error}", file=sys.stderr)
+                continue
+            for file_format, document in documents:
+                file_name = f"{index:05d}_" + letter_filename(resume.name, posting, file_format)
+                if archive is not None:
+                    # DOCX files are already zip archives, so only PDFs are worth deflating
+                    compression = zipfile.ZIP_DEFLATED if file_format == "pdf" else zipfile.ZIP_STORED
+                    archive.writestr(file_name, document, compress_type=compression)
+                else:
+                    with open(os.path.join(args.output, file_name), 'wb') as output_file:
+                        output_file.write(document)
+                written += 1
+    finally:
+        if archive is not None:
+            archive.close()
+    
+    failed += len(skipped)
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {written} letters in {elapsed:.2f}s ({failed} failed) -> {args.output}", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
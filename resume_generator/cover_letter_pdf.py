@@ -0,0 +1,55 @@
+"""PDF cover letters with ReportLab, in the resume template's compiled PdfStyles"""
+
+import io
+import threading
+from xml.sax.saxutils import escape
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph
+
+from .pdf_renderer import header_story, new_pdf_document, pdf_styles
+from .rendering import DEFAULT_PDF_PROFILE, PDF_PROFILES
+
+# Letter paragraph styles per (template, embed_fonts), derived once from the resume styles
+_LETTER_STYLES = {}
+_LETTER_STYLES_LOCK = threading.Lock()
+
+def letter_styles(template_name, embed_fonts=True):
+    """{"body": ParagraphStyle, "heading": ParagraphStyle} of a template's letters"""
+    key = (template_name, embed_fonts)
+    styles = _LETTER_STYLES.get(key)
+    if styles is None:
+        with _LETTER_STYLES_LOCK:
+            styles = _LETTER_STYLES.get(key)
+            if styles is None:
+                resume_styles = pdf_styles(template_name, embed_fonts)
+                styles = _LETTER_STYLES[key] = {
+                    "body": ParagraphStyle(f'{template_name} LetterBody', parent=resume_styles.content,
+                                           spaceAfter=10, leading=14),
+                    "heading": ParagraphStyle(f'{template_name} LetterHeading', parent=resume_styles.job,
+                                              spaceAfter=10, leading=14)
+                }
+    return styles
+
+class PdfLetterWriter:
+    """Lays out letter lines under the resume's centered header"""
+    
+    def __init__(self, resume, template_name, embed_fonts=True, profile=DEFAULT_PDF_PROFILE, deterministic=False):
+        self.resume = resume
+        self.profile = profile
+        self.deterministic = deterministic
+        embed_fonts = embed_fonts and PDF_PROFILES[profile]["embed_fonts"]
+        self.styles = pdf_styles(template_name, embed_fonts)
+        self.letter_styles = letter_styles(template_name, embed_fonts)
+    
+    def write(self, letter_lines, output=None):
+        """Write (role, text) letter lines to output (or a new BytesIO); returns the sink"""
+        buffer = io.BytesIO() if output is None else output
+        doc = new_pdf_document(buffer, self.profile, self.deterministic)
+        story = header_story(self.resume, self.styles)
+        # Letter text is free text, so it is escaped before ReportLab parses it as markup
+        story += [Paragraph(escape(text), self.letter_styles[role]) for role, text in letter_lines]
+        doc.build(story)
+        if output is None:
+            buffer.seek(0)
+        return buffer
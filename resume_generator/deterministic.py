@@ -0,0 +1,53 @@
+"""Byte-for-byte reproducible output and content hashes usable as ETags
+
+In deterministic mode equal input gives identical bytes: zip entries (DOCX)
+carry a fixed timestamp and attributes in a fixed order, document properties
+use FIXED_DATETIME, and PDFs are written in ReportLab's invariant mode.
+"""
+
+import datetime
+import hashlib
+import io
+import zipfile
+
+# Earliest timestamp a zip entry can hold; also used for document properties
+FIXED_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+FIXED_DATETIME = datetime.datetime(*FIXED_ZIP_DATE)
+
+# Package parts that readers expect to find first
+LEADING_ENTRIES = ("[Content_Types].xml", "_rels/.rels")
+
+def zip_entry(name, compress_type=zipfile.ZIP_DEFLATED):
+    """ZipInfo with the fixed timestamp and platform-independent attributes"""
+    info = zipfile.ZipInfo(name, date_time=FIXED_ZIP_DATE)
+    info.compress_type = compress_type
+    info.create_system = 0
+    info.external_attr = 0o644 << 16
+    return info
+
+def _entry_order(name):
+    return (LEADING_ENTRIES.index(name) if name in LEADING_ENTRIES else len(LEADING_ENTRIES), name)
+
+def normalize_zip(data):
+    """Rewrite a zip archive (such as a DOCX) with fixed timestamps and ordered entries"""
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(output, 'w') as target:
+        for name in sorted(source.namelist(), key=_entry_order):
+            target.writestr(zip_entry(name), source.read(name))
+    return output.getvalue()
+
+def content_hash(document):
+    """SHA-256 hex digest of a rendered document"""
+    return hashlib.sha256(document).hexdigest()
+
+def etag(document):
+    """Strong HTTP ETag of a rendered document"""
+    return f'"{content_hash(document)}"'
+
+def etag_matches(if_none_match, tag):
+    """Whether an If-None-Match header value names the given ETag"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # Weak comparison, as If-None-Match requires
+    return "*" in candidates or tag in (candidate.removeprefix("W/") for candidate in candidates)
@@ -0,0 +1,269 @@
+"""Direct WordprocessingML writer: an alternative DOCX engine without python-docx
+
+Emits document.xml, styles.xml, numbering.xml and the relationship parts as
+strings straight into a zip stream. Layout and run formatting come from
+docx_layout, the same source the python-docx renderer compiles its styles from,
+so both engines produce the same structure and styling.
+"""
+
+import io
+import zipfile
+from types import MappingProxyType
+from xml.sax.saxutils import escape, quoteattr
+
+from .deterministic import zip_entry
+from .docx_layout import (
+    BASE_FONT_SIZE_PT,
+    BOTTOM_MARGIN_IN,
+    DOCX_RUN_FORMATS,
+    HYPERLINK_RUN_FORMAT,
+    LEFT_MARGIN_IN,
+    RIGHT_MARGIN_IN,
+    TOP_MARGIN_IN,
+    line_hex,
+)
+from .limits import current_budget
+from .metrics import stage_timer
+from .model import ENTRY_BULLET, ENTRY_HEADING, ENTRY_ITEM, ENTRY_SKILL, as_parsed_resume
+from .templates import RESUME_TEMPLATES
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+
+TWIPS_PER_INCH = 1440
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/numbering.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+    '</Types>'
+)
+
+PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{REL_NS}">'
+    f'<Relationship Id="rId1" Type="{REL_TYPE}officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+# List Bullet paragraphs are numbered with a single-level '•' list
+NUMBERING_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:numbering xmlns:w="{W_NS}">'
+    '<w:abstractNum w:abstractNumId="0">'
+    '<w:multiLevelType w:val="singleLevel"/>'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/>'
+    '<w:lvlText w:val="•"/><w:lvlJc w:val="left"/>'
+    '<w:pPr><w:ind w:left="360" w:hanging="360"/></w:pPr></w:lvl>'
+    '</w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '</w:numbering>'
+)
+
+SECTION_PROPERTIES_XML = (
+    '<w:sectPr>'
+    '<w:pgSz w:w="12240" w:h="15840"/>'  # US Letter
+    f'<w:pgMar w:top="{int(TOP_MARGIN_IN * TWIPS_PER_INCH)}" w:right="{int(RIGHT_MARGIN_IN * TWIPS_PER_INCH)}" '
+    f'w:bottom="{int(BOTTOM_MARGIN_IN * TWIPS_PER_INCH)}" w:left="{int(LEFT_MARGIN_IN * TWIPS_PER_INCH)}" '
+    'w:header="720" w:footer="720" w:gutter="0"/>'
+    '</w:sectPr>'
+)
+
+def run_properties_xml(size_pt=None, color_hex=None, bold=False, font_name=None, underline=False):
+    """Serialized w:rPr for a run format, in CT_RPr schema order"""
+    parts = ['<w:rPr>']
+    if font_name:
+        font = quoteattr(font_name)
+        parts.append(f'<w:rFonts w:ascii={font} w:hAnsi={font}/>')
+    if bold:
+        parts.append('<w:b/>')
+    if color_hex:
+        parts.append(f'<w:color w:val="{color_hex}"/>')
+    if size_pt:
+        parts.append(f'<w:sz w:val="{int(size_pt * 2)}"/>')
+    if underline:
+        parts.append('<w:u w:val="single"/>')
+    parts.append('</w:rPr>')
+    return ''.join(parts)
+
+def styles_xml(font_name):
+    """styles.xml with Normal in the template font and List Bullet based on it"""
+    font = quoteattr(font_name)
+    size = int(BASE_FONT_SIZE_PT * 2)
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:styles xmlns:w="{W_NS}">'
+        '<w:docDefaults><w:rPrDefault><w:rPr><w:lang w:val="en-US"/></w:rPr></w:rPrDefault></w:docDefaults>'
+        '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/>'
+        f'<w:rPr><w:rFonts w:ascii={font} w:hAnsi={font}/><w:sz w:val="{size}"/></w:rPr>'
+        '</w:style>'
+        '<w:style w:type="paragraph" w:styleId="ListBullet"><w:name w:val="List Bullet"/>'
+        '<w:basedOn w:val="Normal"/>'
+        '<w:pPr><w:numPr><w:numId w:val="1"/></w:numPr><w:ind w:left="360" w:hanging="360"/>'
+        '<w:contextualSpacing/></w:pPr>'
+        '</w:style>'
+        '</w:styles>'
+    )
+
+class FastDocxStyles:
+    """Serialized run and paragraph properties of one template, built once at import"""
+    
+    def __init__(self, template_config, run_formats):
+        colors = template_config["color_scheme"]
+        self.header_style = template_config["header_style"]
+        self.styles_xml = styles_xml(template_config["font_style"]).encode('utf-8')
+        self.name_rpr = run_properties_xml(**run_formats["name"])
+        self.contact_rpr = run_properties_xml(**run_formats["contact"])
+        self.section_rpr = run_properties_xml(**run_formats["section"])
+        self.heading_rpr = run_properties_xml(**run_formats["heading"])
+        self.body_rpr = run_properties_xml(**run_formats["body"])
+        self.contact_ppr = f'<w:pPr>{_bottom_border_xml(line_hex(colors["primary"]))}<w:jc w:val="center"/></w:pPr>'
+        if self.header_style == "colored_background":
+            # Background shading simulated with a bottom border, as in the python-docx engine
+            self.section_ppr = f'<w:pPr>{_bottom_border_xml(line_hex(colors["accent"]))}</w:pPr>'
+        else:
+            self.section_ppr = ''
+
+def _bottom_border_xml(color_hex):
+    return f'<w:pBdr><w:bottom w:val="single" w:sz="8" w:space="1" w:color="{color_hex}"/></w:pBdr>'
+
+FAST_DOCX_STYLES = MappingProxyType({
+    name: FastDocxStyles(config, DOCX_RUN_FORMATS[name]) for name, config in RESUME_TEMPLATES.items()
+})
+
+HYPERLINK_RPR_XML = run_properties_xml(**HYPERLINK_RUN_FORMAT)
+CENTERED_PPR_XML = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+LIST_BULLET_PPR_XML = '<w:pPr><w:pStyle w:val="ListBullet"/></w:pPr>'
+
+def run_xml(text, rpr_xml):
+    """Serialized w:r, preserving surrounding whitespace and turning tabs into w:tab"""
+    pieces = []
+    for i, chunk in enumerate(text.split('\t')):
+        if i:
+            pieces.append('<w:tab/>')
+        if chunk:
+            space = ' xml:space="preserve"' if chunk != chunk.strip() else ''
+            pieces.append(f'<w:t{space}>{escape(chunk)}</w:t>')
+    return f'<w:r>{rpr_xml}{"".join(pieces)}</w:r>'
+
+def paragraph_xml(ppr_xml, *runs):
+    """Serialized w:p from paragraph properties and already serialized runs"""
+    return f'<w:p>{ppr_xml}{"".join(runs)}</w:p>'
+
+def header_xml(resume, styles):
+    """Centered name and contact paragraphs, plus the (rId, url) of each contact link
+    
+    Link rIds start at rId3, after the styles and numbering relationships.
+    """
+    hyperlinks = []
+    
+    def hyperlink_xml(text, url):
+        r_id = f"rId{len(hyperlinks) + 3}"
+        hyperlinks.append((r_id, url))
+        return f'<w:hyperlink r:id="{r_id}">{run_xml(text, HYPERLINK_RPR_XML)}</w:hyperlink>'
+    
+    # NAME SECTION - ALWAYS CENTERED
+    name_xml = paragraph_xml(CENTERED_PPR_XML, run_xml(resume.name.upper(), styles.name_rpr))
+    
+    # CONTACT INFO - ALWAYS CENTERED with clickable links
+    contact_runs = [
+        run_xml(f"📧 {resume.email}", styles.contact_rpr),
+        run_xml(f"    📞 {resume.phone}", styles.contact_rpr),
+        run_xml(f"    📍 {resume.location}", styles.contact_rpr)
+    ]
+    if resume.linkedin_url:
+        contact_runs.append(run_xml("    🔗 ", styles.contact_rpr))
+        contact_runs.append(hyperlink_xml("LinkedIn", resume.linkedin_url))
+    if resume.github_url:
+        contact_runs.append(run_xml("    💻 ", styles.contact_rpr))
+        contact_runs.append(hyperlink_xml("GitHub", resume.github_url))
+    return [name_xml, paragraph_xml(styles.contact_ppr, *contact_runs)], hyperlinks
+
+def write_docx_package(body, hyperlinks, styles, output=None, deterministic=False):
+    """Zip serialized body paragraphs and their link relationships into a DOCX
+    
+    Written to output when given, otherwise to a new BytesIO rewound for
+    reading. Returns the sink.
+    """
+    document_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}"><w:body>'
+        + ''.join(body) + SECTION_PROPERTIES_XML +
+        '</w:body></w:document>'
+    )
+    
+    document_rels = [
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n',
+        f'<Relationships xmlns="{REL_NS}">',
+        f'<Relationship Id="rId1" Type="{REL_TYPE}styles" Target="styles.xml"/>',
+        f'<Relationship Id="rId2" Type="{REL_TYPE}numbering" Target="numbering.xml"/>'
+    ]
+    for r_id, url in hyperlinks:
+        document_rels.append(
+            f'<Relationship Id="{r_id}" Type="{REL_TYPE}hyperlink" Target={quoteattr(url)} TargetMode="External"/>'
+        )
+    document_rels.append('</Relationships>')
+    
+    doc_io = io.BytesIO() if output is None else output
+    parts = (
+        ('[Content_Types].xml', CONTENT_TYPES_XML),
+        ('_rels/.rels', PACKAGE_RELS_XML),
+        ('word/document.xml', document_xml),
+        ('word/_rels/document.xml.rels', ''.join(document_rels)),
+        ('word/styles.xml', styles.styles_xml),
+        ('word/numbering.xml', NUMBERING_XML)
+    )
+    with zipfile.ZipFile(doc_io, 'w', zipfile.ZIP_DEFLATED) as package:
+        for part_name, xml in parts:
+            package.writestr(zip_entry(part_name) if deterministic else part_name, xml)
+    if output is None:
+        doc_io.seek(0)
+    return doc_io
+
+def create_fast_word_doc(data, template_name, output=None, deterministic=False):
+    """Create the same Word document as create_template_word_doc without python-docx
+    
+    Zip entries are streamed to output (any writable binary file) when given,
+    otherwise to a new BytesIO rewound for reading. Returns the sink.
+    With deterministic=True entries carry a fixed timestamp, so equal input
+    gives identical bytes.
+    """
+    resume = as_parsed_resume(data)
+    timer = stage_timer(template_name, "docx")
+    styles = FAST_DOCX_STYLES[template_name]
+    body, hyperlinks = header_xml(resume, styles)
+    
+    # SECTIONS - Education, Projects, Experience, Achievements, Technical Skills
+    budget = current_budget()
+    for section in resume.sections:
+        budget.check()
+        body.append(paragraph_xml(styles.section_ppr, run_xml(section.title.upper(), styles.section_rpr)))
+        for entry in section.entries:
+            if entry.kind == ENTRY_BULLET:
+                body.append(paragraph_xml(LIST_BULLET_PPR_XML, run_xml(entry.text, styles.body_rpr)))
+            elif entry.kind == ENTRY_HEADING:
+                body.append(paragraph_xml('', run_xml(entry.text, styles.heading_rpr)))
+            elif entry.kind == ENTRY_SKILL:
+                body.append(paragraph_xml(
+                    '',
+                    run_xml(entry.category + ': ', styles.heading_rpr),
+                    run_xml(entry.text, styles.body_rpr)
+                ))
+            elif entry.kind == ENTRY_ITEM:
+                body.append(paragraph_xml('', run_xml(f"• {entry.text}", styles.body_rpr)))
+            else:
+                body.append(paragraph_xml('', run_xml(entry.text, styles.body_rpr)))
+    timer.lap("build")
+    
+    doc_io = write_docx_package(body, hyperlinks, styles, output, deterministic)
+    timer.lap("save")
+    return doc_io
@@ -0,0 +1,46 @@
+"""DOCX layout shared by the python-docx renderer and the direct WordprocessingML writer"""
+
+from types import MappingProxyType
+
+from .templates import RESUME_TEMPLATES, rgbcolor_to_rgb
+
+# Page layout shared by every template, in inches and points
+TOP_MARGIN_IN = 0.5
+BOTTOM_MARGIN_IN = 0.5
+LEFT_MARGIN_IN = 0.75
+RIGHT_MARGIN_IN = 0.75
+BASE_FONT_SIZE_PT = 10
+
+# Hyperlinks are blue and underlined in every template, at the paragraph's size
+HYPERLINK_RUN_FORMAT = MappingProxyType({"color_hex": "0066CC", "underline": True})
+
+def line_hex(rgbcolor):
+    """Lowercase hex used for paragraph border colors"""
+    r, g, b = rgbcolor_to_rgb(rgbcolor)
+    return f'{r:02x}{g:02x}{b:02x}'
+
+def docx_run_formats(template_config):
+    """Run formatting of each run role in a template: size, color, bold, font and underline"""
+    colors = template_config["color_scheme"]
+    font_name = template_config["font_style"]
+    primary = str(colors["primary"])
+    secondary = str(colors["secondary"])
+    return MappingProxyType({
+        # Bold 18pt name in the primary color
+        "name": {"size_pt": 18, "color_hex": primary, "bold": True, "font_name": font_name},
+        # 9pt contact details in the secondary color
+        "contact": {"size_pt": 9, "color_hex": secondary},
+        # Bold 12pt section header in the primary color
+        "section": {
+            "size_pt": 12, "color_hex": primary, "bold": True, "font_name": font_name,
+            "underline": template_config["header_style"] == "underlined"
+        },
+        # Bold 10pt entry heading in the secondary color
+        "heading": {"size_pt": 10, "color_hex": secondary, "bold": True},
+        # Plain 10pt body text
+        "body": {"size_pt": 10}
+    })
+
+DOCX_RUN_FORMATS = MappingProxyType({
+    name: docx_run_formats(config) for name, config in RESUME_TEMPLATES.items()
+})
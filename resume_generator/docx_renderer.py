@@ -0,0 +1,301 @@
+import io
+import threading
+from copy import deepcopy
+from types import MappingProxyType
+from typing import NamedTuple
+
+from docx import Document
+from docx.shared import Pt, Inches
+from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.oxml.shared import OxmlElement, qn
+
+from .deterministic import FIXED_DATETIME, normalize_zip
+from .docx_layout import (
+    BASE_FONT_SIZE_PT,
+    BOTTOM_MARGIN_IN,
+    DOCX_RUN_FORMATS,
+    HYPERLINK_RUN_FORMAT,
+    LEFT_MARGIN_IN,
+    RIGHT_MARGIN_IN,
+    TOP_MARGIN_IN,
+    line_hex,
+)
+from .limits import current_budget
+from .metrics import stage_timer
+from .model import ENTRY_BULLET, ENTRY_HEADING, ENTRY_ITEM, ENTRY_SKILL, as_parsed_resume
+from .templates import RESUME_TEMPLATES
+
+HYPERLINK_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+
+# Page layout shared by every template
+TOP_MARGIN = Inches(TOP_MARGIN_IN)
+BOTTOM_MARGIN = Inches(BOTTOM_MARGIN_IN)
+LEFT_MARGIN = Inches(LEFT_MARGIN_IN)
+RIGHT_MARGIN = Inches(RIGHT_MARGIN_IN)
+BASE_FONT_SIZE = Pt(BASE_FONT_SIZE_PT)
+
+NAME_SPACE_AFTER = Pt(6)
+CONTACT_SPACE_AFTER = Pt(12)
+SECTION_SPACE_BEFORE = Pt(16)
+SECTION_SPACE_AFTER = Pt(8)
+ENTRY_SPACE_AFTER = Pt(3)
+BULLET_SPACE_AFTER = Pt(2)
+
+def run_properties(size_pt=None, color_hex=None, bold=False, font_name=None, underline=False):
+    """Build a w:rPr prototype that is deep-copied onto every run that uses it"""
+    rPr = OxmlElement('w:rPr')
+    # Children follow the CT_RPr schema order: rFonts, b, color, sz, u
+    if font_name:
+        rFonts = OxmlElement('w:rFonts')
+        rFonts.set(qn('w:ascii'), font_name)
+        rFonts.set(qn('w:hAnsi'), font_name)
+        rPr.append(rFonts)
+    if bold:
+        rPr.append(OxmlElement('w:b'))
+    if color_hex:
+        color = OxmlElement('w:color')
+        color.set(qn('w:val'), color_hex)
+        rPr.append(color)
+    if size_pt:
+        sz = OxmlElement('w:sz')
+        sz.set(qn('w:val'), str(int(size_pt * 2)))  # Half-points
+        rPr.append(sz)
+    if underline:
+        u = OxmlElement('w:u')
+        u.set(qn('w:val'), 'single')
+        rPr.append(u)
+    return rPr
+
+class DocxStyles(NamedTuple):
+    """Precompiled DOCX styling of one template; never mutate the prototypes"""
+    font_name: str
+    header_style: str
+    primary_line_hex: str
+    accent_line_hex: str
+    name_rpr: object
+    contact_rpr: object
+    section_rpr: object
+    heading_rpr: object
+    body_rpr: object
+
+def compile_docx_styles(template_config, run_formats):
+    """Compile a RESUME_TEMPLATES entry into ready-to-copy run property prototypes"""
+    colors = template_config["color_scheme"]
+    return DocxStyles(
+        font_name=template_config["font_style"],
+        header_style=template_config["header_style"],
+        primary_line_hex=line_hex(colors["primary"]),
+        accent_line_hex=line_hex(colors["accent"]),
+        name_rpr=run_properties(**run_formats["name"]),
+        contact_rpr=run_properties(**run_formats["contact"]),
+        section_rpr=run_properties(**run_formats["section"]),
+        heading_rpr=run_properties(**run_formats["heading"]),
+        body_rpr=run_properties(**run_formats["body"])
+    )
+
+# Compiled once at import; the render path only looks styles up
+DOCX_STYLES = MappingProxyType({
+    name: compile_docx_styles(config, DOCX_RUN_FORMATS[name]) for name, config in RESUME_TEMPLATES.items()
+})
+
+HYPERLINK_RPR = run_properties(**HYPERLINK_RUN_FORMAT)
+
+def add_styled_run(paragraph, text, rpr):
+    """Add a run whose formatting is a copy of a precompiled w:rPr prototype"""
+    run = paragraph.add_run(text)
+    run._r.insert(0, deepcopy(rpr))
+    return run
+
+def add_hyperlink_to_paragraph(paragraph, text, url):
+    """Add a hyperlink to a paragraph in Word document"""
+    # Create hyperlink
+    part = paragraph.part
+    r_id = part.relate_to(url, HYPERLINK_REL_TYPE, is_external=True)
+    
+    # Create the w:hyperlink tag and add needed values
+    hyperlink = OxmlElement('w:hyperlink')
+    hyperlink.set(qn('r:id'), r_id)
+    
+    # Create a new run styled blue and underlined
+    new_run = OxmlElement('w:r')
+    new_run.append(deepcopy(HYPERLINK_RPR))
+    
+    # Create text element
+    t = OxmlElement('w:t')
+    t.text = text
+    new_run.append(t)
+    
+    hyperlink.append(new_run)
+    paragraph._p.append(hyperlink)
+    
+    return hyperlink
+
+def add_bottom_border(paragraph, color_hex):
+    """Add a colored horizontal line after a paragraph, given its hex color"""
+    p = paragraph._element
+    pPr = p.get_or_add_pPr()
+    pBdr = OxmlElement('w:pBdr')
+    pPr.insert_element_before(pBdr, 'w:shd', 'w:tabs', 'w:suppressAutoHyphens')
+    bottom = OxmlElement('w:bottom')
+    bottom.set(qn('w:val'), 'single')
+    bottom.set(qn('w:sz'), '8')
+    bottom.set(qn('w:space'), '1')
+    bottom.set(qn('w:color'), color_hex)
+    pBdr.append(bottom)
+
+def add_colored_line_after_paragraph(paragraph, color_rgb):
+    """Add a colored horizontal line after a paragraph in Word"""
+    add_bottom_border(paragraph, line_hex(color_rgb))
+
+def build_docx_skeleton(template_name):
+    """Serialize an empty document with the template's margins and default font applied"""
+    styles = DOCX_STYLES[template_name]
+    doc = Document()
+    
+    # Set document margins
+    sections = doc.sections
+    for section in sections:
+        section.top_margin = TOP_MARGIN
+        section.bottom_margin = BOTTOM_MARGIN
+        section.left_margin = LEFT_MARGIN
+        section.right_margin = RIGHT_MARGIN
+    
+    # Set default font; List Bullet is based on Normal and inherits it
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = styles.font_name
+    font.size = BASE_FONT_SIZE
+    
+    skeleton_io = io.BytesIO()
+    doc.save(skeleton_io)
+    return skeleton_io.getvalue()
+
+# Pre-styled skeleton bytes per template, built on first use in each process
+_DOCX_SKELETONS = {}
+_DOCX_SKELETONS_LOCK = threading.Lock()
+
+def docx_skeleton(template_name):
+    """Return the cached skeleton bytes for a template, building them once"""
+    skeleton = _DOCX_SKELETONS.get(template_name)
+    if skeleton is None:
+        with _DOCX_SKELETONS_LOCK:
+            skeleton = _DOCX_SKELETONS.get(template_name)
+            if skeleton is None:
+                skeleton = _DOCX_SKELETONS[template_name] = build_docx_skeleton(template_name)
+    return skeleton
+
+def new_template_document(template_name):
+    """Open a fresh, independent copy of the template's pre-styled skeleton"""
+    return Document(io.BytesIO(docx_skeleton(template_name)))
+
+def create_template_word_doc(data, template_name, output=None, deterministic=False):
+    """Create a Word document with template-specific styling and CENTERED contact info
+    
+    The document is written to output (any writable binary file) when given,
+    otherwise to a new BytesIO rewound for reading. Returns the sink.
+    With deterministic=True document properties and zip entries carry fixed
+    timestamps, so equal input gives identical bytes.
+    """
+    resume = as_parsed_resume(data)
+    timer = stage_timer(template_name, "docx")
+    styles = DOCX_STYLES[template_name]
+    
+    # Margins and default font come pre-applied with the skeleton
+    doc = new_template_document(template_name)
+    list_bullet_style = doc.styles['List Bullet']
+    
+    # NAME SECTION - ALWAYS CENTERED
+    name_para = doc.add_paragraph()
+    add_styled_run(name_para, resume.name.upper(), styles.name_rpr)
+    name_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER  # ALWAYS CENTER
+    name_para.space_after = NAME_SPACE_AFTER
+    
+    # CONTACT INFO - ALWAYS CENTERED with clickable links
+    contact_para = doc.add_paragraph()
+    contact_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER  # ALWAYS CENTER
+    
+    # Add email, phone and location
+    add_styled_run(contact_para, f"📧 {resume.email}", styles.contact_rpr)
+    add_styled_run(contact_para, f"    📞 {resume.phone}", styles.contact_rpr)
+    add_styled_run(contact_para, f"    📍 {resume.location}", styles.contact_rpr)
+    
+    # Add LinkedIn as clickable link
+    if resume.linkedin_url:
+        add_styled_run(contact_para, "    🔗 ", styles.contact_rpr)
+        add_hyperlink_to_paragraph(contact_para, "LinkedIn", resume.linkedin_url)
+    
+    # Add GitHub as clickable link
+    if resume.github_url:
+        add_styled_run(contact_para, "    💻 ", styles.contact_rpr)
+        add_hyperlink_to_paragraph(contact_para, "GitHub", resume.github_url)
+    
+    contact_para.space_after = CONTACT_SPACE_AFTER
+    
+    # Add styled line after header
+    add_bottom_border(contact_para, styles.primary_line_hex)
+    
+    # Helper function to create section headers
+    def create_section_header(title):
+        heading = doc.add_paragraph()
+        heading.space_before = SECTION_SPACE_BEFORE
+        add_styled_run(heading, title.upper(), styles.section_rpr)
+        
+        # Underlined headers carry w:u in section_rpr; colored_background gets a border
+        if styles.header_style == "colored_background":
+            # Add background shading (simulated with border)
+            add_bottom_border(heading, styles.accent_line_hex)
+        
+        heading.space_after = SECTION_SPACE_AFTER
+        return heading
+    
+    # SECTIONS - Education, Projects, Experience, Achievements, Technical Skills
+    budget = current_budget()
+    for section in resume.sections:
+        budget.check()
+        create_section_header(section.title)
+        for entry in section.entries:
+            if entry.kind == ENTRY_BULLET:
+                entry_para = doc.add_paragraph(style=list_bullet_style)
+                add_styled_run(entry_para, entry.text, styles.body_rpr)
+                entry_para.space_after = BULLET_SPACE_AFTER
+                continue
+            
+            entry_para = doc.add_paragraph()
+            if entry.kind == ENTRY_HEADING:
+                add_styled_run(entry_para, entry.text, styles.heading_rpr)
+            elif entry.kind == ENTRY_SKILL:
+                add_styled_run(entry_para, entry.category + ': ', styles.heading_rpr)
+                add_styled_run(entry_para, entry.text, styles.body_rpr)
+            elif entry.kind == ENTRY_ITEM:
+                add_styled_run(entry_para, f"• {entry.text}", styles.body_rpr)
+            else:
+                add_styled_run(entry_para, entry.text, styles.body_rpr)
+            entry_para.space_after = ENTRY_SPACE_AFTER
+    timer.lap("build")
+    
+    if deterministic:
+        core_properties = doc.core_properties
+        core_properties.created = FIXED_DATETIME
+        core_properties.modified = FIXED_DATETIME
+        core_properties.last_printed = FIXED_DATETIME
+        core_properties.revision = 1
+        # python-docx stamps zip entries with the current time; rewrite them
+        saved_io = io.BytesIO()
+        doc.save(saved_io)
+        doc_io = io.BytesIO() if output is None else output
+        doc_io.write(normalize_zip(saved_io.getvalue()))
+        timer.lap("save")
+        if output is None:
+            doc_io.seek(0)
+        return doc_io
+    
+    # Save to the caller's sink, or a fresh BytesIO
+    if output is not None:
+        doc.save(output)
+        timer.lap("save")
+        return output
+    doc_io = io.BytesIO()
+    doc.save(doc_io)
+    timer.lap("save")
+    doc_io.seek(0)
+    return doc_io
@@ -0,0 +1,284 @@
+"""Resume drafts persisted in SQLite, with coalesced autosave
+
+A draft is a set of named form fields under a random draft id, optionally tied
+to a user id. Fields are stored one row each, so a save writes only the fields
+that changed. DraftAutosaver sits in front of the store: it diffs every update
+against what was last written, keeps changed fields pending until the editor
+has been idle for `debounce` seconds (or `max_delay` has passed), and writes
+every due draft of every session in one transaction from a single thread.
+Whatever is still pending is written when the autosaver is closed, which
+happens at interpreter exit.
+"""
+
+import atexit
+import os
+import secrets
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+
+DEFAULT_DRAFTS_PATH = os.path.join(os.path.expanduser("~"), ".resume_generator", "drafts.sqlite3")
+DEFAULT_DEBOUNCE = 2.0
+DEFAULT_MAX_DELAY = 10.0
+# Drafts whose last written fields are remembered for diffing; others are re-read on demand
+BASELINE_CACHE_SIZE = 1024
+
+# Autosavers to close at exit, held weakly so ones nobody uses any more can be collected
+_LIVE_AUTOSAVERS = weakref.WeakSet()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS drafts (
+    draft_id TEXT PRIMARY KEY,
+    user_id TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS drafts_by_user ON drafts (user_id, updated_at DESC);
+CREATE TABLE IF NOT EXISTS draft_fields (
+    draft_id TEXT NOT NULL REFERENCES drafts (draft_id) ON DELETE CASCADE,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (draft_id, field)
+) WITHOUT ROWID;
+"""
+
+def new_draft_id():
+    """Random, URL-safe draft id"""
+    return secrets.token_urlsafe(12)
+
+def drafts_path_from_env():
+    """Database path from RESUME_DRAFTS_DB, else DEFAULT_DRAFTS_PATH"""
+    return os.environ.get("RESUME_DRAFTS_DB") or DEFAULT_DRAFTS_PATH
+
+class DraftStore:
+    """SQLite store of drafts, with one connection per thread
+    
+    An in-memory database (":memory:") exists only within its connection, so
+    every thread shares that one connection under a lock instead.
+    """
+    
+    def __init__(self, path=DEFAULT_DRAFTS_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._shared = None
+        self._shared_lock = threading.RLock()
+        if path == ":memory:":
+            self._shared = self._open(check_same_thread=False)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connection() as connection, connection:
+            connection.executescript(SCHEMA)
+    
+    def _open(self, **options):
+        """New connection in WAL mode, so readers never block the writer"""
+        connection = sqlite3.connect(self.path, timeout=30.0, **options)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # Durable at checkpoints rather than every commit; a crash loses at most the last autosave
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection
+    
+    @contextmanager
+    def _connection(self):
+        """This thread's connection, or the shared in-memory one held under its lock"""
+        if self._shared is not None:
+            with self._shared_lock:
+                yield self._shared
+            return
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._open()
+        yield connection
+    
+    def load(self, draft_id):
+        """{field: value} of a draft, or None when there is no such draft"""
+        with self._connection() as connection:
+            if connection.execute("SELECT 1 FROM drafts WHERE draft_id = ?", (draft_id,)).fetchone() is None:
+                return None
+            rows = connection.execute("SELECT field, value FROM draft_fields WHERE draft_id = ?", (draft_id,))
+            return dict(rows.fetchall())
+    
+    def save(self, draft_id, fields, user_id=None):
+        """Write the given fields of one draft, leaving its other fields untouched"""
+        self.save_many({draft_id: (user_id, fields)})
+    
+    def save_many(self, drafts):
+        """Write {draft_id: (user_id, {field: value})} in a single transaction"""
+        now = time.time()
+        with self._connection() as connection, connection:
+            for draft_id, (user_id, fields) in drafts.items():
+                connection.execute(
+                    "INSERT INTO drafts (draft_id, user_id, created_at, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (draft_id) DO UPDATE SET updated_at = excluded.updated_at, "
+                    "user_id = COALESCE(excluded.user_id, drafts.user_id)",
+                    (draft_id, user_id, now, now)
+                )
+                connection.executemany(
+                    "INSERT INTO draft_fields (draft_id, field, value) VALUES (?, ?, ?) "
+                    "ON CONFLICT (draft_id, field) DO UPDATE SET value = excluded.value",
+                    [(draft_id, field, str(value)) for field, value in fields.items()]
+                )
+    
+    def list_drafts(self, user_id):
+        """(draft_id, updated_at) of a user's drafts, most recently edited first"""
+        with self._connection() as connection:
+            rows = connection.execute(
+                "SELECT draft_id, updated_at FROM drafts WHERE user_id = ? ORDER BY updated_at DESC", (user_id,)
+            )
+            return rows.fetchall()
+    
+    def delete(self, draft_id):
+        """Remove a draft and its fields"""
+        with self._connection() as connection, connection:
+            connection.execute("DELETE FROM drafts WHERE draft_id = ?", (draft_id,))
+
+class DraftAutosaver:
+    """Debounced, incremental autosave of many drafts through one background writer"""
+    
+    def __init__(self, store, debounce=DEFAULT_DEBOUNCE, max_delay=DEFAULT_MAX_DELAY):
+        self.store = store
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.updates = 0  # record() calls that changed something
+        self.transactions = 0
+        self.fields_written = 0
+        self._pending = {}  # draft_id -> [user_id, {field: value}, first change, last change]
+        self._baselines = OrderedDict()  # draft_id -> {field: value} as last written
+        self._condition = threading.Condition()
+        self._writer = None
+        self._closing = False
+        _LIVE_AUTOSAVERS.add(self)
+    
+    def _baseline(self, draft_id):
+        """Fields of a draft as last written, loading them on a cache miss"""
+        with self._condition:
+            baseline = self._baselines.get(draft_id)
+            if baseline is not None:
+                self._baselines.move_to_end(draft_id)
+                return baseline
+        baseline = self.store.load(draft_id) or {}
+        with self._condition:
+            return self._remember(draft_id, baseline)
+    
+    def _remember(self, draft_id, fields):
+        """Merge written fields into a draft's baseline, keeping the cache bounded; caller holds the lock"""
+        baseline = self._baselines.setdefault(draft_id, {})
+        baseline.update(fields)
+        self._baselines.move_to_end(draft_id)
+        while len(self._baselines) > BASELINE_CACHE_SIZE:
+            self._baselines.popitem(last=False)
+        return baseline
+    
+    def record(self, draft_id, fields, user_id=None):
+        """Queue the fields that differ from what is saved; returns the number changed"""
+        baseline = self._baseline(draft_id)
+        now = time.monotonic()
+        with self._condition:
+            pending = self._pending.get(draft_id)
+            pending_fields = pending[1] if pending else {}
+            changed = {
+                field: str(value) for field, value in fields.items()
+                if str(value) != pending_fields.get(field, baseline.get(field))
+            }
+            if not changed:
+                return 0
+            if pending is None:
+                pending = self._pending[draft_id] = [user_id, {}, now, now]
+            pending[1].update(changed)
+            pending[3] = now
+            self.updates += 1
+            if self._writer is None and not self._closing:
+                self._writer = threading.Thread(target=self._run, name="draft-autosave", daemon=True)
+                self._writer.start()
+            self._condition.notify()
+        return len(changed)
+    
+    def _due(self, pending, now):
+        """Seconds until a pending draft should be written (0 or less when due)"""
+        _, _, first_change, last_change = pending
+        return min(last_change + self.debounce, first_change + self.max_delay) - now
+    
+    def _take(self, draft_ids=None):
+        """Remove and return pending drafts: the given ones, or all when None; caller holds the lock
+        
+        Baselines advance now rather than after the write, so an edit made while
+        the write is in flight is diffed against the values being written.
+        """
+        draft_ids = list(self._pending) if draft_ids is None else [d for d in draft_ids if d in self._pending]
+        drafts = {draft_id: self._pending.pop(draft_id) for draft_id in draft_ids}
+        for draft_id, (_, fields, _, _) in drafts.items():
+            self._remember(draft_id, fields)
+        return drafts
+    
+    def _write(self, drafts):
+        """Write taken drafts in one transaction; on failure they are queued again"""
+        if not drafts:
+            return
+        try:
+            self.store.save_many({draft_id: (user_id, fields) for draft_id, (user_id, fields, _, _) in drafts.items()})
+        except sqlite3.Error:
+            with self._condition:
+                for draft_id, (user_id, fields, first_change, _) in drafts.items():
+                    pending = self._pending.setdefault(draft_id, [user_id, {}, first_change, time.monotonic()])
+                    # Edits queued since the failed write are newer and win
+                    pending[1] = {**fields, **pending[1]}
+                    self._baselines.pop(draft_id, None)
+            raise
+        with self._condition:
+            self.transactions += 1
+            self.fields_written += sum(len(fields) for _, fields, _, _ in drafts.values())
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._closing:
+                    return
+                now = time.monotonic()
+                waits = {draft_id: self._due(pending, now) for draft_id, pending in self._pending.items()}
+                due = [draft_id for draft_id, wait in waits.items() if wait <= 0]
+                if not due:
+                    self._condition.wait(min(waits.values()) if waits else None)
+                    continue
+                drafts = self._take(due)
+            try:
+                self._write(drafts)
+            except sqlite3.Error:
+                # Locked or unwritable database: retry after the debounce period
+                time.sleep(self.debounce)
+    
+    def flush(self, draft_id=None):
+        """Write one draft's pending fields (or every draft's) right away"""
+        with self._condition:
+            drafts = self._take(None if draft_id is None else [draft_id])
+        self._write(drafts)
+    
+    def close(self):
+        """Stop the background writer and write every pending draft"""
+        with self._condition:
+            writer, self._writer = self._writer, None
+            self._closing = True
+            self._condition.notify_all()
+        if writer is not None:
+            writer.join()
+        with self._condition:
+            self._closing = False
+        self.flush()
+    
+    def stats(self):
+        """Counters showing how many updates were coalesced into how many writes"""
+        with self._condition:
+            return {
+                "pending_drafts": len(self._pending),
+                "updates": self.updates,
+                "transactions": self.transactions,
+                "fields_written": self.fields_written
+            }
+
+@atexit.register
+def _close_live_autosavers():
+    """Writers are daemon threads, so edits still pending at exit are written here"""
+    for autosaver in list(_LIVE_AUTOSAVERS):
+        autosaver.close()
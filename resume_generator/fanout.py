@@ -0,0 +1,179 @@
+"""Render one resume in every template and format at once, into a single zip
+
+Usage:
+    python -m resume_generator.fanout resume.json -o all_templates.zip --workers 8
+
+The resume is parsed once and every (template, format) pair is rendered in
+parallel, so the whole set takes about as long as the slowest single render.
+Documents are written into the zip as they finish, and a per-template timing
+report is printed (or returned, for the Streamlit app).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import NamedTuple
+
+from .cache import resume_cache_key
+from .limits import check_resume_limits, limits_from_env
+from .model import as_parsed_resume, parse_resume
+from .rendering import (
+    DEFAULT_DOCX_ENGINE,
+    DOCX_ENGINES,
+    FORMATS,
+    RESUME_FIELDS,
+    document_filename,
+    missing_required_fields,
+    render_document,
+)
+from .templates import RESUME_TEMPLATES
+
+# DOCX files are already zip archives, so only PDFs are worth deflating
+ZIP_COMPRESSION = {
+    "docx": zipfile.ZIP_STORED,
+    "pdf": zipfile.ZIP_DEFLATED
+}
+
+class FanoutResult(NamedTuple):
+    """Timing of one document of a fan-out render"""
+    template_name: str
+    file_format: str
+    seconds: float  # Render time in the worker; 0 when served from the cache
+    size: int
+    cached: bool = False
+
+def _render_job(resume, template_name, file_format, docx_engine, limits=None):
+    """Worker side of one fan-out render: (document bytes, render seconds)"""
+    started = time.perf_counter()
+    document = render_document(resume, template_name, file_format, docx_engine, limits=limits)
+    return document, time.perf_counter() - started
+
+def render_all(data, executor, template_names=None, formats=FORMATS, docx_engine=DEFAULT_DOCX_ENGINE, cache=None,
+               limits=None):
+    """Render every template in every format in parallel from a single parse
+    
+    Yields (FanoutResult, document bytes) as each document finishes. With a
+    RenderCache, documents already cached are not rendered again and new ones
+    are added to it. With limits (a RenderLimits) oversized input is rejected
+    before anything is submitted, and every render runs under the time budget
+    and page limit. Closing the generator early cancels renders not yet started.
+    """
+    resume = as_parsed_resume(data)
+    if limits is not None:
+        check_resume_limits(resume, limits)
+    template_names = list(template_names or RESUME_TEMPLATES)
+    cache_options = {} if docx_engine == DEFAULT_DOCX_ENGINE else {"docx_engine": docx_engine}
+    
+    cached, pending = [], {}
+    for template_name in template_names:
+        for file_format in formats:
+            key = resume_cache_key(resume, template_name, file_format, **cache_options) if cache is not None else None
+            document = cache.get(key) if key is not None else None
+            if document is not None:
+                cached.append((FanoutResult(template_name, file_format, 0.0, len(document), True), document))
+            else:
+                future = executor.submit(_render_job, resume, template_name, file_format, docx_engine, limits)
+                pending[future] = (template_name, file_format, key)
+    
+    try:
+        yield from cached
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                template_name, file_format, key = pending.pop(future)
+                document, seconds = future.result()
+                if key is not None:
+                    cache.put(key, document)
+                yield FanoutResult(template_name, file_format, seconds, len(document)), document
+    finally:
+        for future in pending:
+            future.cancel()
+
+def write_fanout_zip(data, sink, executor, template_names=None, formats=FORMATS, docx_engine=DEFAULT_DOCX_ENGINE,
+                     cache=None, limits=None):
+    """Stream every template and format of a resume into a zip written to sink
+    
+    Returns (FanoutResults in completion order, wall-clock seconds).
+    """
+    started = time.perf_counter()
+    resume = as_parsed_resume(data)
+    results = []
+    with zipfile.ZipFile(sink, 'w') as archive:
+        for result, document in render_all(resume, executor, template_names, formats, docx_engine, cache, limits):
+            arcname = document_filename(resume.name, result.template_name, result.file_format)
+            archive.writestr(arcname, document, compress_type=ZIP_COMPRESSION[result.file_format])
+            results.append(result)
+    return results, time.perf_counter() - started
+
+def format_report(results, wall_seconds):
+    """Per-template timing table plus the parallel speedup over rendering serially"""
+    lines = [f"{'template':<24}" + "".join(f"{file_format + ' ms':>12}" for file_format in FORMATS)]
+    by_template = {}
+    for result in results:
+        by_template.setdefault(result.template_name, {})[result.file_format] = result
+    for template_name in sorted(by_template, key=list(RESUME_TEMPLATES).index):
+        by_format = by_template[template_name]
+        cells = []
+        for file_format in FORMATS:
+            result = by_format.get(file_format)
+            if result is None:
+                cells.append(f"{'-':>12}")
+            elif result.cached:
+                cells.append(f"{'cached':>12}")
+            else:
+                cells.append(f"{result.seconds * 1000:>12.1f}")
+        lines.append(f"{template_name:<24}" + "".join(cells))
+    
+    serial_seconds = sum(result.seconds for result in results)
+    lines.append(f"{len(results)} documents in {wall_seconds * 1000:.1f} ms wall clock "
+                 f"({serial_seconds * 1000:.1f} ms of rendering, {serial_seconds / wall_seconds:.1f}x parallel)"
+                 if wall_seconds else f"{len(results)} documents")
+    return "\n".join(lines)
+
+def build_parser():
+    """Command line interface of the fan-out renderer"""
+    parser = argparse.ArgumentParser(
+        prog="python -m resume_generator.fanout",
+        description="Render one resume in every template and format into a single zip."
+    )
+    parser.add_argument("input", help="JSON file with one resume_data object ('-' reads stdin)")
+    parser.add_argument("-o", "--output", required=True, help="Output .zip path ('-' writes to stdout)")
+    parser.add_argument("-f", "--formats", nargs="+", choices=FORMATS, default=list(FORMATS),
+                        help="Document formats to render (default: docx pdf)")
+    parser.add_argument("--docx-engine", choices=list(DOCX_ENGINES), default=DEFAULT_DOCX_ENGINE,
+                        help=f"DOCX writer to use (default: {DEFAULT_DOCX_ENGINE})")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: one per document, up to the CPU count)")
+    return parser
+
+def main(argv=None):
+    """Render the fan-out zip and print the timing report; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    if args.input == '-':
+        record = json.load(sys.stdin)
+    else:
+        with open(args.input, encoding='utf-8') as json_file:
+            record = json.load(json_file)
+    missing = missing_required_fields(record)
+    if missing:
+        raise SystemExit(f"Missing required fields: {', '.join(missing)}")
+    resume = parse_resume({field: record.get(field) or "" for field in RESUME_FIELDS})
+    
+    workers = args.workers or min(len(RESUME_TEMPLATES) * len(args.formats), os.cpu_count() or 1)
+    sink = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results, wall_seconds = write_fanout_zip(resume, sink, executor, formats=args.formats,
+                                                     docx_engine=args.docx_engine, limits=limits_from_env())
+    finally:
+        if sink is not sys.stdout.buffer:
+            sink.close()
+    print(format_report(results, wall_seconds), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
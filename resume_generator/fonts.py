@@ -0,0 +1,135 @@
+"""TrueType font registry for PDF output
+
+Maps each template font_style to TTF files found in the bundled fonts directory,
+RESUME_FONT_DIRS or the usual system font folders, preferring the real font and
+falling back to a metric-compatible substitute. Each family is registered with
+ReportLab once per process; ReportLab embeds TrueType fonts as subsets, so a
+document carries only the glyphs it uses. Families with no font files found
+fall back to the built-in Helvetica, which needs no embedding at all.
+"""
+
+import os
+import sys
+import threading
+from typing import NamedTuple
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFError, TTFont
+
+BUNDLED_FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+
+# Candidate (regular, bold) file names per font_style, most faithful first
+FONT_FILES = {
+    "Arial": [
+        ("arial.ttf", "arialbd.ttf"),
+        ("Arial.ttf", "Arial Bold.ttf"),
+        ("LiberationSans-Regular.ttf", "LiberationSans-Bold.ttf"),
+        ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf")
+    ],
+    "Calibri": [
+        ("calibri.ttf", "calibrib.ttf"),
+        ("Carlito-Regular.ttf", "Carlito-Bold.ttf"),
+        ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf")
+    ],
+    "Times New Roman": [
+        ("times.ttf", "timesbd.ttf"),
+        ("Times New Roman.ttf", "Times New Roman Bold.ttf"),
+        ("LiberationSerif-Regular.ttf", "LiberationSerif-Bold.ttf"),
+        ("DejaVuSerif.ttf", "DejaVuSerif-Bold.ttf")
+    ],
+    "Georgia": [
+        ("georgia.ttf", "georgiab.ttf"),
+        ("Georgia.ttf", "Georgia Bold.ttf"),
+        ("Gelasio-Regular.ttf", "Gelasio-Bold.ttf"),
+        ("DejaVuSerif.ttf", "DejaVuSerif-Bold.ttf")
+    ],
+    "Verdana": [
+        ("verdana.ttf", "verdanab.ttf"),
+        ("Verdana.ttf", "Verdana Bold.ttf"),
+        ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf")
+    ]
+}
+
+# Built-in PDF fonts used when no TTF is available (and as the size baseline)
+BASE14_FONTS = ("Helvetica", "Helvetica-Bold")
+
+class PdfFonts(NamedTuple):
+    """ReportLab font names of one template, plus the files they were loaded from"""
+    regular: str
+    bold: str
+    files: tuple = ()  # (regular path, bold path); empty for built-in fonts
+
+def font_dirs():
+    """Directories searched for TTF files, highest priority first"""
+    dirs = [BUNDLED_FONT_DIR]
+    dirs += [path for path in os.environ.get("RESUME_FONT_DIRS", "").split(os.pathsep) if path]
+    if sys.platform == "win32":
+        dirs.append(os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"))
+    elif sys.platform == "darwin":
+        dirs += ["/Library/Fonts", "/System/Library/Fonts", os.path.expanduser("~/Library/Fonts")]
+    else:
+        dirs += ["/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.local/share/fonts"),
+                 os.path.expanduser("~/.fonts")]
+    return dirs
+
+_font_index = None
+_registered = {}  # font_style -> PdfFonts
+_registered_files = {}  # (regular path, bold path) -> PdfFonts, so shared files are parsed once
+_lock = threading.Lock()
+
+def _index_fonts():
+    """Map lowercase TTF file names to paths, scanning the font directories once"""
+    global _font_index
+    if _font_index is None:
+        index = {}
+        for directory in font_dirs():
+            for root, _, files in os.walk(directory):
+                for file_name in files:
+                    if file_name.lower().endswith(".ttf"):
+                        index.setdefault(file_name.lower(), os.path.join(root, file_name))
+        _font_index = index
+    return _font_index
+
+def find_font_files(font_style):
+    """(regular, bold) paths of the best available font for a font_style, or None"""
+    index = _index_fonts()
+    for regular, bold in FONT_FILES.get(font_style, ()):
+        regular_path, bold_path = index.get(regular.lower()), index.get(bold.lower())
+        if regular_path and bold_path:
+            return regular_path, bold_path
+    return None
+
+def pdf_fonts(font_style):
+    """Register a template's font family with ReportLab on first use; returns its PdfFonts"""
+    fonts = _registered.get(font_style)
+    if fonts is not None:
+        return fonts
+    with _lock:
+        fonts = _registered.get(font_style)
+        if fonts is None:
+            fonts = _registered[font_style] = _register(font_style)
+    return fonts
+
+def _register(font_style):
+    """Register the font files of a font_style, or fall back to Helvetica"""
+    files = find_font_files(font_style)
+    if files is None:
+        return PdfFonts(*BASE14_FONTS)
+    fonts = _registered_files.get(files)
+    if fonts is not None:
+        return fonts
+    family = "Resume-" + os.path.splitext(os.path.basename(files[0]))[0]
+    regular, bold = family, family + "-Bold"
+    try:
+        pdfmetrics.registerFont(TTFont(regular, files[0]))
+        pdfmetrics.registerFont(TTFont(bold, files[1]))
+    except (TTFError, OSError):
+        return PdfFonts(*BASE14_FONTS)
+    # Lets <b> markup inside paragraphs switch to the bold face
+    pdfmetrics.registerFontFamily(family, normal=regular, bold=bold, italic=regular, boldItalic=bold)
+    fonts = _registered_files[files] = PdfFonts(regular, bold, files)
+    return fonts
+
+def base14_fonts():
+    """PdfFonts of the built-in Helvetica baseline"""
+    return PdfFonts(*BASE14_FONTS)
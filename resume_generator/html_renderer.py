@@ -0,0 +1,141 @@
+"""HTML preview of the parsed resume, styled like the DOCX and PDF output
+
+Needs neither python-docx nor ReportLab. Every section is rendered on its own
+and memoized on (template, section): ResumeSection is a tuple, so an unchanged
+section hits the cache and only the section being edited is rendered again.
+"""
+
+from functools import lru_cache
+from html import escape
+from types import MappingProxyType
+from typing import NamedTuple
+
+from .docx_layout import DOCX_RUN_FORMATS, HYPERLINK_RUN_FORMAT
+from .limits import check_resume_limits, render_budget
+from .model import ENTRY_BULLET, ENTRY_HEADING, ENTRY_ITEM, ENTRY_SKILL, as_parsed_resume
+from .templates import RESUME_TEMPLATES
+
+# Sections of every template's previews kept memoized
+SECTION_CACHE_SIZE = 1024
+
+def css_declarations(size_pt=None, color_hex=None, bold=False, font_name=None, underline=False):
+    """Inline CSS equivalent of a DOCX run format"""
+    declarations = []
+    if font_name:
+        declarations.append(f"font-family:'{font_name}',sans-serif")
+    if bold:
+        declarations.append("font-weight:bold")
+    if color_hex:
+        declarations.append(f"color:#{color_hex}")
+    if size_pt:
+        declarations.append(f"font-size:{size_pt}pt")
+    if underline:
+        declarations.append("text-decoration:underline")
+    return ";".join(declarations)
+
+class HtmlStyles(NamedTuple):
+    """Precompiled inline CSS of one template"""
+    page: str
+    name: str
+    contact: str
+    section: str
+    heading: str
+    body: str
+    bullet_list: str
+    skill_category: str
+    link: str
+
+def compile_html_styles(template_config, run_formats):
+    """Compile a RESUME_TEMPLATES entry into inline CSS for every element role"""
+    colors = template_config["color_scheme"]
+    primary, secondary, accent = (str(colors[role]) for role in ("primary", "secondary", "accent"))
+    section = css_declarations(**run_formats["section"]) + ";margin:16pt 0 8pt 0"
+    if template_config["header_style"] == "colored_background":
+        # Band in the accent color, like the PDF's header table
+        section += f";background:#{accent};padding:4pt 6pt"
+    return HtmlStyles(
+        page=(f"font-family:'{template_config['font_style']}',sans-serif;font-size:10pt;color:#000;"
+              "background:#fff;padding:0.5in 0.75in;line-height:1.3"),
+        name=css_declarations(**run_formats["name"]) + ";text-align:center;margin:0 0 6pt 0",
+        contact=(css_declarations(**run_formats["contact"]) +
+                 f";text-align:center;margin:0 0 12pt 0;padding-bottom:4pt;border-bottom:1px solid #{primary}"),
+        section=section,
+        heading=css_declarations(**run_formats["heading"]) + ";margin:0 0 3pt 0",
+        body=css_declarations(**run_formats["body"]) + ";margin:0 0 3pt 0",
+        bullet_list="margin:0 0 3pt 0;padding-left:18pt",
+        skill_category=f"font-weight:bold;color:#{secondary}",
+        link=css_declarations(**HYPERLINK_RUN_FORMAT)
+    )
+
+# Compiled once at import; the render path only looks styles up
+HTML_STYLES = MappingProxyType({
+    name: compile_html_styles(config, DOCX_RUN_FORMATS[name]) for name, config in RESUME_TEMPLATES.items()
+})
+
+@lru_cache(maxsize=len(RESUME_TEMPLATES) * 8)
+def render_header_html(template_name, name, email, phone, location, linkedin_url, github_url):
+    """Centered name and contact line"""
+    styles = HTML_STYLES[template_name]
+    contact_parts = [escape(email), escape(phone), escape(location)]
+    if linkedin_url:
+        contact_parts.append(f'<a href="{escape(linkedin_url)}" style="{styles.link}">LinkedIn</a>')
+    if github_url:
+        contact_parts.append(f'<a href="{escape(github_url)}" style="{styles.link}">GitHub</a>')
+    return (
+        f'<div style="{styles.name}">{escape(name.upper())}</div>'
+        f'<div style="{styles.contact}">{" | ".join(contact_parts)}</div>'
+    )
+
+@lru_cache(maxsize=SECTION_CACHE_SIZE)
+def render_section_html(template_name, section):
+    """One section: its header and entries, with consecutive bullets grouped into a list"""
+    styles = HTML_STYLES[template_name]
+    parts = [f'<div style="{styles.section}">{escape(section.title.upper())}</div>']
+    bullets = []
+    for entry in section.entries:
+        if entry.kind == ENTRY_BULLET:
+            bullets.append(f'<li>{escape(entry.text)}</li>')
+            continue
+        if bullets:
+            parts.append(f'<ul style="{styles.bullet_list}">{"".join(bullets)}</ul>')
+            bullets = []
+        if entry.kind == ENTRY_HEADING:
+            parts.append(f'<div style="{styles.heading}">{escape(entry.text)}</div>')
+        elif entry.kind == ENTRY_SKILL:
+            parts.append(
+                f'<div style="{styles.body}"><span style="{styles.skill_category}">'
+                f'{escape(entry.category)}:</span> {escape(entry.text)}</div>'
+            )
+        elif entry.kind == ENTRY_ITEM:
+            parts.append(f'<div style="{styles.body}">• {escape(entry.text)}</div>')
+        else:
+            parts.append(f'<div style="{styles.body}">{escape(entry.text)}</div>')
+    if bullets:
+        parts.append(f'<ul style="{styles.bullet_list}">{"".join(bullets)}</ul>')
+    return "".join(parts)
+
+def create_template_html(data, template_name, limits=None):
+    """Render resume data (raw or parsed) to a self-contained HTML fragment with inline styles
+    
+    With limits (a RenderLimits) oversized input raises RenderLimitError instead
+    of being laid out, and rendering stops once past the time budget.
+    """
+    resume = as_parsed_resume(data)
+    if limits is not None:
+        check_resume_limits(resume, limits)
+    styles = HTML_STYLES[template_name]
+    header = render_header_html(
+        template_name, resume.name, resume.email, resume.phone, resume.location,
+        resume.linkedin_url, resume.github_url
+    )
+    parts = []
+    with render_budget(limits) as budget:
+        for section in resume.sections:
+            budget.check()
+            parts.append(render_section_html(template_name, section))
+    sections = "".join(parts)
+    return f'<div style="{styles.page}">{header}{sections}</div>'
+
+def html_cache_info():
+    """lru_cache statistics of the header and section caches"""
+    return {"header": render_header_html.cache_info(), "sections": render_section_html.cache_info()}
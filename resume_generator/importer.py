@@ -0,0 +1,465 @@
+"""Import existing DOCX and PDF resumes into resume_data fields
+
+Usage:
+    python -m resume_generator.importer resumes/ -o records.jsonl
+    python -m resume_generator.importer archive.zip cv.pdf -o - --workers 8
+
+Documents are read as lines: DOCX paragraphs straight from word/document.xml
+(list paragraphs marked as bullets, hyperlink targets collected from the
+relationships part), PDFs page by page with pypdf. The header lines before the
+first section title give the name, email, phone, location and profile links;
+the known section titles (and their common variants) route the remaining lines
+into education, projects, experience, achievements and skills, in the same
+text-area format the app and the batch CLI read.
+
+Bulk mode streams files from folders and zip archives to a process pool with a
+bounded number of files in flight; workers open their own file or archive
+member, so no document crosses the process boundary. Each worker keeps the
+archive it last read open, so the members of one archive do not reopen it.
+Archive members larger than MAX_MEMBER_BYTES once extracted, or compressed more
+than MAX_COMPRESSION_RATIO times, are reported as failures instead of being
+read. The JSONL output can be fed straight back to the batch renderer or the
+matcher.
+"""
+
+import argparse
+import io
+import json
+import os
+import re
+import sys
+import time
+import traceback
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import NamedTuple
+
+from .docx_fast import R_NS, REL_NS, W_NS
+from .rendering import RESUME_FIELDS, missing_required_fields
+
+IMPORT_FORMATS = ("docx", "pdf", "txt")
+
+# Bounds on one zip archive member, checked before it is read and again while it streams
+MAX_MEMBER_BYTES = 20 * 1024 * 1024
+MAX_COMPRESSION_RATIO = 100
+
+# Section titles as written in resumes -> resume_data field
+SECTION_TITLES = {
+    "education": "education",
+    "academic background": "education",
+    "education and certifications": "education",
+    "projects": "projects",
+    "personal projects": "projects",
+    "academic projects": "projects",
+    "selected projects": "projects",
+    "key projects": "projects",
+    "professional experience": "experience",
+    "experience": "experience",
+    "work experience": "experience",
+    "relevant experience": "experience",
+    "employment": "experience",
+    "employment history": "experience",
+    "work history": "experience",
+    "career history": "experience",
+    "achievements": "achievements",
+    "awards": "achievements",
+    "honors": "achievements",
+    "honors and awards": "achievements",
+    "awards and achievements": "achievements",
+    "accomplishments": "achievements",
+    "certifications": "achievements",
+    "publications": "achievements",
+    "technical skills": "skills",
+    "skills": "skills",
+    "core competencies": "skills",
+    "technologies": "skills",
+    "tools and technologies": "skills",
+    "skills and tools": "skills",
+}
+# Sections the app has no field for; their lines are dropped
+IGNORED_TITLES = frozenset((
+    "summary", "professional summary", "profile", "objective", "career objective", "about", "about me",
+    "interests", "hobbies", "references", "languages", "volunteering"
+))
+
+BULLET_PREFIX = re.compile(r"^[•●▪◦‣∙·○■□➢►▸*\-–—]\s*")
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_PATTERN = re.compile(r"\+?\(?\d[\d\s().-]{6,}\d")
+PROFILE_URL_PATTERN = re.compile(r"(?:https?://)?(?:www\.)?(?:linkedin|github)\.com/[^\s|,;]+", re.IGNORECASE)
+CONTACT_SEPARATOR = re.compile(r"\s*(?:[|•·◆♦▪\t]|\s{3,}|📧|📞|📍|🔗|💻|✉️?|☎️?)\s*")
+CONTACT_LABEL = re.compile(r"^(?:e-?mail|phone|tel|mobile|cell|address|location)\s*:\s*", re.IGNORECASE)
+LINK_LABELS = frozenset(("linkedin", "github", "portfolio", "website"))
+PAGE_NUMBER = re.compile(r"^(?:page\s+)?\d+(?:\s+(?:of|/)\s+\d+)?$", re.IGNORECASE)
+# A PDF line after a bullet continues it when the bullet ends mid-phrase
+CONTINUATION_END = re.compile(r"(?:[,;:&/(-]|\b(?:and|or|to|of|the|a|an|with|for|in|on|by))$", re.IGNORECASE)
+
+W = f"{{{W_NS}}}"
+
+class SourceLine(NamedTuple):
+    """One line of an imported document"""
+    text: str
+    bullet: bool = False  # A list paragraph, whose bullet is not part of the text
+
+class ImportResult(NamedTuple):
+    """Outcome of importing one file"""
+    index: int
+    source: str
+    data: dict
+    missing: tuple = ()  # Required fields the document did not provide
+    error: str = ""
+    seconds: float = 0.0
+
+class ResumeImportError(ValueError):
+    """A document could not be imported: an unsupported format, or a corrupt or oversized file"""
+
+def _relationship_targets(package):
+    """{rId: target} of word/document.xml's relationships"""
+    try:
+        rels_xml = package.read("word/_rels/document.xml.rels")
+    except KeyError:
+        return {}
+    return {
+        rel.get("Id"): rel.get("Target")
+        for rel in ET.fromstring(rels_xml).iter(f"{{{REL_NS}}}Relationship")
+    }
+
+def _paragraph_lines(paragraph):
+    """Lines of one w:p, split at line breaks; list paragraphs are bullets"""
+    style = paragraph.find(f"{W}pPr/{W}pStyle")
+    bullet = (paragraph.find(f"{W}pPr/{W}numPr") is not None
+              or (style is not None and "List" in (style.get(f"{W}val") or "")))
+    pieces = []
+    for node in paragraph.iter():
+        if node.tag == f"{W}t":
+            pieces.append(node.text or "")
+        elif node.tag == f"{W}tab":
+            pieces.append("\t")
+        elif node.tag in (f"{W}br", f"{W}cr"):
+            pieces.append("\n")
+    return [SourceLine(text, bullet) for text in "".join(pieces).split("\n")]
+
+def docx_lines(source):
+    """(lines, link targets) of a DOCX path or binary file, streamed from word/document.xml"""
+    lines = []
+    links = []
+    try:
+        package = zipfile.ZipFile(source)
+    except zipfile.BadZipFile as exc:
+        raise ResumeImportError(f"unreadable DOCX: {exc}") from exc
+    with package:
+        if "word/document.xml" not in package.namelist():
+            raise ResumeImportError("unreadable DOCX: no word/document.xml")
+        try:
+            targets = _relationship_targets(package)
+            with package.open("word/document.xml") as document:
+                for _, element in ET.iterparse(document):
+                    if element.tag == f"{W}hyperlink":
+                        target = targets.get(element.get(f"{{{R_NS}}}id"))
+                        if target:
+                            links.append(target)
+                    elif element.tag == f"{W}p":
+                        lines += _paragraph_lines(element)
+                        # Paragraphs nested in text boxes end first; clearing them keeps them out of the outer one
+                        element.clear()
+        except ET.ParseError as exc:
+            raise ResumeImportError(f"unreadable DOCX: {exc}") from exc
+    return lines, links
+
+def _pypdf():
+    try:
+        import pypdf
+    except ImportError as exc:
+        raise ImportError("Importing PDF resumes needs pypdf; install it with: pip install pypdf") from exc
+    return pypdf
+
+def pdf_lines(source):
+    """(lines, link targets) of a text-based PDF path or binary file"""
+    pypdf = _pypdf()
+    lines = []
+    links = []
+    try:
+        for page in pypdf.PdfReader(source).pages:
+            lines += [SourceLine(text) for text in (page.extract_text() or "").splitlines()]
+            for annotation in page.get("/Annots") or ():
+                action = annotation.get_object().get("/A") or {}
+                if action.get("/URI"):
+                    links.append(str(action["/URI"]))
+    except pypdf.errors.PyPdfError as exc:
+        raise ResumeImportError(f"unreadable PDF: {exc}") from exc
+    return lines, links
+
+def text_lines(text):
+    """Lines of plain text"""
+    return [SourceLine(line) for line in text.splitlines()]
+
+def _section_field(text):
+    """resume_data field a section title line starts, "" for ignored sections, None for other lines"""
+    title = re.sub(r"\s+", " ", text.strip().rstrip(":").replace("&", "and")).lower()
+    if title in SECTION_TITLES:
+        return SECTION_TITLES[title]
+    if title in IGNORED_TITLES:
+        return ""
+    return None
+
+def _header_fields(lines, links):
+    """name, email, phone, location, linkedin and github from the header lines and document links"""
+    fields = {}
+    for url in links:
+        for field in ("linkedin", "github"):
+            if f"{field}.com" in url.lower():
+                fields.setdefault(field, url)
+    for line in lines:
+        for piece in CONTACT_SEPARATOR.split(line):
+            piece = CONTACT_LABEL.sub("", piece.strip())
+            for url in PROFILE_URL_PATTERN.findall(piece):
+                fields.setdefault("linkedin" if "linkedin" in url.lower() else "github", url)
+            piece = PROFILE_URL_PATTERN.sub(" ", piece)
+            for pattern, field in ((EMAIL_PATTERN, "email"), (PHONE_PATTERN, "phone")):
+                match = pattern.search(piece)
+                if match:
+                    fields.setdefault(field, match.group().strip())
+                    piece = piece[:match.start()] + " " + piece[match.end():]
+            rest = piece.strip(" ,;:")
+            if not rest or rest.lower() in LINK_LABELS:
+                continue
+            if "name" not in fields:
+                # Templates print the name in capitals; keep the form's usual casing
+                fields["name"] = rest.title() if rest.isupper() else rest
+            elif "location" not in fields and ("," in rest or rest.lower() == "remote"):
+                fields["location"] = rest
+    return fields
+
+def _continues(previous, text):
+    """Whether a wrapped PDF line continues the previous line"""
+    return text[:1].islower() or text[:1].isdigit() or bool(CONTINUATION_END.search(previous))
+
+def resume_from_lines(lines, links=(), wrapped=False):
+    """resume_data dict from document lines; wrapped=True re-joins lines a PDF wrapped"""
+    header = []
+    sections = {}
+    field = None  # None before the first section title, "" inside an ignored section
+    for line in lines:
+        text = line.text.strip()
+        if not text or (wrapped and PAGE_NUMBER.match(text)):
+            continue
+        title_field = None if line.bullet else _section_field(text)
+        if title_field is not None:
+            field = title_field
+            continue
+        if field is None:
+            header.append(text)
+            continue
+        if not field:
+            continue
+        bullet = line.bullet or bool(BULLET_PREFIX.match(text))
+        text = BULLET_PREFIX.sub("", text) if bullet and not line.bullet else text
+        if not text:
+            continue
+        entries = sections.setdefault(field, [])
+        if wrapped and not bullet and entries:
+            previous_bullet, previous = entries[-1]
+            if ((previous_bullet and _continues(previous, text))
+                    or (field == "skills" and ":" not in text and previous.endswith(","))):
+                entries[-1] = (previous_bullet, f"{previous} {text}")
+                continue
+        entries.append((bullet, text))
+    data = {field: "" for field in RESUME_FIELDS}
+    data.update(_header_fields(header, links))
+    for field, entries in sections.items():
+        if field in ("projects", "experience"):
+            # Bullets in the form's "• " notation; other lines are project names and job titles
+            lines = [f"• {text}" if bullet else text for bullet, text in entries]
+        else:
+            lines = [text for _, text in entries]
+        data[field] = "\n".join(lines)
+    return data
+
+def _format_of(filename):
+    extension = os.path.splitext(filename)[1].lower().lstrip(".")
+    if extension not in IMPORT_FORMATS:
+        raise ResumeImportError(f"Unsupported resume format: {filename} (expected {', '.join(IMPORT_FORMATS)})")
+    return extension
+
+def import_resume(source, filename=None):
+    """resume_data dict from a DOCX, PDF or text resume at a path, or in a binary file named filename
+    
+    Raises ResumeImportError (a ValueError) for unsupported or unreadable
+    documents, OSError when a path cannot be opened, and ImportError for PDFs
+    when pypdf is not installed.
+    """
+    file_format = _format_of(filename or source)
+    try:
+        if file_format == "docx":
+            return resume_from_lines(*docx_lines(source))
+        if file_format == "pdf":
+            return resume_from_lines(*pdf_lines(source), wrapped=True)
+        if isinstance(source, str):
+            with open(source, encoding="utf-8", errors="replace") as text_file:
+                return resume_from_lines(text_lines(text_file.read()))
+        return resume_from_lines(text_lines(source.read().decode("utf-8", errors="replace")))
+    except (ResumeImportError, ImportError, OSError):
+        raise
+    except Exception as exc:
+        # A malformed document can fail anywhere in zipfile, zlib, ElementTree or pypdf
+        raise ResumeImportError(f"unreadable {file_format.upper()}: {type(exc).__name__}: {exc}") from exc
+
+def iter_sources(paths):
+    """Yield (source name, path, zip member or None, error) of every importable file under the given paths
+    
+    error is empty, except for an input that does not exist or an archive that
+    cannot be opened: those are yielded once with the reason, so they are
+    reported as failures without stopping the other inputs.
+    """
+    for path in paths:
+        if not os.path.exists(path):
+            yield path, path, None, "FileNotFoundError: no such file or directory"
+        elif os.path.isdir(path):
+            for directory, subdirectories, files in os.walk(path):
+                subdirectories.sort()
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower().lstrip(".") in IMPORT_FORMATS:
+                        file_path = os.path.join(directory, name)
+                        yield file_path, file_path, None, ""
+        elif path.lower().endswith(".zip"):
+            try:
+                with zipfile.ZipFile(path) as archive:
+                    members = [info for info in archive.infolist() if not info.is_dir()]
+            except (OSError, zipfile.BadZipFile) as exc:
+                yield path, path, None, f"{type(exc).__name__}: {exc}"
+                continue
+            for info in members:
+                if os.path.splitext(info.filename)[1].lower().lstrip(".") in IMPORT_FORMATS:
+                    problem = _member_problem(info)
+                    yield f"{path}!{info.filename}", path, info.filename, problem and f"ResumeImportError: {problem}"
+        else:
+            yield path, path, None, ""
+
+def _member_problem(info):
+    """Why a zip member must not be extracted, from its ZipInfo sizes; empty when it is within bounds"""
+    if info.file_size > MAX_MEMBER_BYTES:
+        return f"{info.file_size} bytes extracted, over the {MAX_MEMBER_BYTES} byte limit"
+    if info.file_size > MAX_COMPRESSION_RATIO * max(info.compress_size, 1):
+        return f"compressed {info.file_size // max(info.compress_size, 1)}:1, over the " \
+               f"{MAX_COMPRESSION_RATIO}:1 limit"
+    return ""
+
+# The archive this process read its last member from: [path, ZipFile]
+_open_archive = [None, None]
+
+def _archive(path):
+    """ZipFile of path, reusing the one this process has open when it is the same archive"""
+    if _open_archive[0] != path:
+        _close_archive()
+        _open_archive[:] = [path, zipfile.ZipFile(path)]
+    return _open_archive[1]
+
+def _close_archive():
+    if _open_archive[1] is not None:
+        _open_archive[1].close()
+    _open_archive[:] = [None, None]
+
+def _read_member(archive, member):
+    """Bytes of one archive member, refused by its sizes or cut off at MAX_MEMBER_BYTES while streaming
+    
+    The recorded sizes are checked first, but a crafted archive can understate
+    them, so the stream is capped as well. Raises ResumeImportError either way.
+    """
+    problem = _member_problem(archive.getinfo(member))
+    if problem:
+        raise ResumeImportError(problem)
+    with archive.open(member) as stream:
+        data = stream.read(MAX_MEMBER_BYTES + 1)
+    if len(data) > MAX_MEMBER_BYTES:
+        raise ResumeImportError(f"more than {MAX_MEMBER_BYTES} bytes extracted")
+    return data
+
+def import_source(index, source, path, member=None, error=""):
+    """Import one file or zip archive member, capturing failures; error is iter_sources' reason for a bad input"""
+    started = time.perf_counter()
+    if error:
+        return ImportResult(index, source, {}, error=error)
+    try:
+        if member is None:
+            data = import_resume(path)
+        else:
+            # Members are read into memory one at a time; PDF and DOCX readers need to seek
+            data = import_resume(io.BytesIO(_read_member(_archive(path), member)), member)
+        return ImportResult(index, source, data, tuple(missing_required_fields(data)),
+                            seconds=time.perf_counter() - started)
+    except Exception as exc:
+        if member is not None:
+            # A failure may have left the archive unusable; the next member opens it afresh
+            _close_archive()
+        error = f"{type(exc).__name__}: {exc}\n{traceback.format_exc(limit=3)}"
+        return ImportResult(index, source, {}, error=error, seconds=time.perf_counter() - started)
+
+def import_files(sources, workers=None, max_pending=None):
+    """Import iter_sources tuples across a process pool, yielding ImportResults as they complete
+    
+    At most max_pending files are in flight at once, so memory stays bounded no
+    matter how many files the folders and archives hold.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        try:
+            for index, entry in enumerate(sources):
+                yield import_source(index, *entry)
+        finally:
+            _close_archive()
+        return
+    
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for index, entry in enumerate(sources):
+            pending.add(executor.submit(import_source, index, *entry))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+def build_parser():
+    """Command line interface of the importer"""
+    parser = argparse.ArgumentParser(
+        prog="python -m resume_generator.importer",
+        description="Extract resume_data fields from DOCX, PDF and text resumes into JSONL records."
+    )
+    parser.add_argument("inputs", nargs="+", help="Resume files, folders or .zip archives")
+    parser.add_argument("-o", "--output", required=True, help="Output .jsonl file ('-' writes to stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    return parser
+
+def main(argv=None):
+    """Import every input file and report per-file failures; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    started = time.perf_counter()
+    imported = incomplete = failed = 0
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for result in import_files(iter_sources(args.inputs), args.workers):
+            if result.error:
+                failed += 1
+                print(f"[FAILED] {result.source}: {result.error}", file=sys.stderr)
+                continue
+            if result.missing:
+                incomplete += 1
+                print(f"[INCOMPLETE] {result.source}: missing {', '.join(result.missing)}", file=sys.stderr)
+            output.write(json.dumps({"id": result.source, **result.data}, ensure_ascii=False) + "\n")
+            imported += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    
+    elapsed = time.perf_counter() - started
+    print(f"Imported {imported} resumes in {elapsed:.2f}s ({incomplete} incomplete, {failed} failed) -> {args.output}",
+          file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
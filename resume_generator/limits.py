@@ -0,0 +1,156 @@
+"""Input size limits, render time budgets and cancellation
+
+One pathological resume (a huge blob pasted into a text area) could otherwise
+keep a worker laying out dozens of pages while other users wait. Oversized
+input is rejected before rendering starts; while a render runs, the renderers
+check the active RenderBudget at every section (DOCX) or laid-out flowable
+(PDF), so a render that passes its wall-clock budget or page limit, or is
+cancelled from another thread, stops within one flowable. Every failure is a
+RenderLimitError, a ValueError, so callers that already report bad input
+report these too.
+
+Limits are configured with RESUME_MAX_FIELD_CHARS, RESUME_MAX_TOTAL_CHARS,
+RESUME_MAX_LINES, RESUME_MAX_PAGES and RESUME_RENDER_BUDGET (seconds); 0
+disables a limit. A value that is not a non-negative number is a ValueError
+naming the variable, raised when the limits are read.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import NamedTuple
+
+from .model import ParsedResume
+
+class RenderLimits(NamedTuple):
+    """Bounds on one render; 0 or None disables a bound"""
+    max_field_chars: int = 20_000  # Characters in any one field or section
+    max_total_chars: int = 60_000  # Characters in the whole resume
+    max_lines: int = 300  # Lines in any one field or section
+    max_pages: int = 10  # PDF pages
+    time_budget: float = 10.0  # Seconds of wall-clock time per render
+
+DEFAULT_LIMITS = RenderLimits()
+
+# Environment variable -> RenderLimits field
+LIMIT_VARIABLES = {
+    "RESUME_MAX_FIELD_CHARS": "max_field_chars",
+    "RESUME_MAX_TOTAL_CHARS": "max_total_chars",
+    "RESUME_MAX_LINES": "max_lines",
+    "RESUME_MAX_PAGES": "max_pages",
+    "RESUME_RENDER_BUDGET": "time_budget",
+}
+
+class RenderLimitError(ValueError):
+    """A resume or render exceeded a configured limit"""
+
+class RenderTimeout(RenderLimitError):
+    """A render ran past its wall-clock budget"""
+
+class RenderCancelled(RenderLimitError):
+    """A render was cancelled before it finished"""
+
+def limits_from_env(environ=None):
+    """RenderLimits with any RESUME_MAX_* / RESUME_RENDER_BUDGET overrides applied
+    
+    Raises ValueError naming the variable when a value is malformed or negative.
+    """
+    environ = os.environ if environ is None else environ
+    overrides = {}
+    for variable, field in LIMIT_VARIABLES.items():
+        value = environ.get(variable)
+        if not value:
+            continue
+        kind = type(DEFAULT_LIMITS._field_defaults[field])
+        try:
+            limit = kind(value.strip())
+        except ValueError:
+            limit = None
+        if limit is None or limit < 0:
+            expected = "a whole number" if kind is int else "a number"
+            raise ValueError(f"{variable}={value!r} is not valid: expected {expected}, 0 or more "
+                             f"(0 disables the limit)")
+        overrides[field] = limit
+    return DEFAULT_LIMITS._replace(**overrides)
+
+def _sized_parts(data):
+    """(label, characters, lines) of every field of raw resume_data or section of a parsed resume"""
+    if isinstance(data, ParsedResume):
+        for field in ("name", "email", "phone", "location", "linkedin_url", "github_url"):
+            value = getattr(data, field)
+            yield field.replace("_url", "").capitalize(), len(value), 1
+        for section in data.sections:
+            chars = sum(len(entry.text) + len(entry.category) for entry in section.entries)
+            yield section.title, chars, len(section.entries)
+        return
+    for field, value in data.items():
+        value = str(value or "")
+        yield field.capitalize(), len(value), value.count("\n") + 1
+
+def check_resume_limits(data, limits=DEFAULT_LIMITS):
+    """Raise RenderLimitError when a resume (raw or parsed) is too large to render"""
+    total = 0
+    for label, chars, lines in _sized_parts(data):
+        total += chars
+        if limits.max_field_chars and chars > limits.max_field_chars:
+            raise RenderLimitError(f"{label} is {chars:,} characters long (limit {limits.max_field_chars:,})")
+        if limits.max_lines and lines > limits.max_lines:
+            raise RenderLimitError(f"{label} has {lines:,} lines (limit {limits.max_lines:,})")
+    if limits.max_total_chars and total > limits.max_total_chars:
+        raise RenderLimitError(f"Resume is {total:,} characters long (limit {limits.max_total_chars:,})")
+
+class RenderBudget:
+    """Wall-clock deadline, page limit and cancellation flag of one render"""
+    
+    __slots__ = ("seconds", "max_pages", "cancel_event", "deadline")
+    
+    def __init__(self, seconds=None, max_pages=None, cancel_event=None):
+        self.seconds = seconds
+        self.max_pages = max_pages
+        self.cancel_event = cancel_event
+        self.deadline = time.monotonic() + seconds if seconds else None
+    
+    def cancel(self):
+        """Make the render stop at its next check"""
+        if self.cancel_event is None:
+            self.cancel_event = threading.Event()
+        self.cancel_event.set()
+    
+    def check(self, pages=0):
+        """Raise if the render was cancelled, is over its budget, or has laid out too many pages"""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise RenderCancelled("Render was cancelled")
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise RenderTimeout(f"Render took longer than {self.seconds:.3g}s and was stopped")
+        if self.max_pages and pages > self.max_pages:
+            raise RenderLimitError(f"Resume is longer than the {self.max_pages}-page limit")
+
+class _NullRenderBudget:
+    """Stand-in budget used when a render has no limits"""
+    
+    __slots__ = ()
+    
+    def check(self, pages=0):
+        pass
+
+_NULL_RENDER_BUDGET = _NullRenderBudget()
+_active_budget = ContextVar("resume_render_budget", default=_NULL_RENDER_BUDGET)
+
+def current_budget():
+    """Budget of the render running in this thread (or task); a shared no-op when it has none"""
+    return _active_budget.get()
+
+@contextmanager
+def render_budget(limits=None, cancel_event=None):
+    """Run the renders inside the block under limits' time budget and page limit, cancellable through cancel_event"""
+    if limits is None and cancel_event is None:
+        yield _NULL_RENDER_BUDGET
+        return
+    budget = RenderBudget(limits.time_budget if limits else None, limits.max_pages if limits else None, cancel_event)
+    token = _active_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _active_budget.reset(token)
@@ -0,0 +1,334 @@
+"""ATS-style keyword matching of resumes against job descriptions
+
+Usage:
+    python -m resume_generator.matching resumes.jsonl jobs.jsonl --top 5
+
+Parsed resume sections are tokenized into keywords: every skill of a
+"Category: a, b, c" line as a whole phrase plus its words, and the words and
+word pairs of experience and project lines. Resumes and job descriptions share
+one vocabulary and become rows of sparse TF-IDF matrices (sublinear term
+frequency, smoothed IDF, L2-normalized rows), so every resume is scored against
+every job with a single sparse matrix product. MatchIndex is incremental: a
+resume is re-tokenized only when its content changes, and the matrices are
+re-assembled from the stored per-document term arrays without re-tokenizing.
+
+Needs NumPy and SciPy (pip install numpy scipy).
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import Counter
+from typing import NamedTuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError as exc:
+    raise ImportError(
+        "resume_generator.matching needs NumPy and SciPy; install them with: pip install numpy scipy"
+    ) from exc
+
+from .deterministic import content_hash
+from .model import ENTRY_BULLET, ENTRY_HEADING, ENTRY_ITEM, ENTRY_SKILL, ENTRY_TEXT, as_parsed_resume
+
+# Section titles as produced by parse_resume
+KEYWORD_SECTIONS = ("Projects", "Professional Experience", "Technical Skills", "Achievements")
+
+# Word pairs never span these, so "Python, Go" does not yield "python go"
+PHRASE_BREAK = re.compile(r"[,;:|()\[\]!?]|\.(?:\s|$)|\s[-–—]\s")
+# Keeps tokens such as c++, c#, node.js and ci/cd whole
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does
+doing during each etc for from had has have having he her here him his how i if in into is it its
+just me more most my new no nor not of on once only or other our out over own per same she should
+so some such than that the their them then there these they this those through to too under until
+up very was we were what when where which while who whom why will with within without would you
+your years year work working using used use able strong experience team including across well
+need needs looking join ideal candidate role required requirements preferred must nice plus
+""".split())
+
+class Match(NamedTuple):
+    """One resume's score against one job, with the job's top keywords it lacks"""
+    resume_id: str
+    job_id: str
+    score: float
+    missing: tuple = ()
+
+def tokenize(text):
+    """Lowercase keyword tokens of free text, stop words removed"""
+    tokens = (token.rstrip(".") for token in TOKEN_PATTERN.findall((text or "").lower()))
+    return [token for token in tokens if token and token not in STOP_WORDS]
+
+def text_terms(text):
+    """Words and adjacent word pairs of free text; pairs stay within a phrase and skip stop words"""
+    terms = []
+    for phrase in PHRASE_BREAK.split((text or "").lower()):
+        tokens = [token.rstrip(".") for token in TOKEN_PATTERN.findall(phrase)]
+        terms += [token for token in tokens if token and token not in STOP_WORDS]
+        terms += [
+            f"{first} {second}" for first, second in zip(tokens, tokens[1:])
+            if first and second and first not in STOP_WORDS and second not in STOP_WORDS
+        ]
+    return terms
+
+def skill_terms(skills):
+    """A comma-separated skills list as whole-skill phrases plus their words"""
+    terms = []
+    for skill in re.split(r"[,;]", skills):
+        words = tokenize(skill)
+        if words:
+            terms.append(" ".join(words))
+            if len(words) > 1:
+                terms.extend(words)
+    return terms
+
+def resume_terms(data):
+    """Keyword counts of a resume (raw or parsed): skills, experience, projects and achievements"""
+    resume = as_parsed_resume(data)
+    counts = Counter()
+    for section in resume.sections:
+        if section.title not in KEYWORD_SECTIONS:
+            continue
+        for entry in section.entries:
+            if entry.kind == ENTRY_SKILL or section.title == "Technical Skills":
+                # The category ("Languages" in "Languages: Python, Go") is a label, not a keyword
+                counts.update(skill_terms(entry.text))
+            elif entry.kind in (ENTRY_BULLET, ENTRY_HEADING, ENTRY_ITEM, ENTRY_TEXT):
+                counts.update(text_terms(entry.text))
+    return counts
+
+def job_terms(text):
+    """Keyword counts of a job description"""
+    return Counter(text_terms(text))
+
+def document_hash(value):
+    """Stable hash deciding whether a document changed since it was indexed"""
+    return content_hash(json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+
+class _Rows:
+    """Documents of one kind as term-index/count arrays, kept in insertion order"""
+    
+    def __init__(self):
+        self.ids = []
+        self.positions = {}  # id -> row
+        self.hashes = []
+        self.columns = []  # per row: int32 array of vocabulary indices
+        self.counts = []  # per row: float64 array of term counts
+    
+    def put(self, doc_id, digest, columns, counts):
+        row = self.positions.get(doc_id)
+        if row is None:
+            self.positions[doc_id] = len(self.ids)
+            self.ids.append(doc_id)
+            self.hashes.append(digest)
+            self.columns.append(columns)
+            self.counts.append(counts)
+        else:
+            self.hashes[row], self.columns[row], self.counts[row] = digest, columns, counts
+    
+    def remove(self, doc_id):
+        row = self.positions.pop(doc_id)
+        for values in (self.ids, self.hashes, self.columns, self.counts):
+            del values[row]
+        for later_id in self.ids[row:]:
+            self.positions[later_id] -= 1
+    
+    def matrix(self, width):
+        """Sparse CSR matrix of raw counts, one row per document"""
+        lengths = np.fromiter((len(columns) for columns in self.columns), dtype=np.int64, count=len(self.columns))
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        indices = np.concatenate(self.columns) if self.columns else np.empty(0, dtype=np.int32)
+        data = np.concatenate(self.counts) if self.counts else np.empty(0)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(self.ids), width))
+
+class MatchIndex:
+    """Incremental TF-IDF index of resumes and job descriptions over a shared vocabulary"""
+    
+    def __init__(self):
+        self.vocabulary = {}  # term -> column
+        self.terms = []  # column -> term
+        self.tokenized = 0  # documents tokenized so far; unchanged re-adds are not counted
+        self._resumes = _Rows()
+        self._jobs = _Rows()
+        self._weighted = None  # (resume TF-IDF, job TF-IDF, idf) until the next change
+    
+    def _columns(self, counts):
+        """Vocabulary columns and counts of a term Counter, growing the vocabulary as needed"""
+        columns = np.empty(len(counts), dtype=np.int32)
+        values = np.empty(len(counts))
+        for position, (term, count) in enumerate(counts.items()):
+            column = self.vocabulary.get(term)
+            if column is None:
+                column = self.vocabulary[term] = len(self.terms)
+                self.terms.append(term)
+            columns[position] = column
+            values[position] = count
+        return columns, values
+    
+    def _put(self, rows, doc_id, digest, tokenize_document):
+        row = rows.positions.get(doc_id)
+        if row is not None and rows.hashes[row] == digest:
+            return False
+        columns, values = self._columns(tokenize_document())
+        rows.put(doc_id, digest, columns, values)
+        self.tokenized += 1
+        self._weighted = None
+        return True
+    
+    def add_resume(self, resume_id, data):
+        """Index or update a resume (raw or parsed); returns False when it was already indexed unchanged"""
+        resume = as_parsed_resume(data)
+        return self._put(self._resumes, resume_id, document_hash(resume), lambda: resume_terms(resume))
+    
+    def add_job(self, job_id, text):
+        """Index or update a job description; returns False when it was already indexed unchanged"""
+        return self._put(self._jobs, job_id, document_hash(text), lambda: job_terms(text))
+    
+    def remove_resume(self, resume_id):
+        self._resumes.remove(resume_id)
+        self._weighted = None
+    
+    def remove_job(self, job_id):
+        self._jobs.remove(job_id)
+        self._weighted = None
+    
+    @property
+    def resume_ids(self):
+        return list(self._resumes.ids)
+    
+    @property
+    def job_ids(self):
+        return list(self._jobs.ids)
+    
+    def _tfidf(self):
+        """(resume matrix, job matrix, idf) with sublinear TF, smoothed IDF and L2-normalized rows"""
+        if self._weighted is None:
+            width = len(self.terms)
+            resumes = self._resumes.matrix(width)
+            jobs = self._jobs.matrix(width)
+            documents = resumes.shape[0] + jobs.shape[0]
+            document_frequency = np.bincount(resumes.indices, minlength=width) + np.bincount(jobs.indices, minlength=width)
+            idf = np.log((1 + documents) / (1 + document_frequency)) + 1
+            self._weighted = (_weight(resumes, idf), _weight(jobs, idf), idf)
+        return self._weighted
+    
+    def scores(self):
+        """Dense (resumes x jobs) array of cosine similarities, rows and columns in resume_ids/job_ids order"""
+        resumes, jobs, _ = self._tfidf()
+        return (resumes @ jobs.T).toarray()
+    
+    def missing_keywords(self, resume_id, job_id, limit=10):
+        """A job's highest-weighted keywords that the resume does not contain"""
+        resumes, jobs, _ = self._tfidf()
+        job_row = jobs.getrow(self._jobs.positions[job_id])
+        resume_columns = resumes.indices[resumes.indptr[self._resumes.positions[resume_id]]:
+                                         resumes.indptr[self._resumes.positions[resume_id] + 1]]
+        absent = ~np.isin(job_row.indices, resume_columns)
+        columns, weights = job_row.indices[absent], job_row.data[absent]
+        order = np.argsort(-weights, kind="stable")[:limit]
+        return tuple(self.terms[column] for column in columns[order])
+    
+    def rank_resumes(self, job_id, top=10, missing_limit=10):
+        """Best-matching resumes for a job, highest score first"""
+        resumes, jobs, _ = self._tfidf()
+        column = (resumes @ jobs.getrow(self._jobs.positions[job_id]).T).toarray().ravel()
+        order = np.argsort(-column, kind="stable")[:top]
+        return [
+            Match(self._resumes.ids[row], job_id, float(column[row]),
+                  self.missing_keywords(self._resumes.ids[row], job_id, missing_limit))
+            for row in order
+        ]
+    
+    def rank_jobs(self, resume_id, top=10, missing_limit=10):
+        """Best-matching jobs for a resume, highest score first"""
+        resumes, jobs, _ = self._tfidf()
+        row = (jobs @ resumes.getrow(self._resumes.positions[resume_id]).T).toarray().ravel()
+        order = np.argsort(-row, kind="stable")[:top]
+        return [
+            Match(resume_id, self._jobs.ids[column], float(row[column]),
+                  self.missing_keywords(resume_id, self._jobs.ids[column], missing_limit))
+            for column in order
+        ]
+    
+    def top_matches(self, top=5, missing_limit=10):
+        """{job_id: best resumes} for every job, from one sparse product"""
+        scores = self.scores()
+        if not scores.size:
+            return {job_id: [] for job_id in self._jobs.ids}
+        top = min(top, scores.shape[0])
+        # Partial sort per job column, then order only the selected rows
+        best = np.argpartition(-scores, top - 1, axis=0)[:top]
+        matches = {}
+        for column, job_id in enumerate(self._jobs.ids):
+            rows = best[:, column][np.argsort(-scores[best[:, column], column], kind="stable")]
+            matches[job_id] = [
+                Match(self._resumes.ids[row], job_id, float(scores[row, column]),
+                      self.missing_keywords(self._resumes.ids[row], job_id, missing_limit))
+                for row in rows
+            ]
+        return matches
+
+def _weight(counts, idf):
+    """Sublinear TF times IDF, each row scaled to unit length"""
+    weighted = counts.copy()
+    weighted.data = (1 + np.log(weighted.data)) * idf[weighted.indices]
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.csr_matrix(sparse.diags(1 / norms) @ weighted)
+
+def build_parser():
+    """Command line interface of the matcher"""
+    parser = argparse.ArgumentParser(
+        prog="python -m resume_generator.matching",
+        description="Rank resumes against job descriptions by TF-IDF keyword similarity."
+    )
+    parser.add_argument("resumes", help="Resumes as .jsonl or .csv with the resume_data fields (and an optional id)")
+    parser.add_argument("jobs", help="Job descriptions as .jsonl or .csv with id and description (or text)")
+    parser.add_argument("--top", type=int, default=5, help="Resumes listed per job (default: 5)")
+    parser.add_argument("--missing", type=int, default=10, help="Missing keywords listed per match (default: 10)")
+    return parser
+
+def main(argv=None):
+    """Print the best resumes for every job as JSON lines; returns the exit code"""
+    from .batch import load_record, read_records
+    from .model import parse_resume
+    from .rendering import RESUME_FIELDS, missing_required_fields
+    
+    args = build_parser().parse_args(argv)
+    started = time.perf_counter()
+    index = MatchIndex()
+    for position, record in enumerate(read_records(args.resumes)):
+        try:
+            record = load_record(record)
+        except ValueError as exc:
+            print(f"[SKIPPED] resume {position}: {exc}", file=sys.stderr)
+            continue
+        if missing_required_fields(record):
+            print(f"[SKIPPED] resume {record.get('id') or position}: missing required fields", file=sys.stderr)
+            continue
+        index.add_resume(str(record.get('id') or position),
+                         parse_resume({field: record.get(field) or "" for field in RESUME_FIELDS}))
+    for position, record in enumerate(read_records(args.jobs)):
+        try:
+            record = load_record(record)
+        except ValueError as exc:
+            print(f"[SKIPPED] job {position}: {exc}", file=sys.stderr)
+            continue
+        index.add_job(str(record.get('id') or position), record.get('description') or record.get('text') or "")
+    indexed = time.perf_counter()
+    
+    matches = index.top_matches(args.top, args.missing)
+    for job_id, job_matches in matches.items():
+        print(json.dumps({"job": job_id, "matches": [match._asdict() for match in job_matches]}, ensure_ascii=False))
+    pairs = len(index.resume_ids) * len(index.job_ids)
+    print(f"Scored {pairs} resume/job pairs ({len(index.terms)} terms): indexed in {indexed - started:.2f}s, "
+          f"matched in {time.perf_counter() - indexed:.2f}s", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
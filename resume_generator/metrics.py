@@ -0,0 +1,161 @@
+"""Per-stage render timing with Prometheus and JSON export
+
+Renderers call stage_timer() once per document and lap() at the end of each
+stage (build, save for DOCX; story, layout for PDF); parse_resume times the
+"parse" stage wherever resume_data is actually parsed. While no
+observer is registered stage_timer() returns a shared no-op timer, so disabled
+instrumentation costs one global lookup and a few empty method calls per render.
+"""
+
+import json
+import os
+import threading
+import time
+
+# Upper bounds (seconds) of the latency histogram buckets
+HISTOGRAM_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class RenderMetrics:
+    """Thread-safe counters and latency histograms per (template, format, stage)"""
+    
+    def __init__(self, buckets=HISTOGRAM_BUCKETS):
+        self.buckets = buckets
+        self._series = {}  # (template, format, stage) -> [count, total seconds, bucket counts]
+        self._lock = threading.Lock()
+    
+    def __call__(self, template_name, file_format, stage, seconds):
+        """Record one stage duration; RenderMetrics instances are stage observers"""
+        key = (template_name, file_format, stage)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0, 0.0, [0] * len(self.buckets)]
+            series[0] += 1
+            series[1] += seconds
+            bucket_counts = series[2]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    bucket_counts[i] += 1
+                    break
+    
+    def reset(self):
+        """Forget everything recorded so far"""
+        with self._lock:
+            self._series.clear()
+    
+    def snapshot(self):
+        """List of {template, format, stage, count, sum_seconds, mean_ms, buckets} dicts"""
+        with self._lock:
+            items = sorted((key, series[0], series[1], list(series[2])) for key, series in self._series.items())
+        return [
+            {
+                "template": template_name,
+                "format": file_format,
+                "stage": stage,
+                "count": count,
+                "sum_seconds": total,
+                "mean_ms": total / count * 1000 if count else 0.0,
+                "buckets": dict(zip((str(bound) for bound in self.buckets), _cumulative(bucket_counts)))
+            }
+            for (template_name, file_format, stage), count, total, bucket_counts in items
+        ]
+    
+    def to_json(self):
+        """Snapshot serialized as JSON"""
+        return json.dumps(self.snapshot(), indent=2)
+    
+    def to_prometheus(self, name="resume_render_stage_seconds", help_text="Time spent in each resume render stage."):
+        """Snapshot in the Prometheus text exposition format"""
+        lines = [
+            f"# HELP {name} {help_text}",
+            f"# TYPE {name} histogram"
+        ]
+        for series in self.snapshot():
+            labels = (
+                f'template="{_escape_label(series["template"])}",'
+                f'format="{_escape_label(series["format"])}",'
+                f'stage="{_escape_label(series["stage"])}"'
+            )
+            for bound, count in series["buckets"].items():
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {series["count"]}')
+            lines.append(f'{name}_sum{{{labels}}} {series["sum_seconds"]:.6f}')
+            lines.append(f'{name}_count{{{labels}}} {series["count"]}')
+        return "\n".join(lines) + "\n"
+
+def _cumulative(bucket_counts):
+    total = 0
+    for count in bucket_counts:
+        total += count
+        yield total
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class StageTimer:
+    """Times consecutive stages of one render and reports them to the observers"""
+    
+    __slots__ = ("template_name", "file_format", "observers", "_last")
+    
+    def __init__(self, template_name, file_format, observers):
+        self.template_name = template_name
+        self.file_format = file_format
+        self.observers = observers
+        self._last = time.perf_counter()
+    
+    def lap(self, stage):
+        """Record the time since the previous lap (or the start) as stage"""
+        now = time.perf_counter()
+        seconds = now - self._last
+        self._last = now
+        for observer in self.observers:
+            observer(self.template_name, self.file_format, stage, seconds)
+
+class _NullStageTimer:
+    """Stand-in timer used while instrumentation is disabled"""
+    
+    __slots__ = ()
+    
+    def lap(self, stage):
+        pass
+
+_NULL_STAGE_TIMER = _NullStageTimer()
+
+# Process-wide metrics and the registered observers (callables taking template, format, stage, seconds)
+METRICS = RenderMetrics()
+_observers = ()
+_observers_lock = threading.Lock()
+
+def add_stage_observer(observer):
+    """Register a callable(template_name, file_format, stage, seconds) called for every stage"""
+    global _observers
+    with _observers_lock:
+        if observer not in _observers:
+            _observers = _observers + (observer,)
+
+def remove_stage_observer(observer):
+    """Unregister an observer added with add_stage_observer"""
+    global _observers
+    with _observers_lock:
+        _observers = tuple(registered for registered in _observers if registered is not observer)
+
+def enable_metrics(enabled=True):
+    """Turn aggregation into the process-wide METRICS on or off"""
+    if enabled:
+        add_stage_observer(METRICS)
+    else:
+        remove_stage_observer(METRICS)
+
+def metrics_enabled():
+    """Whether METRICS is currently aggregating"""
+    return METRICS in _observers
+
+def stage_timer(template_name, file_format):
+    """Start timing a render; returns a shared no-op timer when nothing is observing"""
+    observers = _observers
+    if not observers:
+        return _NULL_STAGE_TIMER
+    return StageTimer(template_name, file_format, observers)
+
+if os.environ.get("RESUME_RENDER_METRICS", "").lower() in ("1", "true", "yes"):
+    enable_metrics()
@@ -0,0 +1,105 @@
+from typing import NamedTuple
+
+from .metrics import stage_timer
+from .templates import format_url
+
+# Entry kinds of the parsed resume model
+ENTRY_HEADING = "heading"  # Bold line in the secondary color (school, project name, job title)
+ENTRY_TEXT = "text"  # Plain line
+ENTRY_BULLET = "bullet"  # Line starting with '•' or '-', rendered as a list bullet
+ENTRY_ITEM = "item"  # Achievement line, rendered with a literal '•' prefix
+ENTRY_SKILL = "skill"  # "Category: skills" line
+
+EDUCATION_KEYWORDS = ('university', 'college', 'school', 'institute')
+
+class ResumeEntry(NamedTuple):
+    """One line of a resume section"""
+    kind: str
+    text: str
+    category: str = ""
+
+class ResumeSection(NamedTuple):
+    """A titled resume section and its entries, in display order"""
+    title: str
+    entries: tuple
+
+class ParsedResume(NamedTuple):
+    """Resume data parsed once and shared by the DOCX and PDF renderers"""
+    name: str
+    email: str
+    phone: str
+    location: str
+    linkedin_url: str
+    github_url: str
+    sections: tuple
+
+def _content_lines(text):
+    """Stripped, non-empty lines of a text area value"""
+    return [line.strip() for line in (text or "").strip().split('\n') if line.strip()]
+
+def _parse_education(text):
+    """School names become headings, every other line plain text"""
+    entries = []
+    for line in _content_lines(text):
+        if any(word in line.lower() for word in EDUCATION_KEYWORDS):
+            entries.append(ResumeEntry(ENTRY_HEADING, line))
+        else:
+            entries.append(ResumeEntry(ENTRY_TEXT, line))
+    return tuple(entries)
+
+def _parse_titled_bullets(text):
+    """Lines starting with '•' or '-' become bullets, every other line a heading"""
+    entries = []
+    for line in _content_lines(text):
+        if line.startswith('•') or line.startswith('-'):
+            entries.append(ResumeEntry(ENTRY_BULLET, line[1:].strip()))
+        else:
+            entries.append(ResumeEntry(ENTRY_HEADING, line))
+    return tuple(entries)
+
+def _parse_achievements(text):
+    """Every achievement line becomes a '•' item"""
+    return tuple(ResumeEntry(ENTRY_ITEM, line) for line in _content_lines(text))
+
+def _parse_skills(text):
+    """Split "Category: skills" lines on the first ':'"""
+    entries = []
+    for line in _content_lines(text):
+        if ':' in line:
+            category, skills = line.split(':', 1)
+            entries.append(ResumeEntry(ENTRY_SKILL, skills.strip(), category.strip()))
+        else:
+            entries.append(ResumeEntry(ENTRY_TEXT, line))
+    return tuple(entries)
+
+def parse_resume(data):
+    """Parse resume_data into the section model consumed by every renderer"""
+    # Parsing is template- and format-independent, so its stage carries empty labels
+    timer = stage_timer("", "")
+    sections = [ResumeSection("Education", _parse_education(data['education']))]
+    if data.get('projects') and data['projects'].strip():
+        sections.append(ResumeSection("Projects", _parse_titled_bullets(data['projects'])))
+    # Experience header is always shown, even when the section is empty
+    sections.append(ResumeSection("Professional Experience", _parse_titled_bullets(data.get('experience'))))
+    if data.get('achievements') and data['achievements'].strip():
+        sections.append(ResumeSection("Achievements", _parse_achievements(data['achievements'])))
+    if data.get('skills') and data['skills'].strip():
+        sections.append(ResumeSection("Technical Skills", _parse_skills(data['skills'])))
+    
+    resume = ParsedResume(
+        name=data['name'],
+        email=data['email'],
+        phone=data['phone'],
+        location=data['location'],
+        linkedin_url=format_url(data.get('linkedin')),
+        github_url=format_url(data.get('github')),
+        sections=tuple(sections)
+    )
+    timer.lap("parse")
+    return resume
+
+def as_parsed_resume(data):
+    """Accept either raw resume_data or an already parsed resume"""
+    if isinstance(data, ParsedResume):
+        return data
+    return parse_resume(data)
@@ -0,0 +1,307 @@
+import io
+import threading
+from types import MappingProxyType
+from typing import NamedTuple
+from xml.sax.saxutils import escape
+
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Flowable
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+
+from .fonts import base14_fonts, pdf_fonts
+from .limits import current_budget
+from .metrics import stage_timer
+from .model import ENTRY_BULLET, ENTRY_HEADING, ENTRY_ITEM, ENTRY_SKILL, as_parsed_resume
+from .rendering import DEFAULT_PDF_PROFILE, PDF_PROFILES
+from .templates import RESUME_TEMPLATES
+
+# Page layout shared by every template
+PAGE_MARGINS = {
+    "rightMargin": 0.75*inch,
+    "leftMargin": 0.75*inch,
+    "topMargin": 0.5*inch,
+    "bottomMargin": 0.5*inch
+}
+HEADER_TABLE_WIDTHS = [7*inch]
+
+# Section header band of colored_background templates: 12pt text, 6pt/4pt padding
+BAND_FONT_SIZE = 12
+BAND_PADDING_X = 6
+BAND_PADDING_Y = 4
+BAND_HEIGHT = BAND_FONT_SIZE * 1.2 + 2 * BAND_PADDING_Y
+
+# Paragraph text is ReportLab markup: user text is escaped, and quotes too inside attributes
+ATTRIBUTE_ENTITIES = {'"': "&quot;"}
+
+# Metadata written by the compact profile instead of ReportLab's defaults
+STRIPPED_METADATA = {"title": "", "author": "", "subject": "", "creator": "", "producer": "", "keywords": []}
+
+class PdfStyles(NamedTuple):
+    """Precompiled PDF styling of one template; shared by every render, never mutate"""
+    header_style: str
+    name: ParagraphStyle
+    contact: ParagraphStyle
+    section: ParagraphStyle
+    content: ParagraphStyle
+    job: ParagraphStyle
+    header_table: TableStyle  # Section header band of colored_background templates
+    skill_color: str  # Skill category color as ReportLab markup, e.g. "rgb(0,102,204)"
+    fonts: object  # PdfFonts the styles use
+    band_color: object  # Accent color of the section header band
+
+def compile_pdf_styles(template_name, template_config, base_styles, fonts=None):
+    """Compile a RESUME_TEMPLATES entry into ready-to-use ReportLab styles
+    
+    fonts is a registered PdfFonts; the built-in Helvetica is used by default.
+    """
+    fonts = fonts or base14_fonts()
+    pdf_colors = {role: colors.Color(*rgb) for role, rgb in template_config["pdf_colors"].items()}
+    normal = base_styles['Normal']
+    
+    # Custom styles with template colors - ALWAYS CENTERED FOR CONTACT INFO
+    name_style = ParagraphStyle(
+        f'{template_name} NameStyle',
+        parent=normal,
+        fontSize=18,
+        spaceAfter=6,
+        spaceBefore=0,
+        textColor=pdf_colors["primary"],
+        fontName=fonts.bold,
+        alignment=1  # ALWAYS CENTER (1 = center alignment)
+    )
+    
+    contact_style = ParagraphStyle(
+        f'{template_name} ContactStyle',
+        parent=normal,
+        fontSize=9,
+        spaceAfter=12,
+        spaceBefore=2,
+        textColor=pdf_colors["secondary"],
+        fontName=fonts.regular,
+        alignment=1  # ALWAYS CENTER (1 = center alignment)
+    )
+    
+    section_style = ParagraphStyle(
+        f'{template_name} SectionStyle',
+        parent=normal,
+        fontSize=12,
+        spaceAfter=8,
+        spaceBefore=16,
+        textColor=pdf_colors["primary"],
+        fontName=fonts.bold
+    )
+    
+    content_style = ParagraphStyle(
+        f'{template_name} ContentStyle',
+        parent=normal,
+        fontSize=10,
+        spaceAfter=3,
+        spaceBefore=0,
+        fontName=fonts.regular
+    )
+    
+    job_style = ParagraphStyle(
+        f'{template_name} JobStyle',
+        parent=normal,
+        fontSize=10,
+        spaceAfter=3,
+        spaceBefore=0,
+        textColor=pdf_colors["secondary"],
+        fontName=fonts.bold
+    )
+    
+    header_table_style = TableStyle([
+        ('BACKGROUND', (0,0), (-1,-1), pdf_colors["accent"]),
+        ('TEXTCOLOR', (0,0), (-1,-1), pdf_colors["primary"]),
+        ('FONTNAME', (0,0), (-1,-1), fonts.bold),
+        ('FONTSIZE', (0,0), (-1,-1), 12),
+        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('LEFTPADDING', (0,0), (-1,-1), 6),
+        ('RIGHTPADDING', (0,0), (-1,-1), 6),
+        ('TOPPADDING', (0,0), (-1,-1), 4),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 4),
+    ])
+    
+    # Create RGB values for the skill category color
+    sec_red, sec_green, sec_blue = template_config["pdf_colors"]["secondary"]
+    color_r = int(sec_red * 255)
+    color_g = int(sec_green * 255)
+    color_b = int(sec_blue * 255)
+    
+    return PdfStyles(
+        header_style=template_config["header_style"],
+        name=name_style,
+        contact=contact_style,
+        section=section_style,
+        content=content_style,
+        job=job_style,
+        header_table=header_table_style,
+        skill_color=f"rgb({color_r},{color_g},{color_b})",
+        fonts=fonts,
+        band_color=pdf_colors["accent"]
+    )
+
+# Built-in Helvetica styles, compiled once at import; the render path only looks styles up
+_BASE_STYLES = getSampleStyleSheet()
+PDF_STYLES = MappingProxyType({
+    name: compile_pdf_styles(name, config, _BASE_STYLES) for name, config in RESUME_TEMPLATES.items()
+})
+
+# Styles in each template's own font, compiled (and the font registered) on first use
+_TEMPLATE_FONT_STYLES = {}
+_TEMPLATE_FONT_STYLES_LOCK = threading.Lock()
+
+def pdf_styles(template_name, embed_fonts=True):
+    """Compiled styles of a template, in its own embedded font unless embed_fonts is False"""
+    if not embed_fonts:
+        return PDF_STYLES[template_name]
+    styles = _TEMPLATE_FONT_STYLES.get(template_name)
+    if styles is None:
+        with _TEMPLATE_FONT_STYLES_LOCK:
+            styles = _TEMPLATE_FONT_STYLES.get(template_name)
+            if styles is None:
+                config = RESUME_TEMPLATES[template_name]
+                fonts = pdf_fonts(config["font_style"])
+                styles = PDF_STYLES[template_name] if not fonts.files else compile_pdf_styles(
+                    template_name, config, _BASE_STYLES, fonts
+                )
+                _TEMPLATE_FONT_STYLES[template_name] = styles
+    return styles
+
+class SectionBand(Flowable):
+    """colored_background section header drawn straight onto the canvas
+    
+    One filled rectangle and one line of text, without the cell layout and
+    state changes a one-cell Table writes to the page content per header. A
+    shared Form XObject does not pay off here: referencing it costs more bytes
+    than the rectangle it would replace.
+    """
+    
+    def __init__(self, title, styles):
+        super().__init__()
+        self.title = title
+        self.styles = styles
+        self.width = HEADER_TABLE_WIDTHS[0]
+        self.height = BAND_HEIGHT
+    
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+    
+    def draw(self):
+        canvas = self.canv
+        canvas.setFillColor(self.styles.band_color)
+        canvas.rect(0, 0, self.width, self.height, stroke=0, fill=1)
+        canvas.setFillColor(self.styles.section.textColor)
+        canvas.setFont(self.styles.fonts.bold, BAND_FONT_SIZE)
+        # Baseline placed as in the Table band, middle-aligned within the padding
+        canvas.drawString(BAND_PADDING_X, BAND_PADDING_Y + BAND_FONT_SIZE * 0.3, self.title)
+
+class BudgetedDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate that checks the active render budget after every laid-out flowable
+    
+    A render over its time budget or page limit, or cancelled, stops mid-layout
+    instead of running to the last page.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.budget = current_budget()
+    
+    def afterFlowable(self, flowable):
+        self.budget.check(self.page)
+
+def new_pdf_document(buffer, profile=DEFAULT_PDF_PROFILE, deterministic=False):
+    """Letter-size document with the shared margins and a profile's output options"""
+    options = PDF_PROFILES[profile]
+    metadata = STRIPPED_METADATA if options["strip_metadata"] else {}
+    return BudgetedDocTemplate(buffer, pagesize=letter, pageCompression=options["page_compression"],
+                               invariant=1 if deterministic else None, **PAGE_MARGINS, **metadata)
+
+def link_markup(url, text):
+    """Clickable link as Paragraph markup, with the URL escaped for its attribute"""
+    return f'<link href="{escape(url, ATTRIBUTE_ENTITIES)}" color="blue">{text}</link>'
+
+def header_story(resume, styles):
+    """Centered name and contact flowables that open every document"""
+    # NAME - ALWAYS CENTERED
+    story = [Paragraph(f'<b>{escape(resume.name.upper())}</b>', styles.name)]
+    
+    # CONTACT INFO - ALWAYS CENTERED with clickable links
+    contact_parts = [escape(resume.email), escape(resume.phone), escape(resume.location)]
+    
+    # Add LinkedIn as clickable link
+    if resume.linkedin_url:
+        contact_parts.append(link_markup(resume.linkedin_url, "LinkedIn"))
+    
+    # Add GitHub as clickable link
+    if resume.github_url:
+        contact_parts.append(link_markup(resume.github_url, "GitHub"))
+    
+    contact_info = ' | '.join(contact_parts)
+    story.append(Paragraph(contact_info, styles.contact))
+    
+    # Add separator line
+    story.append(Spacer(1, 6))
+    return story
+
+def create_template_pdf(data, template_name, output=None, embed_fonts=True, profile=DEFAULT_PDF_PROFILE,
+                        deterministic=False):
+    """Create a PDF with template-specific styling and CENTERED contact info
+    
+    The PDF is written to output (any writable binary file) when given,
+    otherwise to a new BytesIO rewound for reading. Returns the sink.
+    Text is set in the template's font, embedded as a subset, when one is
+    installed; embed_fonts=False uses the built-in Helvetica instead.
+    profile selects compression, header bands, metadata and font embedding
+    (see PDF_PROFILES).
+    deterministic=True uses ReportLab's invariant mode (fixed dates and document
+    ID), so equal input gives identical bytes.
+    """
+    resume = as_parsed_resume(data)
+    timer = stage_timer(template_name, "pdf")
+    options = PDF_PROFILES[profile]
+    styles = pdf_styles(template_name, embed_fonts and options["embed_fonts"])
+    
+    buffer = io.BytesIO() if output is None else output
+    doc = new_pdf_document(buffer, profile, deterministic)
+    story = header_story(resume, styles)
+    
+    # Helper function to add colored section headers
+    def add_section_header(title):
+        if styles.header_style == "colored_background" and options["direct_bands"]:
+            story.append(SectionBand(title.upper(), styles))
+            story.append(Spacer(1, 8))
+        elif styles.header_style == "colored_background":
+            # Create a table for background effect
+            header_table = Table([[title.upper()]], colWidths=HEADER_TABLE_WIDTHS)
+            header_table.setStyle(styles.header_table)
+            story.append(header_table)
+            story.append(Spacer(1, 8))
+        else:
+            story.append(Paragraph(f'<b>{escape(title.upper())}</b>', styles.section))
+    
+    # SECTIONS - Education, Projects, Experience, Achievements, Technical Skills
+    for section in resume.sections:
+        add_section_header(section.title)
+        for entry in section.entries:
+            # Entry text is free text, so it is escaped before ReportLab parses it as markup
+            text = escape(entry.text)
+            if entry.kind == ENTRY_HEADING:
+                story.append(Paragraph(f'<b>{text}</b>', styles.job))
+            elif entry.kind in (ENTRY_BULLET, ENTRY_ITEM):
+                story.append(Paragraph(f'• {text}', styles.content))
+            elif entry.kind == ENTRY_SKILL:
+                story.append(Paragraph(f'<b><font color="{styles.skill_color}">{escape(entry.category)}:</font></b> {text}', styles.content))
+            else:
+                story.append(Paragraph(text, styles.content))
+    
+    timer.lap("story")
+    
+    doc.build(story)
+    timer.lap("layout")
+    if output is None:
+        buffer.seek(0)
+    return buffer
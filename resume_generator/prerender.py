@@ -0,0 +1,92 @@
+import threading
+from collections import deque
+from functools import partial
+
+from .cache import resume_cache_key
+from .rendering import render_document
+
+class SpeculativeRenderer:
+    """Pre-renders alternate templates of one session's resume into a shared render cache
+    
+    At most max_in_flight renders run at once for the session. Scheduling new work
+    (because the resume changed) cancels whatever is still queued or not yet started,
+    and renders already running stop at their next budget check (see limits.py).
+    Renders run under limits when given; the executor must share memory with this
+    object (threads), since running renders are cancelled through a threading.Event.
+    """
+    
+    def __init__(self, executor, cache, max_in_flight=2, limits=None):
+        self.executor = executor
+        self.cache = cache
+        self.max_in_flight = max_in_flight
+        self.limits = limits
+        self._generation = 0
+        self._cancel_event = threading.Event()
+        self._queue = deque()
+        self._running = {}  # cache key -> Future
+        # Re-entrant: done callbacks can fire synchronously from submit() and cancel()
+        self._lock = threading.RLock()
+    
+    def schedule(self, resume, template_names, formats):
+        """Replace outstanding speculative work with renders of resume in every template/format"""
+        with self._lock:
+            self._cancel_locked()
+            for template_name in template_names:
+                for file_format in formats:
+                    key = resume_cache_key(resume, template_name, file_format)
+                    if key not in self.cache:
+                        self._queue.append((key, resume, template_name, file_format))
+            self._submit_locked()
+    
+    def cancel(self):
+        """Drop all queued work and stop the renders already running"""
+        with self._lock:
+            self._cancel_locked()
+    
+    def wait_for(self, key):
+        """Result of an in-flight speculative render of key, or None if there is none"""
+        with self._lock:
+            future = self._running.get(key)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            # Cancelled or failed; the caller renders it in the foreground instead
+            return None
+    
+    def pending(self):
+        """Number of speculative renders queued or running"""
+        with self._lock:
+            return len(self._queue) + len(self._running)
+    
+    def _cancel_locked(self):
+        self._generation += 1
+        self._cancel_event.set()
+        self._cancel_event = threading.Event()
+        self._queue.clear()
+        for future in self._running.values():
+            future.cancel()
+        self._running = {}
+    
+    def _submit_locked(self):
+        while self._queue and len(self._running) < self.max_in_flight:
+            key, resume, template_name, file_format = self._queue.popleft()
+            future = self.executor.submit(
+                render_document, resume, template_name, file_format, limits=self.limits, cancel_event=self._cancel_event
+            )
+            self._running[key] = future
+            future.add_done_callback(partial(self._on_done, self._generation, key))
+    
+    def _on_done(self, generation, key, future):
+        # Cached outside the lock: a put may write (and sweep) the disk store, which
+        # must not hold up schedule() and cancel() on the Streamlit thread. The key
+        # addresses the content, so a render finished after a reschedule is still
+        # worth keeping. Cache before forgetting the future so wait_for() never sees neither
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._running.pop(key, None)
+            self._submit_locked()
@@ -0,0 +1,144 @@
+import io
+import sys
+from importlib import import_module
+
+from .limits import check_resume_limits, render_budget
+from .model import as_parsed_resume
+
+# Fields of resume_data, as collected by the Streamlit form
+RESUME_FIELDS = (
+    'name', 'email', 'phone', 'location', 'linkedin', 'github',
+    'education', 'projects', 'experience', 'achievements', 'skills'
+)
+REQUIRED_FIELDS = ('name', 'email', 'phone', 'location', 'education')
+
+FORMATS = ("docx", "pdf")
+MIME_TYPES = {
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "pdf": "application/pdf"
+}
+
+# Renderers as (module, function) pairs, imported on first use so a process only
+# loads the backends (python-docx, ReportLab) of the formats it actually renders.
+# DOCX engines: the python-docx object model, or the direct WordprocessingML writer
+DOCX_ENGINES = {
+    "python-docx": (".docx_renderer", "create_template_word_doc"),
+    "fast": (".docx_fast", "create_fast_word_doc")
+}
+DEFAULT_DOCX_ENGINE = "python-docx"
+PDF_RENDERER = (".pdf_renderer", "create_template_pdf")
+
+# PDF output profiles: zlib page compression, header bands drawn directly rather
+# than as one-cell Tables (colored_background templates), trimmed metadata, and
+# whether the template's TrueType font is embedded. The embedded font subsets are
+# most of a document's bytes, so compact sets text in the built-in Helvetica
+PDF_PROFILES = {
+    "fast": {"page_compression": 0, "direct_bands": False, "strip_metadata": False, "embed_fonts": True},
+    "default": {"page_compression": 1, "direct_bands": False, "strip_metadata": False, "embed_fonts": True},
+    "compact": {"page_compression": 1, "direct_bands": True, "strip_metadata": True, "embed_fonts": False}
+}
+DEFAULT_PDF_PROFILE = "default"
+
+# Third-party rendering backends and their top-level modules
+BACKEND_MODULES = {
+    "python-docx": "docx",
+    "reportlab": "reportlab"
+}
+
+class CountingWriter:
+    """Forwards writes to a non-seekable sink (socket file, zip entry, pipe) and counts bytes"""
+    
+    def __init__(self, sink):
+        self.sink = sink
+        self.bytes_written = 0
+    
+    def write(self, data):
+        written = self.sink.write(data)
+        self.bytes_written += len(data) if written is None else written
+        return written
+    
+    def tell(self):
+        # Position as seen by writers such as zipfile, which then stream without seeking
+        return self.bytes_written
+    
+    def flush(self):
+        if hasattr(self.sink, 'flush'):
+            self.sink.flush()
+
+def loaded_backends():
+    """Rendering backends this process has imported so far"""
+    return [backend for backend, module_name in BACKEND_MODULES.items() if module_name in sys.modules]
+
+def missing_required_fields(data):
+    """Names of required resume fields that are absent or blank"""
+    return [field for field in REQUIRED_FIELDS if not (data.get(field) or "").strip()]
+
+# Resolved renderer functions by (module, function) pair
+_RENDERERS = {}
+
+def _renderer(file_format, docx_engine):
+    """Renderer function for a format (and DOCX engine), importing its backend on first use"""
+    if file_format == "docx":
+        if docx_engine not in DOCX_ENGINES:
+            raise ValueError(f"Unknown DOCX engine: {docx_engine}")
+        target = DOCX_ENGINES[docx_engine]
+    elif file_format == "pdf":
+        target = PDF_RENDERER
+    else:
+        raise ValueError(f"Unknown document format: {file_format}")
+    renderer = _RENDERERS.get(target)
+    if renderer is None:
+        module_name, function_name = target
+        renderer = _RENDERERS[target] = getattr(import_module(module_name, __package__), function_name)
+    return renderer
+
+def render_to(data, template_name, file_format, sink, docx_engine=DEFAULT_DOCX_ENGINE,
+              pdf_profile=DEFAULT_PDF_PROFILE, deterministic=False, limits=None, cancel_event=None):
+    """Write a rendered document to any writable binary sink; returns the number of bytes written
+    
+    Seekable sinks (files, BytesIO, spooled temp files) are written directly; others
+    (sockets, zip entries, pipes) are wrapped so the byte count is still reported.
+    deterministic=True gives identical bytes for equal input (see deterministic.py).
+    With limits (a RenderLimits) oversized input is rejected up front and the render
+    stops once past its time budget or page limit; setting cancel_event (a
+    threading.Event) stops it early. Both raise RenderLimitError (see limits.py).
+    """
+    renderer = _renderer(file_format, docx_engine)
+    resume = as_parsed_resume(data)
+    if limits is not None:
+        check_resume_limits(resume, limits)
+    options = {"deterministic": True} if deterministic else {}
+    if file_format == "pdf":
+        if pdf_profile not in PDF_PROFILES:
+            raise ValueError(f"Unknown PDF profile: {pdf_profile}")
+        options["profile"] = pdf_profile
+    try:
+        start = sink.tell()
+        sink.seek(start)
+    except (AttributeError, OSError):
+        sink = CountingWriter(sink)
+        start = 0
+    with render_budget(limits, cancel_event):
+        renderer(resume, template_name, output=sink, **options)
+    sink.flush()
+    return sink.tell() - start
+
+def render_view(data, template_name, file_format, docx_engine=DEFAULT_DOCX_ENGINE, pdf_profile=DEFAULT_PDF_PROFILE,
+                deterministic=False, limits=None, cancel_event=None):
+    """Render to memory and return a zero-copy memoryview of the document"""
+    buffer = io.BytesIO()
+    render_to(data, template_name, file_format, buffer, docx_engine, pdf_profile, deterministic, limits, cancel_event)
+    return buffer.getbuffer()
+
+def render_document(data, template_name, file_format, docx_engine=DEFAULT_DOCX_ENGINE,
+                    pdf_profile=DEFAULT_PDF_PROFILE, deterministic=False, limits=None, cancel_event=None):
+    """Render resume data (raw or parsed) to the bytes of a DOCX or PDF document"""
+    buffer = io.BytesIO()
+    render_to(data, template_name, file_format, buffer, docx_engine, pdf_profile, deterministic, limits, cancel_event)
+    return buffer.getvalue()
+
+def document_filename(name, template_name, file_format):
+    """Download file name such as Jane_Doe_Modern_Blue_Resume.pdf"""
+    clean_name = name.replace(' ', '_')
+    clean_template = template_name.replace(' ', '_')
+    return f"{clean_name}_{clean_template}_Resume.{file_format}"
@@ -0,0 +1,423 @@
+"""Headless HTTP render service: an asyncio front end over a bounded process pool
+
+Usage:
+    python -m resume_generator.service --port 8080 --workers 4 --queue-limit 32 --timeout 10
+
+Endpoints:
+    POST /render   {"resume": {...resume_data fields}, "template": "Modern Blue", "format": "pdf"}
+    GET  /healthz  liveness, pool state and current load, as JSON
+    GET  /metrics  request counters, latency histograms and cache stats (Prometheus text)
+
+At most `workers` renders run at once and at most `queue_limit` more wait for a
+worker; anything beyond that is rejected with 429 straight away. A request that
+has not finished within `timeout` seconds (queueing included) gets 504.
+
+A worker that dies (a crash or the OOM killer) breaks the whole process pool.
+Requests caught by it get 503, the pool is replaced, and /healthz reports
+"degraded" until the new pool has run a job.
+
+Resumes over the input size limits get 413 before reaching a worker. Workers
+stop a render once it passes the request timeout (504) or the page limit (422),
+so one pathological resume cannot hold a worker after its client has given up
+(see limits.py; RESUME_MAX_* variables configure the limits).
+
+With --artifact-dir (or RESUME_ARTIFACT_DIR) rendered documents are also kept
+on disk and shared with every other service instance using the directory. The
+Streamlit app keys its renders differently, so it never hits these entries.
+
+Documents are rendered in deterministic mode, so equal requests get identical
+bytes and the same ETag; a request whose If-None-Match names it gets 304.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from http import HTTPStatus
+
+from .cache import RenderCache, resume_cache_key
+from .deterministic import etag, etag_matches
+from .limits import RenderLimitError, RenderTimeout, check_resume_limits, limits_from_env
+from .metrics import RenderMetrics
+from .model import parse_resume
+from .rendering import (
+    DEFAULT_DOCX_ENGINE,
+    DEFAULT_PDF_PROFILE,
+    DOCX_ENGINES,
+    FORMATS,
+    MIME_TYPES,
+    PDF_PROFILES,
+    RESUME_FIELDS,
+    document_filename,
+    missing_required_fields,
+    render_document,
+)
+from .store import DiskArtifactStore, store_from_env
+from .templates import RESUME_TEMPLATES
+
+MAX_BODY_BYTES = 1024 * 1024
+MAX_HEADER_LINES = 100
+
+class HTTPError(Exception):
+    """Request failure reported to the client with an HTTP status and message"""
+    
+    def __init__(self, status, message, headers=()):
+        super().__init__(message)
+        self.status = HTTPStatus(status)
+        self.headers = tuple(headers)
+
+class RenderService:
+    """Admission control, timeouts and caching around a pool of render workers
+    
+    executor_factory, when given, builds a replacement for a pool that broke
+    because a worker died; without it a broken pool keeps answering 503.
+    """
+    
+    def __init__(self, executor, workers, queue_limit=32, timeout=10.0, docx_engine=DEFAULT_DOCX_ENGINE, cache=None,
+                 pdf_profile=DEFAULT_PDF_PROFILE, limits=None, executor_factory=None):
+        self.executor = executor
+        self.executor_factory = executor_factory
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self.docx_engine = docx_engine
+        self.pdf_profile = pdf_profile
+        self.cache = cache if cache is not None else RenderCache(store=store_from_env())
+        self.limits = limits if limits is not None else limits_from_env()
+        self.latency = RenderMetrics()
+        self.responses = {}  # HTTP status code -> count
+        self.admitted = 0  # Requests running or waiting for a worker
+        self.running = 0
+        self.degraded = False  # The pool broke and no replacement has run a job yet
+        self.pool_restarts = 0
+        self._slots = asyncio.Semaphore(workers)
+    
+    def record_response(self, status):
+        """Count a response by status code"""
+        self.responses[int(status)] = self.responses.get(int(status), 0) + 1
+    
+    def parse_request(self, body):
+        """Validate a /render body; returns (parsed resume, template name, format)"""
+        try:
+            payload = json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise HTTPError(400, f"Invalid JSON: {exc}")
+        if not isinstance(payload, dict) or not isinstance(payload.get("resume"), dict):
+            raise HTTPError(400, 'Expected an object with a "resume" object')
+        
+        template_name = payload.get("template") or next(iter(RESUME_TEMPLATES))
+        if template_name not in RESUME_TEMPLATES:
+            raise HTTPError(400, f"Unknown template: {template_name}")
+        file_format = payload.get("format") or "pdf"
+        if file_format not in FORMATS:
+            raise HTTPError(400, f"Unknown format: {file_format}. Choose from: {', '.join(FORMATS)}")
+        
+        record = payload["resume"]
+        # Numbers are taken as text (a phone number sent as 5550100); objects, arrays and booleans are not
+        invalid = [
+            field for field in RESUME_FIELDS
+            if isinstance(record.get(field), bool) or not isinstance(record.get(field) or "", (str, int, float))
+        ]
+        if invalid:
+            raise HTTPError(400, f"Fields must be strings: {', '.join(invalid)}")
+        data = {field: str(record.get(field) or "") for field in RESUME_FIELDS}
+        missing = missing_required_fields(data)
+        if missing:
+            raise HTTPError(400, f"Missing required fields: {', '.join(missing)}")
+        try:
+            check_resume_limits(data, self.limits)
+        except RenderLimitError as exc:
+            raise HTTPError(413, str(exc))
+        return parse_resume(data), template_name, file_format
+    
+    async def render(self, resume, template_name, file_format):
+        """Render on the pool with admission control; returns (document bytes, cache hit)
+        
+        Cache lookups and stores run on a thread, since a disk artifact store
+        reads, locks and sweeps files the event loop must not wait on.
+        """
+        key = resume_cache_key(resume, template_name, file_format, docx_engine=self.docx_engine,
+                               pdf_profile=self.pdf_profile, deterministic=True)
+        document = await asyncio.to_thread(self.cache.get, key)
+        if document is not None:
+            return document, True
+        
+        if self.admitted >= self.workers + self.queue_limit:
+            raise HTTPError(429, "Render queue is full, retry later", [("Retry-After", "1")])
+        self.admitted += 1
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        try:
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                raise HTTPError(504, f"Timed out after {self.timeout:g}s waiting for a worker")
+            
+            self.running += 1
+            # The worker stops on its own once the request's remaining time is up
+            remaining = max(0.0, deadline - loop.time())
+            limits = self.limits._replace(time_budget=min(remaining, self.limits.time_budget or remaining) or 0.001)
+            executor = self.executor
+            future = None
+            try:
+                future = loop.run_in_executor(
+                    executor, render_document, resume, template_name, file_format, self.docx_engine,
+                    self.pdf_profile, True, limits
+                )
+                # The slot is freed only when the worker is, even if the client gave up first
+                future.add_done_callback(self._release_slot)
+            except BrokenProcessPool:
+                self._replace_pool(executor)
+                raise HTTPError(503, "Render workers are restarting, retry later", [("Retry-After", "1")])
+            finally:
+                if future is None:
+                    # Submitting failed (a broken pool), so no worker will ever free the slot
+                    self._free_slot()
+            try:
+                document = await asyncio.wait_for(asyncio.shield(future), remaining)
+            except (asyncio.TimeoutError, RenderTimeout):
+                raise HTTPError(504, f"Render timed out after {self.timeout:g}s")
+            except RenderLimitError as exc:
+                raise HTTPError(422, str(exc))
+            except BrokenProcessPool:
+                # Not retried: this very render may be what killed the worker
+                self._replace_pool(executor)
+                raise HTTPError(503, "A render worker died, retry later", [("Retry-After", "1")])
+        finally:
+            self.admitted -= 1
+        await asyncio.to_thread(self.cache.put, key, document)
+        return document, False
+    
+    def _free_slot(self):
+        self.running -= 1
+        self._slots.release()
+    
+    def _release_slot(self, future):
+        self._free_slot()
+        # A render that stopped after its request got 504 fails unobserved; mark that as seen
+        if not future.cancelled():
+            future.exception()
+    
+    def _replace_pool(self, broken):
+        """Swap a broken pool for a new one, once however many requests it failed"""
+        if broken is not self.executor:
+            return  # Already replaced after an earlier failure
+        self.degraded = True
+        if self.executor_factory is None:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.executor = self.executor_factory()
+        self.pool_restarts += 1
+        # Healthy again once the new pool has started a worker and run a job on it
+        probe = asyncio.get_running_loop().run_in_executor(self.executor, os.getpid)
+        probe.add_done_callback(partial(self._pool_ready, self.executor))
+    
+    def _pool_ready(self, executor, probe):
+        if not probe.cancelled() and probe.exception() is None and executor is self.executor:
+            self.degraded = False
+    
+    def health(self):
+        """Liveness, pool state and current load"""
+        return {
+            "status": "degraded" if self.degraded else "ok",
+            "pool_restarts": self.pool_restarts,
+            "workers": self.workers,
+            "running": self.running,
+            "queued": self.admitted - self.running,
+            "queue_limit": self.queue_limit
+        }
+    
+    def prometheus(self, cache_stats):
+        """Service counters, request latency histograms and the render cache stats given"""
+        lines = [
+            "# HELP resume_service_responses_total Responses by HTTP status code.",
+            "# TYPE resume_service_responses_total counter"
+        ]
+        for status, count in sorted(self.responses.items()):
+            lines.append(f'resume_service_responses_total{{code="{status}"}} {count}')
+        lines += [
+            "# HELP resume_service_running Renders currently executing.",
+            "# TYPE resume_service_running gauge",
+            f"resume_service_running {self.running}",
+            "# HELP resume_service_queued Admitted renders waiting for a worker.",
+            "# TYPE resume_service_queued gauge",
+            f"resume_service_queued {self.admitted - self.running}",
+            "# HELP resume_service_pool_restarts_total Render pools replaced after a worker died.",
+            "# TYPE resume_service_pool_restarts_total counter",
+            f"resume_service_pool_restarts_total {self.pool_restarts}"
+        ]
+        cache_stats = dict(cache_stats)
+        store_stats = cache_stats.pop("store", {})
+        for stat, value in cache_stats.items():
+            lines.append(f"resume_service_cache_{stat} {value}")
+        for stat, value in store_stats.items():
+            lines.append(f"resume_service_store_{stat} {value}")
+        return "\n".join(lines) + "\n" + self.latency.to_prometheus(
+            "resume_service_request_seconds", "End-to-end /render latency, cache hits included."
+        )
+    
+    async def handle_render(self, body, request_headers):
+        """POST /render: returns (status, headers, body); 304 with no body when If-None-Match matches"""
+        started = time.perf_counter()
+        resume, template_name, file_format = self.parse_request(body)
+        document, cache_hit = await self.render(resume, template_name, file_format)
+        seconds = time.perf_counter() - started
+        self.latency(template_name, file_format, "request", seconds)
+        tag = etag(document)
+        if etag_matches(request_headers.get("if-none-match"), tag):
+            return HTTPStatus.NOT_MODIFIED, [("ETag", tag), ("X-Cache", "hit" if cache_hit else "miss")], b""
+        return HTTPStatus.OK, [
+            ("Content-Type", MIME_TYPES[file_format]),
+            ("Content-Disposition", f'attachment; filename="{document_filename(resume.name, template_name, file_format)}"'),
+            ("ETag", tag),
+            ("X-Cache", "hit" if cache_hit else "miss"),
+            ("X-Render-Ms", f"{seconds * 1000:.1f}")
+        ], document
+    
+    async def dispatch(self, method, path, headers, body):
+        """Route one request; returns (status, headers, body)"""
+        path = path.split("?", 1)[0]
+        if path == "/render":
+            if method != "POST":
+                raise HTTPError(405, "Use POST", [("Allow", "POST")])
+            return await self.handle_render(body, headers)
+        if path == "/healthz" and method in ("GET", "HEAD"):
+            return HTTPStatus.OK, [("Content-Type", "application/json")], json.dumps(self.health()).encode()
+        if path == "/metrics" and method in ("GET", "HEAD"):
+            metrics = self.prometheus(await asyncio.to_thread(self.cache.stats))
+            return HTTPStatus.OK, [("Content-Type", "text/plain; version=0.0.4")], metrics.encode()
+        raise HTTPError(404, f"No route for {method} {path}")
+    
+    async def handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection, keeping it alive unless asked not to"""
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                try:
+                    status, response_headers, response_body = await self.dispatch(method, path, headers, body)
+                except HTTPError as exc:
+                    status, response_headers = exc.status, [("Content-Type", "application/json"), *exc.headers]
+                    response_body = json.dumps({"error": str(exc)}).encode()
+                except Exception as exc:
+                    status, response_headers = HTTPStatus.INTERNAL_SERVER_ERROR, [("Content-Type", "application/json")]
+                    response_body = json.dumps({"error": f"{type(exc).__name__}: {exc}"}).encode()
+                self.record_response(status)
+                
+                keep_alive = headers.get("connection", "").lower() != "close"
+                write_response(writer, status, response_headers, b"" if method == "HEAD" else response_body,
+                               keep_alive, content_length=len(response_body))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except HTTPError as exc:
+            # Malformed request: answer once and drop the connection
+            self.record_response(exc.status)
+            write_response(writer, exc.status, [("Content-Type", "application/json")],
+                           json.dumps({"error": str(exc)}).encode(), keep_alive=False)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+async def read_request(reader):
+    """Read one request as (method, path, headers, body); None when the client closed the connection"""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, path, _ = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line")
+    
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HTTPError(431, "Too many headers")
+    
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPError(400, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, f"Request body over {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path, headers, body
+
+def write_response(writer, status, headers, body, keep_alive=True, content_length=None):
+    """Write a complete HTTP/1.1 response"""
+    status = HTTPStatus(status)
+    head = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    head += [f"{name}: {value}" for name, value in headers]
+    head.append(f"Content-Length: {len(body) if content_length is None else content_length}")
+    head.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+    if body:
+        writer.write(body)
+
+async def serve(host, port, workers, queue_limit, timeout, docx_engine, pdf_profile=DEFAULT_PDF_PROFILE,
+                artifact_dir=None):
+    """Run the service until cancelled"""
+    cache = RenderCache(store=DiskArtifactStore(artifact_dir)) if artifact_dir else None
+    executor_factory = partial(ProcessPoolExecutor, max_workers=workers)
+    service = RenderService(executor_factory(), workers, queue_limit, timeout, docx_engine, cache, pdf_profile,
+                            executor_factory=executor_factory)
+    try:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+        addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Serving resume renders on {addresses} with {workers} workers", file=sys.stderr, flush=True)
+        async with server:
+            await server.serve_forever()
+    finally:
+        # The pool in use may be a replacement for the one created above
+        service.executor.shutdown()
+
+def build_parser():
+    """Command line interface of the render service"""
+    parser = argparse.ArgumentParser(
+        prog="python -m resume_generator.service",
+        description="HTTP service rendering resumes with the same templates as the app."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--queue-limit", type=int, default=32,
+                        help="Renders allowed to wait for a worker before answering 429 (default: 32)")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="Seconds before a render request fails with 504 (default: 10)")
+    parser.add_argument("--docx-engine", choices=list(DOCX_ENGINES), default=DEFAULT_DOCX_ENGINE,
+                        help=f"DOCX writer to use (default: {DEFAULT_DOCX_ENGINE})")
+    parser.add_argument("--pdf-profile", choices=list(PDF_PROFILES), default=DEFAULT_PDF_PROFILE,
+                        help=f"PDF output profile (default: {DEFAULT_PDF_PROFILE})")
+    parser.add_argument("--artifact-dir",
+                        help="Directory of rendered documents shared across processes (default: $RESUME_ARTIFACT_DIR)")
+    return parser
+
+def main(argv=None):
+    """Run the service until interrupted; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(
+            args.host, args.port, args.workers, args.queue_limit, args.timeout, args.docx_engine, args.pdf_profile,
+            args.artifact_dir
+        ))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""Disk-backed artifact store shared by every process on a host
+
+Rendered documents are kept as one file per cache key under a directory, so
+Streamlit replicas pointed at the same place reuse each other's renders, and
+so do render service instances. The app and the service do not share entries:
+the service renders deterministically with its engine and profile in the
+cache key, the app with neither. Batch runs do not use the store. Writes go to a temporary file that is atomically
+renamed into place, so readers see a whole document or none; reads memory-map
+the file. Entries expire ttl seconds after they were last used, and a periodic
+sweep removes expired entries, then the least recently used ones, until the
+directory is back under max_bytes, along with temporary files left behind by
+writers that crashed mid-write.
+
+Enable it behind the in-memory RenderCache with RESUME_ARTIFACT_DIR (plus
+optional RESUME_ARTIFACT_MAX_MB and RESUME_ARTIFACT_TTL); see store_from_env.
+"""
+
+import abc
+import mmap
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: sweeps are not serialized across processes
+    fcntl = None
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL = 24 * 60 * 60
+# A sweep runs at most this often, or sooner once this share of max_bytes was written
+SWEEP_INTERVAL = 60.0
+SWEEP_WRITE_FRACTION = 0.1
+# Temporary files this old belong to a writer that died before renaming them into place
+STALE_TEMP_AGE = 15 * 60
+
+ARTIFACT_SUFFIX = ".bin"
+TEMP_PREFIX = ".tmp-"
+LOCK_FILE = ".lock"
+
+class ArtifactStore(abc.ABC):
+    """Interface of a store of rendered documents keyed by resume_cache_key"""
+    
+    @abc.abstractmethod
+    def get(self, key):
+        """Return the stored bytes for key, or None"""
+    
+    @abc.abstractmethod
+    def put(self, key, value):
+        """Store the bytes of a rendered document"""
+    
+    def __contains__(self, key):
+        return self.get(key) is not None
+    
+    def stats(self):
+        """Snapshot of store counters"""
+        return {}
+
+class DiskArtifactStore(ArtifactStore):
+    """Artifacts as files in a directory, safe for concurrent use by many processes"""
+    
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._written_since_sweep = 0
+        # The first sweep waits for the interval too, so starting a process does not walk the directory
+        self._last_sweep = time.monotonic()
+        # Directory totals as of the last sweep plus this process's writes since; None until first counted
+        self._entry_count = None
+        self._byte_count = None
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+    
+    def path(self, key):
+        """File holding the artifact of key, fanned out over 256 subdirectories"""
+        return os.path.join(self.directory, key[:2], key + ARTIFACT_SUFFIX)
+    
+    def _fresh(self, path):
+        """Whether path exists and was used within the TTL"""
+        try:
+            return time.time() - os.stat(path).st_mtime <= self.ttl
+        except FileNotFoundError:
+            return False
+    
+    def __contains__(self, key):
+        return self._fresh(self.path(key))
+    
+    def get_view(self, key):
+        """Read-only memory map of the artifact of key, or None
+        
+        The mapping stays valid even if the file is evicted or replaced meanwhile,
+        and its pages are shared with every other process reading the same file.
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as artifact:
+                size = os.fstat(artifact.fileno()).st_size
+                if not size or time.time() - os.fstat(artifact.fileno()).st_mtime > self.ttl:
+                    view = None
+                else:
+                    view = mmap.mmap(artifact.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            view = None
+        with self._lock:
+            if view is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            # Last use drives both the TTL and the eviction order
+            os.utime(path)
+        except OSError:
+            pass
+        return view
+    
+    def get(self, key):
+        """Return the stored bytes for key, or None"""
+        view = self.get_view(key)
+        if view is None:
+            return None
+        with view:
+            return view[:]
+    
+    def put(self, key, value):
+        """Atomically write the artifact of key; concurrent writers of one key are harmless"""
+        if len(value) > self.max_bytes:
+            return
+        path = self.path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(descriptor, "wb") as artifact:
+                artifact.write(value)
+            try:
+                replaced = os.stat(path).st_size
+            except FileNotFoundError:
+                replaced = None
+            os.replace(temp_path, path)
+        except OSError:
+            # A full disk or a file held open on Windows only costs a re-render later
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self.writes += 1
+            self._written_since_sweep += len(value)
+            if self._entry_count is not None:
+                self._entry_count += 1 if replaced is None else 0
+                self._byte_count += len(value) - (replaced or 0)
+            sweep_due = (self._written_since_sweep >= self.max_bytes * SWEEP_WRITE_FRACTION or
+                         time.monotonic() - self._last_sweep >= SWEEP_INTERVAL)
+        if sweep_due:
+            self.sweep()
+    
+    @contextmanager
+    def _exclusive(self):
+        """Hold the directory-wide lock, so one process sweeps at a time"""
+        with open(os.path.join(self.directory, LOCK_FILE), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _scan(self):
+        """(last use, size, path) of every artifact file, plus the paths of stale temporary files"""
+        entries, stale_temps = [], []
+        now = time.time()
+        for root, _, files in os.walk(self.directory):
+            for file_name in files:
+                temporary = file_name.startswith(TEMP_PREFIX)
+                if not temporary and not file_name.endswith(ARTIFACT_SUFFIX):
+                    continue
+                path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if not temporary:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+                elif now - stat.st_mtime > STALE_TEMP_AGE:
+                    stale_temps.append(path)
+        return entries, stale_temps
+    
+    def sweep(self):
+        """Remove stale temporary files, expired artifacts, then least recently used ones until under max_bytes
+        
+        Returns the number of artifacts removed.
+        """
+        with self._lock:
+            self._written_since_sweep = 0
+            self._last_sweep = time.monotonic()
+        removed = 0
+        with self._exclusive():
+            entries, stale_temps = self._scan()
+            for path in stale_temps:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            entries.sort()
+            now = time.time()
+            total = sum(size for _, size, _ in entries)
+            for last_used, size, path in entries:
+                if now - last_used <= self.ttl and total <= self.max_bytes:
+                    break
+                try:
+                    # Readers that already mapped the file keep their copy
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+        with self._lock:
+            self.evictions += removed
+            self._entry_count = len(entries) - removed
+            self._byte_count = total
+        return removed
+    
+    def stats(self):
+        """Snapshot of this process's counters plus the directory's size
+        
+        The size is counted by the last sweep and kept up to date with this
+        process's own writes, so scraping stats never walks the directory; the
+        first call sweeps once when no sweep has run yet.
+        """
+        if self._entry_count is None:
+            self.sweep()
+        with self._lock:
+            return {
+                "entries": self._entry_count,
+                "bytes": self._byte_count,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions
+            }
+
+def store_from_env(environ=None):
+    """DiskArtifactStore configured by RESUME_ARTIFACT_* variables, or None when unset"""
+    environ = os.environ if environ is None else environ
+    directory = environ.get("RESUME_ARTIFACT_DIR")
+    if not directory:
+        return None
+    max_mb = float(environ.get("RESUME_ARTIFACT_MAX_MB") or DEFAULT_MAX_BYTES / (1024 * 1024))
+    ttl = float(environ.get("RESUME_ARTIFACT_TTL") or DEFAULT_TTL)
+    return DiskArtifactStore(directory, max_bytes=int(max_mb * 1024 * 1024), ttl=ttl)
@@ -0,0 +1,194 @@
+"""Bullet improvement suggestions for the experience and projects sections
+
+A SuggestionBackend turns a batch of bullets into one suggestion each; the
+local backend is a deterministic rule-based stand-in, and others (an LLM API,
+say) plug in with register_suggestion_backend. SuggestionEngine sits in front
+of a backend: suggestions are cached by a hash of backend, template and bullet
+text, bullets already in flight are shared rather than requested twice, and the
+rest are sent in batches to an executor so results stream back as each batch
+completes. Editing one bullet therefore only ever requests that bullet.
+"""
+
+import abc
+import asyncio
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, as_completed
+
+SUGGESTION_CACHE_SIZE = 4096
+
+class SuggestionBackend(abc.ABC):
+    """Interface of a suggestion backend; subclasses implement suggest_batch"""
+    
+    name = "base"
+    batch_size = 16  # Bullets per suggest_batch call
+    
+    @abc.abstractmethod
+    def suggest_batch(self, bullets, template_name):
+        """One suggested rewrite per bullet, in the same order"""
+
+# Weak openers and the action verbs the local backend suggests instead
+WEAK_OPENERS = (
+    (re.compile(r"^(?:was )?responsible for\s+", re.IGNORECASE), "Led "),
+    (re.compile(r"^worked on\s+", re.IGNORECASE), "Developed "),
+    (re.compile(r"^worked with\s+", re.IGNORECASE), "Collaborated with "),
+    (re.compile(r"^helped (?:with|in)\s+", re.IGNORECASE), "Supported "),
+    (re.compile(r"^helped (?:to )?", re.IGNORECASE), "Partnered to "),
+    (re.compile(r"^assisted (?:with|in)\s+", re.IGNORECASE), "Supported "),
+    (re.compile(r"^in charge of\s+", re.IGNORECASE), "Managed "),
+    (re.compile(r"^did\s+", re.IGNORECASE), "Delivered "),
+    (re.compile(r"^made\s+", re.IGNORECASE), "Built "),
+    (re.compile(r"^tasked with\s+", re.IGNORECASE), "Drove ")
+)
+METRIC_HINT = " - quantify the impact (%, time saved, users, revenue)"
+
+class LocalSuggestionBackend(SuggestionBackend):
+    """Deterministic rule-based suggestions: stronger opening verb, tidy casing, a metric hint"""
+    
+    name = "local"
+    batch_size = 64
+    
+    def suggest_one(self, bullet):
+        suggestion = bullet.strip().rstrip(".")
+        for pattern, verb in WEAK_OPENERS:
+            if pattern.match(suggestion):
+                suggestion = pattern.sub(verb, suggestion, count=1)
+                break
+        suggestion = suggestion[:1].upper() + suggestion[1:]
+        if not any(character.isdigit() for character in suggestion):
+            suggestion += METRIC_HINT
+        return suggestion
+    
+    def suggest_batch(self, bullets, template_name):
+        return [self.suggest_one(bullet) for bullet in bullets]
+
+# Backend factories by name
+SUGGESTION_BACKENDS = {"local": LocalSuggestionBackend}
+DEFAULT_SUGGESTION_BACKEND = "local"
+
+def register_suggestion_backend(name, factory):
+    """Make a backend available by name; factory is called with no arguments"""
+    SUGGESTION_BACKENDS[name] = factory
+
+def suggestion_backend(name=DEFAULT_SUGGESTION_BACKEND):
+    """New backend instance by registered name"""
+    if name not in SUGGESTION_BACKENDS:
+        raise ValueError(f"Unknown suggestion backend: {name}")
+    return SUGGESTION_BACKENDS[name]()
+
+def bullet_lines(text):
+    """Bullets of an experience or projects text area: lines starting with '•' or '-'"""
+    bullets = []
+    for line in (text or "").splitlines():
+        line = line.strip()
+        if line.startswith('•') or line.startswith('-'):
+            bullet = line[1:].strip()
+            if bullet:
+                bullets.append(bullet)
+    return bullets
+
+def suggestion_key(backend_name, template_name, bullet):
+    """Cache key of one bullet's suggestion"""
+    payload = "\x1f".join((backend_name, template_name, bullet.strip()))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class SuggestionEngine:
+    """Cached, batched and deduplicated suggestions from one backend, shared by every session"""
+    
+    def __init__(self, backend, executor, cache_size=SUGGESTION_CACHE_SIZE):
+        self.backend = backend
+        self.executor = executor
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self.batches = 0
+        self._cache = OrderedDict()  # key -> suggestion
+        self._in_flight = {}  # key -> Future
+        self._lock = threading.Lock()
+    
+    def request(self, bullets, template_name):
+        """{bullet: Future of its suggestion}, submitting only bullets neither cached nor in flight"""
+        futures = {}
+        missing = []
+        with self._lock:
+            for bullet in dict.fromkeys(bullets):
+                key = suggestion_key(self.backend.name, template_name, bullet)
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    future = Future()
+                    future.set_result(self._cache[key])
+                elif key in self._in_flight:
+                    self.hits += 1
+                    future = self._in_flight[key]
+                else:
+                    self.misses += 1
+                    future = self._in_flight[key] = Future()
+                    missing.append((key, bullet, future))
+                futures[bullet] = future
+            batch_size = max(1, self.backend.batch_size)
+            batches = [missing[start:start + batch_size] for start in range(0, len(missing), batch_size)]
+            self.batches += len(batches)
+        for batch in batches:
+            self.executor.submit(self._run_batch, batch, template_name)
+        return futures
+    
+    def _run_batch(self, batch, template_name):
+        """Worker side: ask the backend for one batch and resolve its futures"""
+        try:
+            suggestions = self.backend.suggest_batch([bullet for _, bullet, _ in batch], template_name)
+            if len(suggestions) != len(batch):
+                raise ValueError(f"{self.backend.name} returned {len(suggestions)} suggestions for {len(batch)} bullets")
+        except Exception as exc:
+            with self._lock:
+                for key, _, _ in batch:
+                    self._in_flight.pop(key, None)
+            for _, _, future in batch:
+                future.set_exception(exc)
+            return
+        with self._lock:
+            for (key, _, _), suggestion in zip(batch, suggestions):
+                self._in_flight.pop(key, None)
+                self._cache[key] = suggestion
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        for (_, _, future), suggestion in zip(batch, suggestions):
+            future.set_result(suggestion)
+    
+    def stream(self, bullets, template_name, timeout=None):
+        """Yield (bullet, suggestion) as each becomes available, cached ones first
+        
+        A failed batch yields its bullets with the exception in place of a suggestion.
+        """
+        futures = self.request(bullets, template_name)
+        bullet_of = {}
+        for bullet, future in futures.items():
+            bullet_of.setdefault(future, []).append(bullet)
+        for future in as_completed(bullet_of, timeout=timeout):
+            exception = future.exception()
+            for bullet in bullet_of[future]:
+                yield bullet, exception if exception is not None else future.result()
+    
+    async def stream_async(self, bullets, template_name):
+        """Async counterpart of stream for asyncio callers"""
+        futures = self.request(bullets, template_name)
+        pending = {asyncio.wrap_future(future): bullet for bullet, future in futures.items()}
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                bullet = pending.pop(task)
+                yield bullet, task.exception() if task.exception() is not None else task.result()
+    
+    def stats(self):
+        """Snapshot of cache and batching counters"""
+        with self._lock:
+            return {
+                "cached": len(self._cache),
+                "in_flight": len(self._in_flight),
+                "hits": self.hits,
+                "misses": self.misses,
+                "batches": self.batches
+            }
@@ -0,0 +1,99 @@
+# Resume Template Definitions: DOCX colors as RGB hex, PDF colors as 0-1 RGB tuples
+RESUME_TEMPLATES = {
+    "Classic Professional": {
+        "description": "Traditional black and white with clean lines - Universally accepted",
+        "color_scheme": {
+            "primary": "000000",  # Black
+            "secondary": "404040",  # Dark Gray
+            "accent": "808080"  # Light Gray
+        },
+        "pdf_colors": {
+            "primary": (0, 0, 0),
+            "secondary": (0.25, 0.25, 0.25),
+            "accent": (0.5, 0.5, 0.5)
+        },
+        "font_style": "Arial",
+        "header_style": "underlined"
+    },
+    "Modern Blue": {
+        "description": "Contemporary design with professional blue accents - Tech-friendly",
+        "color_scheme": {
+            "primary": "003366",  # Navy Blue
+            "secondary": "0066CC",  # Medium Blue
+            "accent": "6699FF"  # Light Blue
+        },
+        "pdf_colors": {
+            "primary": (0, 0.2, 0.4),
+            "secondary": (0, 0.4, 0.8),
+            "accent": (0.4, 0.6, 1)
+        },
+        "font_style": "Calibri",
+        "header_style": "colored_background"
+    },
+    "Executive Green": {
+        "description": "Sophisticated green theme for senior positions - Leadership-focused",
+        "color_scheme": {
+            "primary": "006400",  # Dark Green
+            "secondary": "228B22",  # Forest Green
+            "accent": "90EE90"  # Light Green
+        },
+        "pdf_colors": {
+            "primary": (0, 0.4, 0),
+            "secondary": (0.13, 0.55, 0.13),
+            "accent": (0.56, 0.93, 0.56)
+        },
+        "font_style": "Times New Roman",
+        "header_style": "bold_colored"
+    },
+    "Creative Purple": {
+        "description": "Stylish purple design for creative professionals - Artistic appeal",
+        "color_scheme": {
+            "primary": "4B0082",  # Indigo
+            "secondary": "8A2BE2",  # Blue Violet
+            "accent": "DDA0DD"  # Plum
+        },
+        "pdf_colors": {
+            "primary": (0.29, 0, 0.51),
+            "secondary": (0.54, 0.17, 0.89),
+            "accent": (0.87, 0.63, 0.87)
+        },
+        "font_style": "Georgia",
+        "header_style": "gradient_effect"
+    },
+    "Warm Orange": {
+        "description": "Energetic orange theme for dynamic professionals - Marketing-friendly",
+        "color_scheme": {
+            "primary": "CC5500",  # Dark Orange
+            "secondary": "FF8C00",  # Dark Orange
+            "accent": "FFDAB9"  # Peach
+        },
+        "pdf_colors": {
+            "primary": (0.8, 0.33, 0),
+            "secondary": (1, 0.55, 0),
+            "accent": (1, 0.85, 0.73)
+        },
+        "font_style": "Verdana",
+        "header_style": "boxed"
+    }
+}
+
+def rgbcolor_to_rgb(rgbcolor):
+    """Convert a hex color (or docx RGBColor) to (r,g,b) tuple"""
+    color_hex = str(rgbcolor)  # Gets hex string like "003366"
+    r = int(color_hex[0:2], 16)
+    g = int(color_hex[2:4], 16) 
+    b = int(color_hex[4:6], 16)
+    return (r, g, b)
+
+def format_url(url):
+    """Format URL to ensure it has proper protocol"""
+    if not url or url.strip() == "":
+        return ""
+    
+    url = url.strip()
+    if not url.startswith(('http://', 'https://')):
+        if 'linkedin.com' in url or 'github.com' in url:
+            url = 'https://' + url
+        else:
+            url = 'https://' + url
+    return url
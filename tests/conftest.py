@@ -0,0 +1,18 @@
+import pytest
+
+@pytest.fixture
+def resume_record():
+    """A complete resume_data record"""
+    return {
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "phone": "+44 20 7946 0000",
+        "location": "London, UK",
+        "linkedin": "https://linkedin.com/in/ada",
+        "github": "https://github.com/ada",
+        "education": "University of London - Mathematics (1835)",
+        "projects": "Analytical Engine Notes\n• Wrote the first published algorithm for Bernoulli numbers",
+        "experience": "Analyst - Babbage & Co (1842-1843)\n• Translated and annotated Menabrea's memoir",
+        "achievements": "- First computer programmer",
+        "skills": "Languages: Python, SQL\nTools: Git, Docker",
+    }
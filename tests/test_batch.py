@@ -0,0 +1,49 @@
+import json
+import os
+
+from resume_generator.batch import load_record, main, read_records, render_record
+
+def write_jsonl(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+def test_malformed_lines_fail_only_their_own_record(tmp_path, resume_record, capsys):
+    records = write_jsonl(tmp_path / "records.jsonl", [
+        json.dumps(resume_record),
+        '{"name": "Broken"',
+        "[1, 2]",
+        json.dumps(dict(resume_record, id="second")),
+    ])
+    output = tmp_path / "out"
+    
+    code = main([records, "-o", str(output), "-t", "Classic Professional", "-f", "pdf", "-w", "1"])
+    
+    assert code == 1
+    assert sorted(os.listdir(output)) == ["00000_Ada_Lovelace_Classic_Professional_Resume.pdf",
+                                          "00003_Ada_Lovelace_Classic_Professional_Resume.pdf"]
+    report = capsys.readouterr().err
+    assert "[FAILED] record 1: JSONDecodeError" in report
+    assert "[FAILED] record 2: ValueError: record is a JSON list, not an object" in report
+    assert "(2 failed)" in report
+
+def test_read_records_defers_decoding(tmp_path):
+    records = write_jsonl(tmp_path / "records.jsonl", ['{"name": "A"}', "", "not json"])
+    
+    raw = list(read_records(records))
+    
+    assert raw == ['{"name": "A"}\n', "not json\n"]
+    assert load_record(raw[0]) == {"name": "A"}
+
+def test_failed_record_leaves_no_partial_outputs(tmp_path, resume_record):
+    # The second template is unknown, so the record fails after its first document is written
+    result = render_record(0, resume_record, ["Classic Professional", "No Such Template"], ["pdf"], str(tmp_path))
+    
+    assert result.error
+    assert result.outputs == ()
+    assert os.listdir(tmp_path) == []
+
+def test_missing_required_fields_are_reported(resume_record):
+    result = render_record(4, dict(resume_record, email=" ", id="abc"), ["Classic Professional"], ["pdf"])
+    
+    assert result.record_id == "abc"
+    assert result.error.startswith("ValueError: missing required fields: email")
@@ -0,0 +1,58 @@
+from resume_generator.cache import RENDERER_VERSION, RenderCache, resume_cache_key
+from resume_generator.model import parse_resume
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = RenderCache(max_entries=2)
+    cache.put("a", b"A")
+    cache.put("b", b"B")
+    
+    assert cache.get("a") == b"A"
+    cache.put("c", b"C")
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == b"A"
+    assert cache.get("c") == b"C"
+    assert cache.stats()["evictions"] == 1
+
+def test_byte_bound_evicts_and_skips_oversized_values():
+    cache = RenderCache(max_entries=10, max_bytes=10)
+    cache.put("a", b"x" * 6)
+    cache.put("b", b"y" * 6)
+    cache.put("huge", b"z" * 11)
+    
+    assert "a" not in cache
+    assert "huge" not in cache
+    assert cache.stats()["bytes"] == 6
+
+def test_get_or_render_renders_once():
+    cache = RenderCache()
+    calls = []
+    
+    def render():
+        calls.append(1)
+        return b"document"
+    
+    assert cache.get_or_render("key", render) == b"document"
+    assert cache.get_or_render("key", render) == b"document"
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_key_changes_with_template_format_and_options(resume_record):
+    resume = parse_resume(resume_record)
+    key = resume_cache_key(resume, "Classic Professional", "pdf")
+    
+    assert key == resume_cache_key(parse_resume(resume_record), "Classic Professional", "pdf")
+    assert key != resume_cache_key(resume, "Modern Blue", "pdf")
+    assert key != resume_cache_key(resume, "Classic Professional", "docx")
+    assert key != resume_cache_key(resume, "Classic Professional", "pdf", pdf_profile="compact")
+    assert key != resume_cache_key(parse_resume(dict(resume_record, skills="Languages: Go")),
+                                   "Classic Professional", "pdf")
+
+def test_key_includes_renderer_version(resume_record, monkeypatch):
+    resume = parse_resume(resume_record)
+    key = resume_cache_key(resume, "Classic Professional", "pdf")
+    
+    monkeypatch.setattr("resume_generator.cache.RENDERER_VERSION", RENDERER_VERSION + "-next")
+    
+    assert resume_cache_key(resume, "Classic Professional", "pdf") != key
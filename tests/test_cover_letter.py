@@ -0,0 +1,83 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from resume_generator.cover_letter import (
+    CoverLetterWriter,
+    main,
+    parse_posting,
+    read_postings,
+    render_cover_letters,
+)
+from resume_generator.limits import DEFAULT_LIMITS
+from resume_generator.rendering import FORMATS
+from resume_generator.templates import RESUME_TEMPLATES
+
+POSTING = {"company": "Acme & Co", "role": "Data Engineer", "addressee": "Ms. Rivera",
+           "paragraphs": "I build pipelines.\n\nI ship them."}
+
+def letter_text(document, file_format):
+    """Text of a rendered letter"""
+    if file_format == "docx":
+        with zipfile.ZipFile(io.BytesIO(document)) as package:
+            return package.read("word/document.xml").decode("utf-8")
+    pypdf = pytest.importorskip("pypdf")
+    return "\n".join(page.extract_text() for page in pypdf.PdfReader(io.BytesIO(document)).pages)
+
+@pytest.mark.parametrize("file_format", FORMATS)
+@pytest.mark.parametrize("template_name", list(RESUME_TEMPLATES))
+def test_letter_renders_in_every_template(resume_record, template_name, file_format):
+    writer = CoverLetterWriter(resume_record, template_name, date="March 5, 2025")
+    
+    text = letter_text(writer.render(parse_posting(POSTING), file_format), file_format)
+    
+    for line in ("March 5, 2025", "Re: Data Engineer", "Dear Ms. Rivera,", "I ship them.", "Sincerely,"):
+        assert line in text
+    assert ("Acme &amp; Co" if file_format == "docx" else "Acme & Co") in text
+
+def test_unreadable_postings_are_skipped_and_reported():
+    records = [
+        json.dumps(POSTING),
+        "{not json",
+        json.dumps(["Acme", "Engineer"]),
+        json.dumps({"company": "Acme"}),
+        {"company": "Initech", "role": "Analyst"},
+    ]
+    
+    postings, skipped = read_postings(records)
+    
+    assert [(posting.company, posting.role) for posting in postings] == [
+        ("Acme & Co", "Data Engineer"), ("Initech", "Analyst")
+    ]
+    assert [number for number, _ in skipped] == [2, 3, 4]
+    assert "not an object" in skipped[1][1]
+    assert "company and a role" in skipped[2][1]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_limits_apply_per_posting(resume_record, workers):
+    postings = [parse_posting(POSTING), parse_posting(dict(POSTING, paragraphs="x" * 500)), parse_posting(POSTING)]
+    
+    results = list(render_cover_letters(
+        resume_record, postings, "Classic Professional", ("docx",), workers,
+        limits=DEFAULT_LIMITS._replace(max_field_chars=400)
+    ))
+    
+    assert [index for index, _, _, _ in results] == [0, 1, 2]
+    assert [bool(documents) for _, _, documents, _ in results] == [True, False, True]
+    assert "Paragraphs is 500 characters long" in results[1][3]
+
+def test_cli_skips_malformed_postings(tmp_path, resume_record, capsys):
+    resume = tmp_path / "resume.json"
+    resume.write_text(json.dumps(resume_record), encoding="utf-8")
+    postings = tmp_path / "postings.jsonl"
+    postings.write_text("\n".join([json.dumps(POSTING), "[1, 2]", json.dumps(dict(POSTING, id="p3"))]),
+                        encoding="utf-8")
+    output = tmp_path / "letters.zip"
+    
+    assert main([str(resume), str(postings), "-o", str(output), "-f", "docx", "-w", "1"]) == 1
+    
+    with zipfile.ZipFile(output) as archive:
+        assert len(archive.namelist()) == 2
+    assert "[FAILED] posting 1: record is a JSON list, not an object" in capsys.readouterr().err
@@ -0,0 +1,68 @@
+import json
+import time
+
+import pytest
+
+from resume_generator.batch import main as batch_main
+from resume_generator.deterministic import content_hash, etag, etag_matches
+from resume_generator.model import parse_resume
+from resume_generator.rendering import render_document
+
+A_YEAR = 365 * 24 * 60 * 60
+
+@pytest.fixture
+def later(monkeypatch):
+    """Call to move the wall clock a year ahead for the rest of the test"""
+    real_time = time.time
+    return lambda: monkeypatch.setattr(time, "time", lambda: real_time() + A_YEAR)
+
+@pytest.mark.parametrize("file_format, options", [
+    ("pdf", {}),
+    ("docx", {"docx_engine": "python-docx"}),
+    ("docx", {"docx_engine": "fast"}),
+])
+def test_equal_input_renders_identical_bytes(resume_record, later, file_format, options):
+    resume = parse_resume(resume_record)
+    first = render_document(resume, "Modern Blue", file_format, deterministic=True, **options)
+    
+    later()
+    second = render_document(parse_resume(dict(resume_record)), "Modern Blue", file_format, deterministic=True,
+                             **options)
+    undetermined = render_document(resume, "Modern Blue", file_format, **options)
+    
+    assert second == first
+    assert etag(second) == etag(first) == f'"{content_hash(first)}"'
+    assert undetermined != first
+
+def test_deterministic_batch_archive_is_reproducible(tmp_path, resume_record, later):
+    records = tmp_path / "records.jsonl"
+    records.write_text("\n".join(
+        json.dumps(dict(resume_record, id=f"r{index}", name=f"Person {index}")) for index in range(6)
+    ), encoding="utf-8")
+    
+    def run(name):
+        output = tmp_path / name
+        assert batch_main([str(records), "-o", str(output), "-t", "Classic Professional", "Modern Blue",
+                           "--deterministic", "-w", "2"]) == 0
+        return output.read_bytes()
+    
+    first = run("first.zip")
+    later()
+    second = run("second.zip")
+    
+    assert second == first
+    assert etag(second) == etag(first)
+
+@pytest.mark.parametrize("header, expected", [
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", W/"abc"', True),
+    ('"xyz",W/"abc" , "def"', True),
+    ("*", True),
+    ('"xyz", W/"def"', False),
+    ('"ab"', False),
+    ("", False),
+    (None, False),
+])
+def test_etag_matches_weak_and_list_forms(header, expected):
+    assert etag_matches(header, '"abc"') is expected
@@ -0,0 +1,47 @@
+import io
+import re
+import zipfile
+from xml.etree import ElementTree
+
+import pytest
+
+from benchmarks.compare_docx_engines import ENGINES, describe_docx
+from benchmarks.samples import sample_resume
+from resume_generator.model import parse_resume
+from resume_generator.rendering import render_document
+from resume_generator.templates import RESUME_TEMPLATES
+
+REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+HYPERLINK_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+
+@pytest.mark.parametrize("template_name", list(RESUME_TEMPLATES))
+def test_fast_engine_matches_python_docx(template_name):
+    """Styles, alignment, borders, runs and hyperlink targets agree paragraph by paragraph"""
+    resume = parse_resume(sample_resume(2))
+    
+    reference, candidate = (
+        describe_docx(render_document(resume, template_name, "docx", docx_engine=engine)) for engine in ENGINES
+    )
+    
+    assert candidate == reference
+
+@pytest.mark.parametrize("template_name", list(RESUME_TEMPLATES))
+def test_hyperlink_relationship_ids_resolve(resume_record, template_name):
+    document = render_document(parse_resume(resume_record), template_name, "docx", docx_engine="fast")
+    
+    with zipfile.ZipFile(io.BytesIO(document)) as package:
+        body = package.read("word/document.xml").decode("utf-8")
+        rels = ElementTree.fromstring(package.read("word/_rels/document.xml.rels"))
+    relationships = {rel.get("Id"): rel for rel in rels.iter(f"{REL_NS}Relationship")}
+    link_ids = re.findall(r'<w:hyperlink r:id="([^"]+)"', body)
+    
+    assert len(relationships) == len(rels.findall(f"{REL_NS}Relationship"))
+    assert len(link_ids) == 2
+    assert len(set(link_ids)) == len(link_ids)
+    targets = []
+    for r_id in link_ids:
+        relationship = relationships[r_id]
+        assert relationship.get("Type") == HYPERLINK_TYPE
+        assert relationship.get("TargetMode") == "External"
+        targets.append(relationship.get("Target"))
+    assert targets == [resume_record["linkedin"], resume_record["github"]]
@@ -0,0 +1,98 @@
+import gc
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import weakref
+
+import pytest
+
+from resume_generator.drafts import DraftAutosaver, DraftStore
+
+@pytest.fixture(params=["memory", "file"])
+def store(request, tmp_path):
+    return DraftStore(":memory:" if request.param == "memory" else str(tmp_path / "drafts.sqlite3"))
+
+def in_thread(function, *args):
+    """Result of calling function on a new thread"""
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=function(*args)))
+    thread.start()
+    thread.join()
+    return result["value"]
+
+def test_drafts_are_visible_from_other_threads(store):
+    store.save("draft", {"name": "Ada"}, user_id="user")
+    
+    assert in_thread(store.load, "draft") == {"name": "Ada"}
+    assert [draft_id for draft_id, _ in in_thread(store.list_drafts, "user")] == ["draft"]
+    in_thread(store.delete, "draft")
+    assert store.load("draft") is None
+
+def test_save_updates_only_given_fields(store):
+    store.save("draft", {"name": "Ada", "email": "ada@example.com"})
+    store.save("draft", {"email": "lovelace@example.com"})
+    
+    assert store.load("draft") == {"name": "Ada", "email": "lovelace@example.com"}
+
+def test_autosaver_writes_from_its_thread(store):
+    autosaver = DraftAutosaver(store, debounce=0.01, max_delay=0.05)
+    
+    assert autosaver.record("draft", {"name": "Ada", "phone": 5550100}) == 2
+    assert autosaver.record("draft", {"name": "Ada"}) == 0
+    deadline = time.monotonic() + 5
+    while autosaver.stats()["transactions"] < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    
+    assert store.load("draft") == {"name": "Ada", "phone": "5550100"}
+    assert autosaver.stats()["transactions"] == 1
+    autosaver.close()
+
+def test_close_writes_pending_edits(store):
+    autosaver = DraftAutosaver(store, debounce=60, max_delay=60)
+    autosaver.record("draft", {"name": "Ada"})
+    
+    autosaver.close()
+    
+    assert store.load("draft") == {"name": "Ada"}
+    assert autosaver.stats()["pending_drafts"] == 0
+    assert autosaver._writer is None
+
+def test_failed_write_is_retried(store, monkeypatch):
+    autosaver = DraftAutosaver(store, debounce=60, max_delay=60)
+    autosaver.record("draft", {"name": "Ada"})
+    
+    def locked(drafts):
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(store, "save_many", locked)
+    with pytest.raises(sqlite3.OperationalError):
+        autosaver.flush()
+    monkeypatch.undo()
+    
+    autosaver.close()
+    assert store.load("draft") == {"name": "Ada"}
+
+def test_closed_autosavers_can_be_collected(store):
+    autosaver = DraftAutosaver(store, debounce=0.01, max_delay=0.05)
+    autosaver.record("draft", {"name": "Ada"})
+    autosaver.close()
+    reference = weakref.ref(autosaver)
+    
+    del autosaver
+    gc.collect()
+    
+    assert reference() is None
+
+def test_pending_edits_are_written_at_exit(tmp_path):
+    path = str(tmp_path / "drafts.sqlite3")
+    script = (
+        "from resume_generator.drafts import DraftAutosaver, DraftStore\n"
+        f"autosaver = DraftAutosaver(DraftStore({path!r}), debounce=60, max_delay=60)\n"
+        "autosaver.record('draft', {'name': 'Ada'})\n"
+    )
+    
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+    
+    assert DraftStore(path).load("draft") == {"name": "Ada"}
@@ -0,0 +1,38 @@
+from resume_generator.html_renderer import create_template_html, html_cache_info, render_section_html
+from resume_generator.model import parse_resume
+
+def test_user_text_is_escaped(resume_record):
+    record = dict(
+        resume_record,
+        name="Ada <script>alert(1)</script>",
+        experience="R&D <Lead>\n• Cut costs by >50% & \"shipped\"",
+        skills="<b>Tools</b>: Git & Docker",
+        github='github.com/ada" onclick="steal()'
+    )
+    
+    html = create_template_html(record, "Classic Professional")
+    
+    assert "<script>" not in html
+    assert "ADA &lt;SCRIPT&gt;" in html
+    assert "R&amp;D &lt;Lead&gt;" in html
+    assert "<li>Cut costs by &gt;50% &amp; &quot;shipped&quot;</li>" in html
+    assert "&lt;b&gt;Tools&lt;/b&gt;:</span> Git &amp; Docker" in html
+    assert 'href="https://github.com/ada&quot; onclick=&quot;steal()"' in html
+
+def test_consecutive_bullets_share_one_list(resume_record):
+    record = dict(resume_record, experience="Analyst\n• One\n• Two\nEngineer\n• Three")
+    
+    html = create_template_html(record, "Classic Professional")
+    
+    assert html.count("<ul") == 3
+    assert "<li>One</li><li>Two</li></ul>" in html
+
+def test_unchanged_sections_come_from_the_cache(resume_record):
+    render_section_html.cache_clear()
+    create_template_html(resume_record, "Classic Professional")
+    
+    create_template_html(dict(resume_record, skills="Languages: Go"), "Classic Professional")
+    
+    sections = html_cache_info()["sections"]
+    assert sections.misses == len(parse_resume(resume_record).sections) + 1
+    assert sections.hits == len(parse_resume(resume_record).sections) - 1
@@ -0,0 +1,98 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from resume_generator import importer
+from resume_generator.importer import ResumeImportError, import_resume, main
+from resume_generator.model import parse_resume
+from resume_generator.rendering import RESUME_FIELDS, render_document
+
+@pytest.mark.parametrize("file_format", ["docx", "pdf"])
+def test_rendered_resume_round_trips(resume_record, file_format):
+    document = render_document(parse_resume(resume_record), "Classic Professional", file_format)
+    
+    data = import_resume(io.BytesIO(document), f"resume.{file_format}")
+    
+    assert data == {field: resume_record[field] for field in RESUME_FIELDS}
+
+def test_unsupported_and_corrupt_documents_raise_value_error():
+    with pytest.raises(ValueError):
+        import_resume(io.BytesIO(b"data"), "resume.odt")
+    with pytest.raises(ValueError):
+        import_resume(io.BytesIO(b"not a zip"), "resume.docx")
+
+def _corrupt_docx(document):
+    """document with the compressed bytes of word/document.xml scrambled"""
+    info = zipfile.ZipFile(io.BytesIO(document)).getinfo("word/document.xml")
+    start = info.header_offset + 30 + len(info.filename) + len(info.extra)
+    corrupt = bytearray(document)
+    for offset in range(start + 10, start + 60):
+        corrupt[offset] ^= 0xFF
+    return bytes(corrupt)
+
+def _pdf(*objects):
+    """Minimal PDF file of the given object bodies, the first one the catalog"""
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    return data + b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+def test_corrupt_documents_raise_resume_import_error(resume_record):
+    document = render_document(parse_resume(resume_record), "Classic Professional", "docx")
+    # A page whose /Annots is a number, not an array
+    pdf = _pdf(b"<< /Type /Catalog /Pages 2 0 R >>", b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+               b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Annots 5 >>")
+    
+    with pytest.raises(ResumeImportError, match="unreadable DOCX"):
+        import_resume(io.BytesIO(_corrupt_docx(document)), "resume.docx")
+    with pytest.raises(ResumeImportError, match="unreadable PDF"):
+        import_resume(io.BytesIO(pdf), "resume.pdf")
+
+def test_bad_inputs_fail_without_stopping_the_import(tmp_path, resume_record, capsys):
+    document = render_document(parse_resume(resume_record), "Classic Professional", "docx")
+    (tmp_path / "single.docx").write_bytes(document)
+    (tmp_path / "broken.docx").write_bytes(b"not a zip")
+    (tmp_path / "corrupt.zip").write_bytes(b"not a zip either")
+    with zipfile.ZipFile(tmp_path / "archive.zip", "w") as archive:
+        archive.writestr("nested/member.docx", document)
+    output = tmp_path / "records.jsonl"
+    
+    code = main([str(tmp_path / name) for name in ("single.docx", "broken.docx", "corrupt.zip", "missing.pdf",
+                                                   "archive.zip")] + ["-o", str(output), "-w", "1"])
+    
+    assert code == 1
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [record["id"] for record in records] == [str(tmp_path / "single.docx"),
+                                                    str(tmp_path / "archive.zip") + "!nested/member.docx"]
+    assert all(record["name"] == "Ada Lovelace" for record in records)
+    report = capsys.readouterr().err
+    assert f"[FAILED] {tmp_path / 'broken.docx'}: ResumeImportError" in report
+    assert f"[FAILED] {tmp_path / 'corrupt.zip'}: BadZipFile" in report
+    assert f"[FAILED] {tmp_path / 'missing.pdf'}: FileNotFoundError" in report
+    assert "(0 incomplete, 3 failed)" in report
+
+def test_oversized_and_highly_compressed_archive_members_are_not_read(tmp_path, resume_record, capsys,
+                                                                      monkeypatch):
+    document = render_document(parse_resume(resume_record), "Classic Professional", "docx")
+    with zipfile.ZipFile(tmp_path / "archive.zip", "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("bomb.docx", bytes(40_000))
+        archive.writestr("large.txt", "Ada Lovelace\n" * 4_000, compress_type=zipfile.ZIP_STORED)
+        archive.writestr("member.docx", document)
+    monkeypatch.setattr(importer, "MAX_MEMBER_BYTES", 50_000)
+    output = tmp_path / "records.jsonl"
+    
+    code = main([str(tmp_path / "archive.zip"), "-o", str(output), "-w", "1"])
+    
+    assert code == 1
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [record["id"] for record in records] == [str(tmp_path / "archive.zip") + "!member.docx"]
+    report = capsys.readouterr().err
+    assert "bomb.docx: ResumeImportError: compressed" in report
+    assert "large.txt: ResumeImportError: 52000 bytes extracted" in report
@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from resume_generator.batch import render_record
+from resume_generator.cover_letter import CoverLetterWriter, parse_posting
+from resume_generator.fanout import render_all
+from resume_generator.html_renderer import create_template_html
+from resume_generator.limits import (
+    DEFAULT_LIMITS,
+    RenderCancelled,
+    RenderLimitError,
+    RenderLimits,
+    RenderTimeout,
+    check_resume_limits,
+    limits_from_env,
+)
+from resume_generator.model import parse_resume
+from resume_generator.rendering import render_document
+
+TEMPLATE = "Classic Professional"
+# A deadline that has passed by the first check
+EXPIRED = DEFAULT_LIMITS._replace(time_budget=1e-9)
+
+@pytest.fixture
+def long_record(resume_record):
+    """A resume several pages long, inside the default size limits"""
+    bullets = "\n".join(f"• Delivered project {number} ahead of schedule and under budget" for number in range(250))
+    return dict(resume_record, experience="Engineer - Example Corp (2010-2020)\n" + bullets)
+
+def test_limits_from_env():
+    limits = limits_from_env({"RESUME_MAX_PAGES": "3", "RESUME_RENDER_BUDGET": "2.5", "RESUME_MAX_LINES": ""})
+    
+    assert (limits.max_pages, limits.time_budget, limits.max_lines) == (3, 2.5, DEFAULT_LIMITS.max_lines)
+
+@pytest.mark.parametrize("variable, value", [
+    ("RESUME_MAX_PAGES", "ten"),
+    ("RESUME_MAX_LINES", "2.5"),
+    ("RESUME_RENDER_BUDGET", "-1"),
+])
+def test_malformed_limit_variables_are_named(variable, value):
+    with pytest.raises(ValueError, match=f"^{variable}="):
+        limits_from_env({variable: value})
+
+@pytest.mark.parametrize("limits, message", [
+    (RenderLimits(max_field_chars=10), "Name is 12 characters long"),
+    (RenderLimits(max_lines=1), "Projects has 2 lines"),
+    (RenderLimits(max_field_chars=0, max_total_chars=100), "Resume is"),
+])
+def test_oversized_resumes_are_rejected(resume_record, limits, message):
+    with pytest.raises(RenderLimitError, match=message):
+        check_resume_limits(resume_record, limits)
+    with pytest.raises(RenderLimitError, match=message):
+        check_resume_limits(parse_resume(resume_record), limits)
+
+def test_zero_disables_a_limit(long_record):
+    check_resume_limits(long_record, RenderLimits(0, 0, 0, 0, 0))
+
+def test_page_limit_stops_pdf_layout(long_record):
+    resume = parse_resume(long_record)
+    
+    with pytest.raises(RenderLimitError, match="2-page limit"):
+        render_document(resume, TEMPLATE, "pdf", limits=DEFAULT_LIMITS._replace(max_pages=2))
+    assert render_document(resume, TEMPLATE, "pdf", limits=DEFAULT_LIMITS).startswith(b"%PDF")
+
+@pytest.mark.parametrize("file_format", ["docx", "pdf"])
+def test_time_budget_and_cancellation_stop_renders(resume_record, file_format):
+    resume = parse_resume(resume_record)
+    cancelled = threading.Event()
+    cancelled.set()
+    
+    with pytest.raises(RenderTimeout):
+        render_document(resume, TEMPLATE, file_format, limits=EXPIRED)
+    with pytest.raises(RenderCancelled):
+        render_document(resume, TEMPLATE, file_format, cancel_event=cancelled)
+
+def test_fanout_applies_limits(resume_record):
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(RenderLimitError):
+            next(render_all(resume_record, executor, limits=RenderLimits(max_field_chars=10)))
+        with pytest.raises(RenderTimeout):
+            list(render_all(resume_record, executor, [TEMPLATE], limits=EXPIRED))
+
+def test_cover_letters_apply_limits(resume_record):
+    posting = parse_posting({"company": "Acme", "role": "Engineer", "paragraphs": "x" * 500})
+    
+    with pytest.raises(RenderLimitError, match="Paragraphs"):
+        CoverLetterWriter(resume_record, TEMPLATE, limits=DEFAULT_LIMITS._replace(max_field_chars=400)).render(
+            posting, "docx"
+        )
+    with pytest.raises(RenderTimeout):
+        CoverLetterWriter(resume_record, TEMPLATE, limits=EXPIRED).render(posting, "pdf")
+    assert CoverLetterWriter(resume_record, TEMPLATE, limits=DEFAULT_LIMITS).render(posting, "pdf").startswith(b"%PDF")
+
+def test_html_preview_applies_limits(resume_record):
+    with pytest.raises(RenderLimitError):
+        create_template_html(resume_record, TEMPLATE, limits=RenderLimits(max_field_chars=10))
+    with pytest.raises(RenderTimeout):
+        create_template_html(resume_record, TEMPLATE, limits=EXPIRED)
+    assert "Git, Docker" in create_template_html(resume_record, TEMPLATE, limits=DEFAULT_LIMITS)
+
+def test_batch_reports_limit_failures_per_record(resume_record):
+    result = render_record(0, resume_record, [TEMPLATE], ["pdf"], limits=RenderLimits(max_field_chars=10))
+    
+    assert result.error.startswith("RenderLimitError: Name is 12 characters long")
@@ -0,0 +1,67 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from resume_generator.matching import MatchIndex, job_terms, resume_terms
+
+JOB = "Backend engineer: Python, PostgreSQL and Kubernetes. You will build data pipelines in Python."
+
+def resume(resume_record, skills, experience, title="Engineer - Example Corp"):
+    return dict(resume_record, skills=skills, experience=f"{title}\n• {experience}", projects="", achievements="")
+
+@pytest.fixture
+def index(resume_record):
+    index = MatchIndex()
+    index.add_resume("strong", resume(resume_record, "Languages: Python, SQL\nTools: PostgreSQL, Kubernetes",
+                                      "Built data pipelines in Python on Kubernetes"))
+    index.add_resume("partial", resume(resume_record, "Languages: Python", "Wrote internal tools"))
+    index.add_resume("unrelated", resume(resume_record, "Design: Figma, Sketch", "Drew brand illustrations",
+                                         title="Illustrator - Studio Nine"))
+    index.add_job("backend", JOB)
+    return index
+
+def test_resumes_rank_by_keyword_overlap(index):
+    matches = index.rank_resumes("backend")
+    
+    assert [match.resume_id for match in matches] == ["strong", "partial", "unrelated"]
+    assert matches[0].score > matches[1].score > matches[2].score == 0
+    assert "kubernetes" in matches[1].missing
+    assert "python" not in matches[1].missing
+    assert index.top_matches(top=2)["backend"] == matches[:2]
+
+def test_resume_without_overlapping_terms_scores_zero(index):
+    scores = index.scores()
+    
+    assert not np.isnan(scores).any()
+    assert scores[index.resume_ids.index("unrelated"), 0] == 0
+    assert index.rank_jobs("unrelated")[0].score == 0
+
+@pytest.mark.parametrize("description", ["", "   ", "We are looking for a strong candidate to join our team."])
+def test_empty_or_stop_word_job_scores_zero_without_nan(index, description):
+    assert not job_terms(description)
+    index.add_job("empty", description)
+    
+    scores = index.scores()
+    matches = index.rank_resumes("empty")
+    
+    assert not np.isnan(scores).any()
+    assert all(match.score == 0 and match.missing == () for match in matches)
+    assert [match.resume_id for match in index.top_matches()["empty"]] == ["strong", "partial", "unrelated"]
+
+def test_resume_with_no_keyword_sections_scores_zero(resume_record):
+    bare = dict(resume_record, projects="", experience="", achievements="", skills="")
+    index = MatchIndex()
+    index.add_resume("bare", bare)
+    index.add_job("backend", JOB)
+    
+    assert not resume_terms(bare)
+    assert index.scores().tolist() == [[0.0]]
+
+def test_unchanged_documents_are_not_tokenized_again(index, resume_record):
+    before = index.tokenized
+    
+    assert not index.add_job("backend", JOB)
+    assert index.add_resume("partial", resume(resume_record, "Languages: Python, Go", "Wrote internal tools"))
+    
+    assert index.tokenized == before + 1
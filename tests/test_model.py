@@ -0,0 +1,69 @@
+from resume_generator.model import (
+    ENTRY_BULLET, ENTRY_HEADING, ENTRY_ITEM, ENTRY_SKILL, ENTRY_TEXT, ParsedResume, ResumeEntry, as_parsed_resume,
+    parse_resume
+)
+
+def section_titles(resume):
+    return [section.title for section in resume.sections]
+
+def test_full_record_parses_every_section(resume_record):
+    resume = parse_resume(resume_record)
+    
+    assert section_titles(resume) == [
+        "Education", "Projects", "Professional Experience", "Achievements", "Technical Skills"
+    ]
+    assert resume.linkedin_url == "https://linkedin.com/in/ada"
+
+def test_empty_optional_sections_are_dropped_but_experience_is_kept(resume_record):
+    record = dict(resume_record, projects="  \n ", experience="", achievements=None)
+    del record["skills"]
+    
+    resume = parse_resume(record)
+    
+    assert section_titles(resume) == ["Education", "Professional Experience"]
+    assert resume.sections[1].entries == ()
+
+def test_missing_profile_links_become_empty_urls(resume_record):
+    record = dict(resume_record, github="   ")
+    del record["linkedin"]
+    
+    resume = parse_resume(record)
+    
+    assert resume.linkedin_url == ""
+    assert resume.github_url == ""
+
+def test_bare_profile_links_get_a_scheme(resume_record):
+    resume = parse_resume(dict(resume_record, github="github.com/ada"))
+    
+    assert resume.github_url == "https://github.com/ada"
+
+def test_entry_kinds_and_blank_lines(resume_record):
+    record = dict(
+        resume_record,
+        education="Imperial College\n\n  Mathematics  \n",
+        experience="Analyst\n- Built models\n\n•   Wrote notes",
+        achievements="Prize\n\n",
+        skills="Languages: Python: 3\nTeamwork"
+    )
+    
+    sections = {section.title: section.entries for section in parse_resume(record).sections}
+    
+    assert sections["Education"] == (
+        ResumeEntry(ENTRY_HEADING, "Imperial College"), ResumeEntry(ENTRY_TEXT, "Mathematics")
+    )
+    assert sections["Professional Experience"] == (
+        ResumeEntry(ENTRY_HEADING, "Analyst"),
+        ResumeEntry(ENTRY_BULLET, "Built models"),
+        ResumeEntry(ENTRY_BULLET, "Wrote notes")
+    )
+    assert sections["Achievements"] == (ResumeEntry(ENTRY_ITEM, "Prize"),)
+    assert sections["Technical Skills"] == (
+        ResumeEntry(ENTRY_SKILL, "Python: 3", "Languages"), ResumeEntry(ENTRY_TEXT, "Teamwork")
+    )
+
+def test_as_parsed_resume_passes_parsed_resumes_through(resume_record):
+    resume = parse_resume(resume_record)
+    
+    assert as_parsed_resume(resume) is resume
+    assert isinstance(as_parsed_resume(resume_record), ParsedResume)
+    assert as_parsed_resume(resume_record) == resume
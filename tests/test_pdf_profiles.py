@@ -0,0 +1,18 @@
+import pytest
+
+from resume_generator.model import parse_resume
+from resume_generator.rendering import render_document
+from resume_generator.templates import RESUME_TEMPLATES
+
+@pytest.mark.parametrize("template_name", list(RESUME_TEMPLATES))
+def test_compact_profile_is_much_smaller(resume_record, template_name):
+    resume = parse_resume(resume_record)
+    
+    default = render_document(resume, template_name, "pdf", pdf_profile="default", deterministic=True)
+    compact = render_document(resume, template_name, "pdf", pdf_profile="compact", deterministic=True)
+    if b"/FontFile2" not in default:
+        pytest.skip("no TrueType font installed for this template")
+    
+    assert compact.startswith(b"%PDF")
+    assert b"/FontFile2" not in compact
+    assert len(compact) < len(default) / 2
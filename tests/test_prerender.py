@@ -0,0 +1,49 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from resume_generator.cache import RenderCache, resume_cache_key
+from resume_generator.model import parse_resume
+from resume_generator.prerender import SpeculativeRenderer
+
+class SlowPutCache(RenderCache):
+    """RenderCache whose puts wait until released, like a put that sweeps a large store"""
+    
+    def __init__(self):
+        super().__init__()
+        self.putting = threading.Event()
+        self.release = threading.Event()
+    
+    def put(self, key, value):
+        self.putting.set()
+        self.release.wait(10)
+        super().put(key, value)
+
+def test_speculative_renders_land_in_the_cache(resume_record):
+    resume = parse_resume(resume_record)
+    cache = RenderCache()
+    with ThreadPoolExecutor(2) as executor:
+        renderer = SpeculativeRenderer(executor, cache)
+        renderer.schedule(resume, ["Classic Professional", "Modern Blue"], ["pdf"])
+        key = resume_cache_key(resume, "Modern Blue", "pdf")
+        document = renderer.wait_for(key)
+    
+    assert document.startswith(b"%PDF")
+    assert cache.get(key) == document
+
+def test_slow_cache_put_does_not_block_cancel(resume_record):
+    resume = parse_resume(resume_record)
+    cache = SlowPutCache()
+    with ThreadPoolExecutor(1) as executor:
+        renderer = SpeculativeRenderer(executor, cache)
+        renderer.schedule(resume, ["Classic Professional"], ["pdf"])
+        assert cache.putting.wait(10)
+        
+        started = time.perf_counter()
+        renderer.cancel()
+        renderer.schedule(resume, ["Modern Blue"], ["docx"])
+        elapsed = time.perf_counter() - started
+        cache.release.set()
+    
+    assert elapsed < 1
+    assert resume_cache_key(resume, "Classic Professional", "pdf") in cache
@@ -0,0 +1,113 @@
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+import pytest
+
+from resume_generator.cache import RenderCache
+from resume_generator.service import HTTPError, RenderService
+
+def make_service(executor, **options):
+    return RenderService(executor, workers=1, cache=RenderCache(), **options)
+
+def render_body(record, **options):
+    return json.dumps({"resume": record, "template": "Classic Professional", "format": "pdf", **options}).encode()
+
+def test_numeric_fields_are_taken_as_text(resume_record):
+    service = make_service(None)
+    
+    resume, template_name, file_format = service.parse_request(render_body(dict(resume_record, phone=5550100)))
+    
+    assert resume.phone == "5550100"
+    assert (template_name, file_format) == ("Classic Professional", "pdf")
+
+@pytest.mark.parametrize("value", [["a"], {"a": 1}, True])
+def test_non_text_fields_are_bad_requests(resume_record, value):
+    with pytest.raises(HTTPError) as caught:
+        make_service(None).parse_request(render_body(dict(resume_record, phone=value)))
+    
+    assert caught.value.status == 400
+    assert "phone" in str(caught.value)
+
+def test_missing_fields_are_bad_requests(resume_record):
+    with pytest.raises(HTTPError) as caught:
+        make_service(None).parse_request(render_body(dict(resume_record, email=None, location="  ")))
+    
+    assert caught.value.status == 400
+    assert str(caught.value) == "Missing required fields: email, location"
+
+def test_oversized_resumes_are_rejected(resume_record):
+    with pytest.raises(HTTPError) as caught:
+        make_service(None).parse_request(render_body(dict(resume_record, skills="x" * 100_000)))
+    
+    assert caught.value.status == 413
+
+def test_render_then_cache_hit(resume_record):
+    async def run():
+        with ThreadPoolExecutor(1) as executor:
+            service = make_service(executor)
+            resume, template_name, file_format = service.parse_request(render_body(resume_record))
+            first = await service.render(resume, template_name, file_format)
+            second = await service.render(resume, template_name, file_format)
+            status, _, metrics = await service.dispatch("GET", "/metrics", {}, b"")
+            return service, first, second, status, metrics.decode()
+    
+    service, (document, hit), (cached, cached_hit), status, metrics = asyncio.run(run())
+    
+    assert document.startswith(b"%PDF") and not hit
+    assert cached == document and cached_hit
+    assert status == 200 and "resume_service_cache_hits 1" in metrics
+    assert service.running == 0
+
+def test_failed_submit_releases_the_worker_slot(resume_record):
+    executor = ThreadPoolExecutor(1)
+    executor.shutdown()
+    
+    async def run():
+        service = make_service(executor)
+        resume, template_name, file_format = service.parse_request(render_body(resume_record))
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await service.render(resume, template_name, file_format)
+        return service
+    
+    service = asyncio.run(run())
+    
+    assert (service.running, service.admitted) == (0, 0)
+    assert not service._slots.locked()
+
+def test_dead_worker_gets_503_and_the_pool_is_replaced(resume_record):
+    executor_factory = partial(ProcessPoolExecutor, max_workers=1)
+    
+    async def run():
+        service = make_service(executor_factory(), executor_factory=executor_factory)
+        try:
+            resume, template_name, file_format = service.parse_request(render_body(resume_record))
+            await service.render(resume, template_name, file_format)
+            for process in list(service.executor._processes.values()):
+                process.kill()
+                process.join()
+            
+            other = service.parse_request(render_body(dict(resume_record, name="Grace Hopper")))
+            with pytest.raises(HTTPError) as caught:
+                await service.render(*other)
+            degraded = service.health()["status"]
+            for _ in range(200):
+                if not service.degraded:
+                    break
+                await asyncio.sleep(0.05)
+            document, hit = await service.render(*other)
+            return service, caught.value, degraded, document, hit
+        finally:
+            service.executor.shutdown()
+    
+    service, error, degraded, document, hit = asyncio.run(run())
+    
+    assert error.status == 503
+    assert ("Retry-After", "1") in error.headers
+    assert degraded == "degraded"
+    assert service.health()["status"] == "ok"
+    assert service.pool_restarts == 1
+    assert document.startswith(b"%PDF") and not hit
+    assert (service.running, service.admitted) == (0, 0)
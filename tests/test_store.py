@@ -0,0 +1,83 @@
+import os
+import time
+
+import pytest
+
+from resume_generator.store import STALE_TEMP_AGE, ArtifactStore, DiskArtifactStore
+
+KEY_A, KEY_B, KEY_C = "aa" + "1" * 62, "bb" + "2" * 62, "cc" + "3" * 62
+
+def age(path, seconds):
+    """Move a file's last use seconds into the past"""
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+def stale_temp(store, seconds):
+    path = os.path.join(store.directory, ".tmp-crashed")
+    with open(path, "wb") as temp_file:
+        temp_file.write(b"partial")
+    age(path, seconds)
+    return path
+
+def test_artifact_store_is_abstract():
+    with pytest.raises(TypeError):
+        ArtifactStore()
+
+def test_put_get_round_trip(tmp_path):
+    store = DiskArtifactStore(tmp_path)
+    
+    store.put(KEY_A, b"document")
+    
+    assert store.get(KEY_A) == b"document"
+    assert store.get(KEY_B) is None
+    assert KEY_A in store
+
+def test_first_put_does_not_sweep(tmp_path):
+    store = DiskArtifactStore(tmp_path)
+    temp_path = stale_temp(store, STALE_TEMP_AGE + 60)
+    
+    store.put(KEY_A, b"document")
+    
+    assert os.path.exists(temp_path)
+
+def test_sweep_removes_expired_entries_and_stale_temps(tmp_path):
+    store = DiskArtifactStore(tmp_path, ttl=60)
+    store.put(KEY_A, b"old")
+    store.put(KEY_B, b"new")
+    age(store.path(KEY_A), 120)
+    stale = stale_temp(store, STALE_TEMP_AGE + 60)
+    fresh = os.path.join(store.directory, ".tmp-writing")
+    open(fresh, "wb").close()
+    
+    assert store.sweep() == 1
+    
+    assert store.get(KEY_A) is None
+    assert store.get(KEY_B) == b"new"
+    assert not os.path.exists(stale)
+    assert os.path.exists(fresh)
+
+def test_sweep_evicts_least_recently_used_over_max_bytes(tmp_path):
+    store = DiskArtifactStore(tmp_path)
+    for seconds, key in ((30, KEY_A), (20, KEY_B), (10, KEY_C)):
+        store.put(key, b"x" * 100)
+        age(store.path(key), seconds)
+    store.max_bytes = 250
+    
+    assert store.sweep() == 1
+    
+    assert store.get(KEY_A) is None
+    assert store.get(KEY_B) is not None and store.get(KEY_C) is not None
+    assert store.stats()["evictions"] == 1
+
+def test_stats_keep_running_totals(tmp_path, monkeypatch):
+    store = DiskArtifactStore(tmp_path)
+    store.put(KEY_A, b"x" * 10)
+    assert store.stats()["bytes"] == 10
+    
+    # Once counted, the totals follow this process's writes without walking the directory
+    monkeypatch.setattr(os, "walk", None)
+    store.put(KEY_B, b"x" * 20)
+    store.put(KEY_A, b"x" * 5)
+    stats = store.stats()
+    
+    assert (stats["entries"], stats["bytes"], stats["writes"]) == (2, 25, 3)
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+import pytest
+
+from resume_generator.suggestions import LocalSuggestionBackend, SuggestionBackend, SuggestionEngine
+
+TEMPLATE = "Classic Professional"
+
+def test_suggestion_backend_is_abstract():
+    with pytest.raises(TypeError):
+        SuggestionBackend()
+
+class GatedBackend(SuggestionBackend):
+    """Upper-cases bullets once its gate opens, recording every batch it was sent"""
+    
+    name = "gated"
+    batch_size = 2
+    
+    def __init__(self, error=None):
+        self.gate = threading.Event()
+        self.batches = []
+        self.error = error
+    
+    def suggest_batch(self, bullets, template_name):
+        self.batches.append(list(bullets))
+        assert self.gate.wait(10)
+        if self.error is not None:
+            raise self.error
+        return [bullet.upper() for bullet in bullets]
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(4) as executor:
+        yield executor
+
+def test_cached_suggestions_are_not_requested_again(executor):
+    engine = SuggestionEngine(LocalSuggestionBackend(), executor)
+    first = dict(engine.stream(["worked on the api", "made 3 tools"], TEMPLATE))
+    
+    second = dict(engine.stream(["made 3 tools", "worked on the api", "did reviews"], TEMPLATE))
+    
+    assert {bullet: second[bullet] for bullet in first} == first
+    assert second["did reviews"].startswith("Delivered reviews")
+    assert engine.stats()["hits"] == 2
+    assert engine.stats()["misses"] == 3
+    assert engine.stats()["batches"] == 2
+
+def test_cache_is_keyed_by_template(executor):
+    backend = GatedBackend()
+    backend.gate.set()
+    engine = SuggestionEngine(backend, executor)
+    
+    list(engine.stream(["a"], TEMPLATE))
+    list(engine.stream(["a"], "Modern Blue"))
+    
+    assert backend.batches == [["a"], ["a"]]
+
+def test_bullets_in_flight_are_shared(executor):
+    backend = GatedBackend()
+    engine = SuggestionEngine(backend, executor)
+    
+    first = engine.request(["a"], TEMPLATE)
+    second = engine.request(["a", "b"], TEMPLATE)
+    backend.gate.set()
+    
+    assert second["a"] is first["a"]
+    assert second["a"].result(5) == "A" and second["b"].result(5) == "B"
+    assert sorted(backend.batches) == [["a"], ["b"]]
+    assert engine.stats()["in_flight"] == 0
+
+def test_stream_yields_cached_first_then_batches_as_they_finish(executor):
+    backend = GatedBackend()
+    engine = SuggestionEngine(backend, executor)
+    backend.gate.set()
+    list(engine.stream(["c"], TEMPLATE))
+    backend.gate.clear()
+    
+    stream = engine.stream(["a", "b", "c", "d", "e"], TEMPLATE)
+    
+    assert next(stream) == ("c", "C")
+    backend.gate.set()
+    assert sorted(stream) == [("a", "A"), ("b", "B"), ("d", "D"), ("e", "E")]
+    assert sorted(backend.batches[1:]) == [["a", "b"], ["d", "e"]]
+
+def test_stream_timeout_leaves_work_running(executor):
+    backend = GatedBackend()
+    engine = SuggestionEngine(backend, executor)
+    
+    with pytest.raises(FutureTimeoutError):
+        list(engine.stream(["a"], TEMPLATE, timeout=0.05))
+    backend.gate.set()
+    
+    assert engine.request(["a"], TEMPLATE)["a"].result(5) == "A"
+    assert backend.batches == [["a"]]
+
+@pytest.mark.parametrize("error", [RuntimeError("backend down"), None])
+def test_failed_batches_are_reported_and_retried(executor, monkeypatch, error):
+    backend = GatedBackend(error=error)
+    if error is None:
+        monkeypatch.setattr(backend, "suggest_batch", lambda bullets, template_name: ["only one"])
+    backend.gate.set()
+    engine = SuggestionEngine(backend, executor)
+    
+    results = dict(engine.stream(["a", "b"], TEMPLATE))
+    
+    assert all(isinstance(result, RuntimeError if error else ValueError) for result in results.values())
+    assert engine.stats()["cached"] == engine.stats()["in_flight"] == 0
+    backend.error = None
+    monkeypatch.undo()
+    assert dict(engine.stream(["a", "b"], TEMPLATE)) == {"a": "A", "b": "B"}
+
+def test_stream_async(executor):
+    engine = SuggestionEngine(LocalSuggestionBackend(), executor)
+    
+    async def collect():
+        return [item async for item in engine.stream_async(["worked on the api", "made 3 tools"], TEMPLATE)]
+    
+    assert sorted(asyncio.run(collect())) == sorted(engine.stream(["worked on the api", "made 3 tools"], TEMPLATE))
+
+def test_local_backend_rewrites_weak_openers():
+    backend = LocalSuggestionBackend()
+    
+    assert backend.suggest_batch(["helped with 3 launches", "Led 2 teams."], TEMPLATE) == [
+        "Supported 3 launches", "Led 2 teams"
+    ]